@@ -0,0 +1,74 @@
+""" Throughput of concurrent API requests with ``AsyncGameJoltAPI`` compared to the blocking client.
+
+Run from the repository root:
+
+    python benchmarks/bench_async.py [calls] [concurrency]
+
+The stand-in server delays every response by ``LATENCY`` seconds to simulate
+the network round trip to ``api.gamejolt.com``.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+import standin
+
+LATENCY = 0.02
+
+
+class SlowHandler(standin.StandInHandler):
+    def do_GET(self):
+        time.sleep(LATENCY)
+        super().do_GET()
+
+
+async def runAsync(apiUrl, calls, concurrency):
+    pool = gamejoltapi.GameJoltAsyncConnectionPool(maxSize=concurrency, maxConcurrency=concurrency)
+    api = gamejoltapi.AsyncGameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*[api.time() for _ in range(calls)])
+    elapsed = time.perf_counter() - start
+    
+    await api.close()
+    return elapsed
+
+
+def runBlocking(apiUrl, calls):
+    pool = gamejoltapi.GameJoltConnectionPool()
+    api = gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool)
+    
+    start = time.perf_counter()
+    
+    for _ in range(calls):
+        api.time()
+    
+    elapsed = time.perf_counter() - start
+    pool.close()
+    return elapsed
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    server, apiUrl = standin.startServer(SlowHandler)
+    
+    print("Stand-in server:", apiUrl)
+    print("%-32s %12s %12s" % ("client", "total (s)", "calls/s"))
+    
+    for name, elapsed in [
+        ("GameJoltAPI (sequential)", runBlocking(apiUrl, calls)),
+        ("AsyncGameJoltAPI (%d in flight)" % concurrency, asyncio.run(runAsync(apiUrl, calls, concurrency))),
+    ]:
+        print("%-32s %12.3f %12.0f" % (name, elapsed, calls / elapsed))
+    
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+""" Score submission spike sent as individual calls compared to calls coalesced by ``GameJoltBatchDispatcher``.
+
+Run from the repository root:
+
+    python benchmarks/bench_batch.py [calls] [threads] [latency]
+
+The stand-in server delays every response by ``latency`` seconds to simulate
+the network round trip to ``api.gamejolt.com``. Individual calls block one of
+the ``threads``, while the dispatcher calls are queued from the same threads and
+their futures awaited at the end, with one or more batch requests in flight.
+"""
+
+import os
+import sys
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+import standin
+
+
+def spike(server, function, calls, threads):
+    server.requests = 0
+    start = time.perf_counter()
+    
+    with ThreadPoolExecutor(threads) as executor:
+        results = list(executor.map(function, range(calls)))
+    
+    for result in results:
+        if isinstance(result, Future):
+            result = result.result()
+        
+        assert result["success"] == "true", result
+    
+    return time.perf_counter() - start, server.requests
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.02
+    server, apiUrl = standin.startServer(standin.faultInjectingHandler(latency=latency))
+    
+    pool = gamejoltapi.GameJoltConnectionPool(maxSize=threads)
+    api = gamejoltapi.GameJoltAPI("1", "key", username="player", userToken="token", apiUrl=apiUrl, connectionPool=pool)
+    
+    print("Stand-in server:", apiUrl, "(%.0f ms latency)" % (latency * 1000))
+    print("%-44s %12s %12s %14s" % ("client", "total (s)", "calls/s", "HTTP requests"))
+    
+    elapsed, requests = spike(server, lambda i: api.scoresAdd("%d Points" % i, i), calls, threads)
+    print("%-44s %12.3f %12.0f %14d" % ("individual scoresAdd", elapsed, calls / elapsed, requests))
+    
+    for maxInFlight in (1, 4):
+        dispatcher = gamejoltapi.GameJoltBatchDispatcher(api, maxInFlight=maxInFlight)
+        elapsed, requests = spike(server, lambda i: dispatcher.scoresAdd("%d Points" % i, i), calls, threads)
+        dispatcher.close()
+        print("%-44s %12.3f %12.0f %14d" % ("GameJoltBatchDispatcher(maxInFlight=%d)" % maxInFlight, elapsed, calls / elapsed, requests))
+    
+    pool.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+""" Latency of journaling writes in ``GameJoltOutbox`` on the game thread, and the time
+to drain a burst of writes to a stand-in server failing a share of the batch requests.
+
+Run from the repository root:
+
+    python benchmarks/bench_outbox.py [writes] [errorRate]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+import standin
+
+
+def main():
+    writes = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    errorRate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    server, apiUrl = standin.startServer(standin.faultInjectingHandler(errorRate=errorRate))
+    api = gamejoltapi.GameJoltAPI("1", "key", "player", "token", apiUrl=apiUrl)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "outbox.log")
+        outbox = gamejoltapi.GameJoltOutbox(api, path, flushInterval=0.05, maxBackoff=0.2, flushOnExit=False)
+        latencies = []
+        
+        start = time.perf_counter()
+        
+        for i in range(writes):
+            before = time.perf_counter()
+            outbox.scoresAdd("%d Points" % i, i)
+            latencies.append(time.perf_counter() - before)
+        
+        journaled = time.perf_counter() - start
+        
+        while outbox.pendingWrites():
+            time.sleep(0.01)
+        
+        drained = time.perf_counter() - start
+        outbox.close()
+        latencies.sort()
+        
+        print("Stand-in server:", apiUrl, "(%d%% of the batch requests fail)" % (errorRate * 100))
+        print("%-32s %12.0f" % ("journaled writes/s", writes / journaled))
+        print("%-32s %12.1f" % ("write p50 (us)", latencies[len(latencies) // 2] * 1000000))
+        print("%-32s %12.1f" % ("write p99 (us)", latencies[int(len(latencies) * 0.99)] * 1000000))
+        print("%-32s %12.3f" % ("all writes processed (s)", drained))
+        print("%-32s %12d" % ("writes sent", outbox.sentWrites))
+        print("%-32s %12d" % ("writes maybe lost", outbox.uncertainWrites))
+    
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
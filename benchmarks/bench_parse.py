@@ -0,0 +1,80 @@
+""" Response parsing time of large JSON payloads with the available decoders.
+
+Run from the repository root:
+
+    python benchmarks/bench_parse.py [repeat]
+"""
+
+import ast
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+
+
+def scoresFetchPayload(count=100):
+    scores = []
+    
+    for i in range(count):
+        scores.append({
+            "score" : "%d Points" % (100000 - i),
+            "sort" : str(100000 - i),
+            "extra_data" : "level=%d;coins=%d;time=%d" % (i % 30, i * 7, i * 13),
+            "user" : "player%d" % i,
+            "user_id" : str(1000 + i),
+            "guest" : "",
+            "stored" : "%d days ago" % (i % 9 + 1),
+            "stored_timestamp" : 1700000000 + i,
+        })
+    
+    return json.dumps({"response" : {"success" : "true", "scores" : scores}}).encode()
+
+
+def batchPayload(count=50):
+    responses = []
+    
+    for i in range(count):
+        responses.append({
+            "success" : "true",
+            "users" : [{
+                "id" : str(1000 + i),
+                "type" : "User",
+                "username" : "player%d" % i,
+                "avatar_url" : "https://m.gjcdn.net/user-avatar/60/%d-crop0_0_1000_1000-v1.png" % i,
+                "signed_up" : "%d years ago" % (i % 5 + 1),
+                "signed_up_timestamp" : 1500000000 + i,
+                "last_logged_in" : "Online Now",
+                "last_logged_in_timestamp" : 1700000000 + i,
+                "status" : "Active",
+                "developer_name" : "player%d" % i,
+                "developer_website" : "",
+                "developer_description" : "",
+            }],
+        })
+    
+    return json.dumps({"response" : {"success" : "true", "responses" : responses}}).encode()
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    payloads = [("scoresFetch (100 scores)", scoresFetchPayload()), ("batch (50 responses)", batchPayload())]
+    decoders = [
+        ("ast.literal_eval", lambda payload: ast.literal_eval(payload.decode())["response"]),
+        ("json.loads", lambda payload: json.loads(payload)["response"]),
+        ("%s.loads (active)" % gamejoltapi._jsonLoads.__module__, lambda payload: gamejoltapi._jsonLoads(payload)["response"]),
+    ]
+    
+    print("%-26s %-24s %12s" % ("payload", "decoder", "per call (us)"))
+    
+    for payloadName, payload in payloads:
+        for decoderName, decoder in decoders:
+            elapsed = min(timeit.repeat(lambda: decoder(payload), number=repeat, repeat=5))
+            print("%-26s %-24s %12.1f" % (payloadName, decoderName, elapsed / repeat * 1000000))
+
+
+if __name__ == "__main__":
+    main()
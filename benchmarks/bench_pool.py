@@ -0,0 +1,56 @@
+""" Per-call latency of API requests with and without the persistent connection pool.
+
+Run from the repository root:
+
+    python benchmarks/bench_pool.py [calls]
+"""
+
+import os
+import sys
+import time
+
+from urllib.request import urlopen
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+import standin
+
+
+def measure(function, calls):
+    timings = []
+    
+    for _ in range(calls):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.99) - 1]
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    server, apiUrl = standin.startServer()
+    
+    pool = gamejoltapi.GameJoltConnectionPool()
+    api = gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool)
+    urlGenerator = gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, submitRequests=False)
+    url = urlGenerator.time()
+    
+    print("Stand-in server:", apiUrl)
+    print("%-24s %12s %12s" % ("transport", "p50 (ms)", "p99 (ms)"))
+    
+    for name, function in [
+        ("urlopen (no pool)", lambda: urlopen(url).read()),
+        ("GameJoltConnectionPool", api.time),
+    ]:
+        p50, p99 = measure(function, calls)
+        print("%-24s %12.3f %12.3f" % (name, p50 * 1000, p99 * 1000))
+    
+    pool.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
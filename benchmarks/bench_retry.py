@@ -0,0 +1,74 @@
+""" Success rate and latency of API requests against a faulty stand-in server, with and 
+without ``GameJoltRetryPolicy``, and how fast ``GameJoltCircuitBreaker`` rejects requests 
+once the server is down.
+
+Run from the repository root:
+
+    python benchmarks/bench_retry.py [calls] [errorRate] [dropRate]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+import standin
+
+
+def run(function, calls):
+    timings = []
+    failures = 0
+    
+    for _ in range(calls):
+        start = time.perf_counter()
+        
+        try:
+            function()
+        except Exception:
+            failures += 1
+        
+        timings.append(time.perf_counter() - start)
+    
+    timings.sort()
+    return failures, timings[len(timings) // 2], timings[int(len(timings) * 0.99) - 1]
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    errorRate = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    dropRate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.05
+    server, apiUrl = standin.startServer(standin.faultInjectingHandler(errorRate=errorRate, dropRate=dropRate))
+    pool = gamejoltapi.GameJoltConnectionPool(connectTimeout=1, readTimeout=2)
+    
+    print("Stand-in server:", apiUrl, "(%.0f%% errors, %.0f%% dropped connections)" % (errorRate * 100, dropRate * 100))
+    print("%-34s %10s %12s %12s" % ("client", "failed", "p50 (ms)", "p99 (ms)"))
+    
+    for name, retryPolicy in [
+        ("no retries", None),
+        ("GameJoltRetryPolicy(maxRetries=3)", gamejoltapi.GameJoltRetryPolicy(maxRetries=3, backoff=0.01)),
+    ]:
+        api = gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool, retryPolicy=retryPolicy)
+        failures, p50, p99 = run(api.time, calls)
+        print("%-34s %10d %12.3f %12.3f" % (name, failures, p50 * 1000, p99 * 1000))
+    
+    server.shutdown()
+    server.server_close()
+    pool.close()
+    
+    # The server is gone now, every connection attempt fails
+    for name, circuitBreaker in [
+        ("server down, no circuit breaker", None),
+        ("server down, GameJoltCircuitBreaker", gamejoltapi.GameJoltCircuitBreaker(failureThreshold=5)),
+    ]:
+        retryPolicy = gamejoltapi.GameJoltRetryPolicy(maxRetries=2, backoff=0.05)
+        api = gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool, retryPolicy=retryPolicy, circuitBreaker=circuitBreaker)
+        failures, p50, p99 = run(api.time, 50)
+        print("%-34s %10d %12.3f %12.3f" % (name, failures, p50 * 1000, p99 * 1000))
+    
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+""" Memory held by cached scoresFetch and usersFetch responses as parsed dicts compared
+to the typed containers returned with ``typed=True``, and the time to read a column.
+
+Run from the repository root:
+
+    python benchmarks/bench_typed.py [tables] [users]
+"""
+
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+
+from bench_parse import scoresFetchPayload
+
+
+def usersFetchPayload(count):
+    users = []
+    
+    for i in range(count):
+        users.append({
+            "id" : str(1000 + i),
+            "type" : "User",
+            "username" : "player%d" % i,
+            "avatar_url" : "https://m.gjcdn.net/user-avatar/60/%d-crop0_0_1000_1000-v1.png" % i,
+            "signed_up" : "%d years ago" % (i % 5 + 1),
+            "signed_up_timestamp" : 1500000000 + i,
+            "last_logged_in" : "Online Now",
+            "last_logged_in_timestamp" : 1700000000 + i,
+            "status" : "Active",
+            "developer_name" : "player%d" % i,
+            "developer_website" : "",
+            "developer_description" : "",
+        })
+    
+    return json.dumps({"response" : {"success" : "true", "users" : users}}).encode()
+
+
+def retained(payloads, convert):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [convert(gamejoltapi._jsonLoads(payload)["response"]) for payload in payloads]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held, after - before
+
+
+def main():
+    tables = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    workloads = [
+        ("%d tables of 100 scores" % tables, [scoresFetchPayload() for _ in range(tables)], gamejoltapi.GameJoltScores,
+         lambda response: sum([int(score["sort"]) for score in response["scores"]]), lambda scores: sum(scores.column("sort"))),
+        ("%d users" % users, [usersFetchPayload(users)], gamejoltapi.GameJoltUsers,
+         lambda response: max([int(user["last_logged_in_timestamp"]) for user in response["users"]]), lambda users: max(users.column("lastLoggedInTimestamp"))),
+    ]
+    
+    print("%-26s %-8s %14s %18s" % ("responses", "format", "memory (KiB)", "column read (us)"))
+    
+    for name, payloads, typedClass, readDict, readTyped in workloads:
+        for formatName, convert, read in [("dict", lambda response: response, readDict), ("typed", typedClass, readTyped)]:
+            held, size = retained(payloads, convert)
+            read(held[0])
+            elapsed = min(timeit.repeat(lambda: read(held[0]), number=100, repeat=5)) / 100
+            print("%-26s %-8s %14.0f %18.1f" % (name, formatName, size / 1024, elapsed * 1000000))
+
+
+if __name__ == "__main__":
+    main()
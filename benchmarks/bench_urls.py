@@ -0,0 +1,72 @@
+""" URL generation speed of the API methods with ``submitRequests=False``, with the
+precompiled signature prefixes and parameter encodings compared to the previous
+implementation encoding and hashing the whole URL on every call.
+
+Run from the repository root:
+
+    python benchmarks/bench_urls.py [calls]
+"""
+
+import os
+import sys
+import timeit
+
+from collections import OrderedDict
+from hashlib import md5
+from urllib.parse import urlencode
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+
+
+class LegacyGameJoltAPI(gamejoltapi.GameJoltAPI):
+    """ The request building before the precompiled templates. """
+    
+    def _buildRequestUrl(self, operationUrl, data):
+        orderedData = OrderedDict()
+        isBatch = "batch" in operationUrl
+        
+        if not self.submitRequests and "format" in data.keys():
+            data.pop("format")
+        
+        for key in sorted(data.keys()):
+            orderedData[key] = data[key]
+        data = orderedData
+        
+        requestUrls = data.pop("requests") if isBatch else []
+        requestAsParams = "&".join(["requests[]=" + url for url in requestUrls]) if isBatch else ""
+        
+        urlParams = urlencode(data)
+        urlParams += "&" + requestAsParams if isBatch else ""
+        urlToSignature = operationUrl + urlParams + self.privateKey
+        signature = md5(urlToSignature.encode()).hexdigest()
+        return operationUrl + urlParams + "&signature=" + signature
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    privateKey = "0123456789abcdef0123456789abcdef"
+    clients = [
+        ("before", LegacyGameJoltAPI("123456", privateKey, "player", "token123", submitRequests=False)),
+        ("after", gamejoltapi.GameJoltAPI("123456", privateKey, "player", "token123", submitRequests=False)),
+    ]
+    methods = [
+        ("sessionsPing", lambda api: api.sessionsPing()),
+        ("scoresAdd", lambda api: api.scoresAdd("1000 Points", 1000, extraData="level=3")),
+        ("trophiesAddAchieved", lambda api: api.trophiesAddAchieved(1234)),
+        ("dataStoreUpdate", lambda api: api.dataStoreUpdate("counter", "add", 1)),
+    ]
+    
+    print("%-22s %-8s %12s" % ("method", "version", "calls/s"))
+    
+    for methodName, method in methods:
+        assert method(clients[0][1]) == method(clients[1][1])
+        
+        for clientName, api in clients:
+            elapsed = min(timeit.repeat(lambda: method(api), number=calls, repeat=5))
+            print("%-22s %-8s %12.0f" % (methodName, clientName, calls / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+""" Memory used per player by one ``GameJoltAPI`` per player compared to the
+handles returned by ``GameJoltAPI.forUser``.
+
+Run from the repository root:
+
+    python benchmarks/bench_users.py [players]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+
+
+def measure(create, players):
+    credentials = [("player%d" % i, "token%d" % i) for i in range(players)]
+    
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    clients = [create(username, userToken) for username, userToken in credentials]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    del clients
+    return (after - before) / players
+
+
+def main():
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    pool = gamejoltapi.GameJoltConnectionPool()
+    client = gamejoltapi.GameJoltAPI("1", "key", connectionPool=pool)
+    
+    print("%-32s %16s" % ("client", "bytes per player"))
+    
+    for name, create in [
+        ("GameJoltAPI per player", lambda username, userToken: gamejoltapi.GameJoltAPI("1", "key", username, userToken, connectionPool=pool)),
+        ("GameJoltAPI.forUser", client.forUser),
+    ]:
+        print("%-32s %16.0f" % (name, measure(create, players)))
+
+
+if __name__ == "__main__":
+    main()
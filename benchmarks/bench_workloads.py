@@ -0,0 +1,98 @@
+""" Calls per second and latency percentiles of representative game server workloads,
+run against ``standin.GameHandler``, which implements the Game Jolt API endpoints.
+
+Run from the repository root:
+
+    python benchmarks/bench_workloads.py [calls] [threads] [latency]
+
+``latency`` is the delay in seconds the stand-in server adds to every response to
+simulate the network round trip, ``0.01`` by default.
+"""
+
+import os
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+import standin
+
+PLAYERS = 100
+
+
+def run(function, calls, threads):
+    latencies = [0.0] * calls
+    
+    def call(i):
+        start = time.perf_counter()
+        function(i)
+        latencies[i] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(call, range(calls)))
+    
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return elapsed, latencies[len(latencies) // 2], latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.01
+    server, apiUrl = standin.startServer(type("GameHandler", (standin.GameHandler,), {"latency" : latency}))
+    
+    pool = gamejoltapi.GameJoltConnectionPool(maxSize=threads)
+    client = gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool)
+    players = [client.forUser("player%d" % i, "token%d" % i) for i in range(PLAYERS)]
+    httpRequests = [0]
+    client.addObserver(lambda event: httpRequests.__setitem__(0, httpRequests[0] + (event.outcome != "cached")))
+    
+    dispatcher = gamejoltapi.GameJoltBatchDispatcher(players[0], maxSize=threads)
+    counters = gamejoltapi.GameJoltDataStoreBuffer(client, flushInterval=0.05, flushOnExit=False)
+    leaderboard = gamejoltapi.GameJoltLeaderboard(client, maxAge=1)
+    
+    client.batchMany([player.build.sessionsOpen() for player in players])
+    client.dataStoreSet("kills", "0", globalData=True)
+    client.dataStoreSet("deaths", "0", globalData=True)
+    
+    workloads = [
+        ("score spike", lambda i: players[i % PLAYERS].scoresAdd("%d Points" % i, i)),
+        ("score spike (dispatcher)", lambda i: dispatcher.scoresAdd("%d Points" % i, i).result()),
+        ("session pings", lambda i: players[i % PLAYERS].sessionsPing("active")),
+        ("data-store counter", lambda i: client.dataStoreUpdate("kills", "add", 1, globalData=True)),
+        ("data-store counter (buffer)", lambda i: counters.dataStoreUpdate("deaths", "add", 1, globalData=True)),
+        ("leaderboard polling", lambda i: client.scoresFetch(limit=100)),
+        ("leaderboard polling (cached)", lambda i: leaderboard.fetch(limit=100)),
+    ]
+    
+    print("Stand-in server:", apiUrl, "(%.0f ms latency, %d threads)" % (latency * 1000, threads))
+    print("%-30s %10s %10s %10s %10s %10s" % ("workload", "total (s)", "calls/s", "p50 (ms)", "p99 (ms)", "HTTP reqs"))
+    
+    for name, function in workloads:
+        httpRequests[0] = 0
+        elapsed, p50, p99 = run(function, calls, threads)
+        
+        if name == "data-store counter (buffer)":
+            counters.flush()
+        
+        print("%-30s %10.3f %10.0f %10.2f %10.2f %10d" % (name, elapsed, calls / elapsed, p50 * 1000, p99 * 1000, httpRequests[0]))
+    
+    # The counters must have the same value however the writes were sent
+    for key in ("kills", "deaths"):
+        assert client.dataStoreFetch(key, globalData=True)["data"] == str(calls), key
+    
+    dispatcher.close()
+    counters.close()
+    leaderboard.close()
+    pool.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
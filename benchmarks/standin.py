@@ -0,0 +1,568 @@
+""" Local stand-in for the Game Jolt API, used by the benchmarks in this directory.
+
+``StandInHandler`` answers every request with a minimal successful JSON response
+and speaks HTTP/1.1 with keep-alive, so connection reuse can be measured without
+hitting ``api.gamejolt.com``. ``GameHandler`` implements the endpoints of
+``GameJoltAPI.operations`` on an in-memory ``StandInGame``, verifying the
+signatures like the real server.
+"""
+
+import fnmatch
+import json
+import os
+import random
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+
+from hashlib import md5
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+API_PATH = "/api/game/v1_2"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    
+    postFields = {}
+    
+    def do_GET(self):
+        self.sendJson({"response" : self.respond()})
+    
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.postFields = parseMultipart(self.headers.get("Content-Type", ""), body)
+        self.do_GET()
+        self.postFields = {}
+    
+    def respond(self):
+        response = {"success" : "true"}
+        
+        if self.path.startswith(API_PATH + "/time/"):
+            response["timestamp"] = int(time.time())
+        
+        elif self.path.startswith(API_PATH + "/batch/"):
+            query = parse_qs(urlsplit(self.path).query)
+            response["responses"] = [{"success" : "true"} for request in query.get("requests[]", [])]
+        
+        return response
+    
+    def sendJson(self, data):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class FaultInjectingHandler(StandInHandler):
+    """Delays every response and fails a share of the requests, configured through class attributes."""
+    
+    latency = 0.0 # Seconds added to every response
+    errorRate = 0.0 # Share of requests answered with errorStatus
+    errorStatus = 503
+    dropRate = 0.0 # Share of requests whose connection is closed without a response
+    failFirst = 0 # Amount of first requests of the server always answered with errorStatus
+    retryAfter = None # Retry-After header of the error responses
+    
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests += 1
+            failing = self.server.requests <= self.failFirst
+        
+        if self.latency:
+            time.sleep(self.latency)
+        
+        roll = random.random()
+        
+        if roll < self.dropRate and not failing:
+            self.close_connection = True
+        
+        elif failing or roll < self.dropRate + self.errorRate:
+            body = b"Injected error"
+            self.send_response(self.errorStatus)
+            self.send_header("Content-Length", str(len(body)))
+            
+            if self.retryAfter is not None:
+                self.send_header("Retry-After", str(self.retryAfter))
+            
+            self.end_headers()
+            self.wfile.write(body)
+        
+        else:
+            super().do_GET()
+
+
+def faultInjectingHandler(**faults):
+    """Returns a ``FaultInjectingHandler`` subclass with the given class attributes."""
+    
+    return type("FaultInjectingHandler", (FaultInjectingHandler,), faults)
+
+
+def parseMultipart(contentType, body):
+    """Returns the fields of a ``multipart/form-data`` body as strings."""
+    
+    if "boundary=" not in contentType:
+        return {}
+    
+    fields = {}
+    boundary = b"--" + contentType.split("boundary=")[1].strip().encode()
+    
+    for part in body.split(boundary)[1:-1]:
+        head, _, value = part[2:].partition(b"\r\n\r\n")
+        name = head.decode("latin-1").split('name="')[1].split('"')[0]
+        fields[name] = value[:-2].decode("utf-8", "replace")
+    
+    return fields
+
+
+class StandInFailure(Exception):
+    """Raised by the endpoints of ``GameHandler`` to answer with ``success`` false."""
+
+
+def formatNumber(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class StandInGame:
+    """In-memory state of a game served by ``GameHandler``.
+    
+    With ``users`` set to ``None`` any username is accepted with any token,
+    otherwise it maps the known usernames to their tokens."""
+    
+    SESSION_TIMEOUT = 120
+    
+    def __init__(self, gameId="1", privateKey="key", users=None, tables=2, trophies=10):
+        self.gameId = str(gameId)
+        self.privateKey = privateKey
+        self.users = dict(users) if users is not None else None
+        self.lock = threading.Lock()
+        self.userIds = {} # username -> id
+        self.sessions = {} # username -> [status, lastPing]
+        self.tables = [{"id" : i, "name" : "Table %d" % i, "description" : "", "primary" : "true" if i == 1 else "false"} for i in range(1, tables + 1)]
+        self.scores = {table["id"] : [] for table in self.tables} # tableId -> [score, ...]
+        self.trophies = [{"id" : i, "title" : "Trophy %d" % i, "description" : "", "difficulty" : "Bronze", "image_url" : ""} for i in range(1, trophies + 1)]
+        self.achieved = {} # username -> {trophyId : timestamp}
+        self.globalData = {}
+        self.userData = {} # username -> {key : value}
+    
+    def userId(self, username):
+        return self.userIds.setdefault(username, len(self.userIds) + 1)
+    
+    def authenticate(self, params):
+        username = params.get("username")
+        
+        if not username or "user_token" not in params:
+            raise StandInFailure("You must enter a username and user token.")
+        
+        if self.users is not None and self.users.get(username) != params["user_token"]:
+            raise StandInFailure("No such user with the credentials passed in could be found.")
+        
+        self.userId(username)
+        return username
+    
+    def table(self, params):
+        tableId = int(params.get("table_id", 1))
+        
+        if tableId not in self.scores:
+            raise StandInFailure("The high score table ID you entered is not valid.")
+        
+        return tableId
+    
+    def dataStore(self, params):
+        if "username" in params or "user_token" in params:
+            return self.userData.setdefault(self.authenticate(params), {})
+        return self.globalData
+    
+    def key(self, params):
+        if not params.get("key"):
+            raise StandInFailure("You must enter the key for the item you would like to retrieve data for.")
+        return params["key"]
+
+
+class GameHandler(FaultInjectingHandler):
+    """Implements the Game Jolt API endpoints on the ``StandInGame`` of the server.
+    
+    Only the ``"json"`` format is answered. Latency and errors can still be
+    injected through the class attributes of ``FaultInjectingHandler``."""
+    
+    ENDPOINTS = {
+        "/users/" : "usersFetch",
+        "/users/auth/" : "usersAuth",
+        "/sessions/open/" : "sessionsOpen",
+        "/sessions/ping/" : "sessionsPing",
+        "/sessions/check/" : "sessionsCheck",
+        "/sessions/close/" : "sessionsClose",
+        "/scores/" : "scoresFetch",
+        "/scores/tables/" : "scoresTables",
+        "/scores/add/" : "scoresAdd",
+        "/scores/get-rank/" : "scoresGetRank",
+        "/trophies/" : "trophiesFetch",
+        "/trophies/add-achieved/" : "trophiesAddAchieved",
+        "/trophies/remove-achieved/" : "trophiesRemoveAchieved",
+        "/data-store/set/" : "dataStoreSet",
+        "/data-store/update/" : "dataStoreUpdate",
+        "/data-store/remove/" : "dataStoreRemove",
+        "/data-store/" : "dataStoreFetch",
+        "/data-store/get-keys/" : "dataStoreGetKeys",
+        "/friends/" : "friends",
+        "/time/" : "time",
+        "/batch/" : "batch",
+    }
+    BATCH_LIMIT = 50
+    
+    def respond(self):
+        url = "%s://%s%s" % (self.server.scheme, self.headers.get("Host", ""), self.path)
+        return self.dispatch(url, API_PATH, self.postFields)
+    
+    def dispatch(self, url, prefix, postFields):
+        game = self.server.game
+        signed, _, signature = url.partition("&signature=")
+        
+        if md5((signed + game.privateKey).encode()).hexdigest() != signature:
+            return {"success" : "false", "message" : "The signature you entered for the request is invalid."}
+        
+        splitUrl = urlsplit(signed)
+        params = {key : values[0] for key, values in parse_qs(splitUrl.query, keep_blank_values=True).items()}
+        params.update(postFields)
+        endpoint = self.ENDPOINTS.get(splitUrl.path[len(prefix):] if splitUrl.path.startswith(prefix) else None)
+        
+        if endpoint is None:
+            return {"success" : "false", "message" : "Unknown endpoint."}
+        
+        if params.get("game_id") != game.gameId:
+            return {"success" : "false", "message" : "The game ID you passed in does not point to a valid game."}
+        
+        try:
+            if endpoint == "batch":
+                response = self.batch(game, parse_qs(splitUrl.query).get("requests[]", []), params)
+            
+            else:
+                with game.lock:
+                    response = getattr(self, endpoint)(game, params)
+        
+        except StandInFailure as failure:
+            return {"success" : "false", "message" : str(failure)}
+        
+        response.setdefault("success", "true")
+        return response
+    
+    def batch(self, game, requests, params):
+        if not requests:
+            raise StandInFailure("You must pass in at least one sub-request.")
+        
+        if len(requests) > self.BATCH_LIMIT:
+            raise StandInFailure("The maximum amount of sub-requests is %d." % self.BATCH_LIMIT)
+        
+        responses = []
+        
+        for request in requests:
+            if urlsplit(request).path == "/batch/":
+                response = {"success" : "false", "message" : "Batch requests cannot be nested."}
+            else:
+                response = self.dispatch(request, "", {})
+            
+            responses.append(response)
+            
+            if params.get("break_on_error") == "true" and response["success"] != "true":
+                return {"success" : "false", "message" : "A sub-request failed.", "responses" : responses}
+        
+        return {"responses" : responses}
+    
+    # Users
+    def usersFetch(self, game, params):
+        if "user_id" in params:
+            ids = {int(userId) for userId in params["user_id"].split(",") if userId.strip().isdigit()}
+            usernames = [username for username, userId in game.userIds.items() if userId in ids]
+        
+        elif "username" in params:
+            usernames = [params["username"]] if game.users is None or params["username"] in game.users else []
+        
+        else:
+            raise StandInFailure("You must enter a username or user ID.")
+        
+        if not usernames:
+            raise StandInFailure("No such user could be found.")
+        
+        return {"users" : [{
+            "id" : str(game.userId(username)),
+            "type" : "User",
+            "username" : username,
+            "avatar_url" : "",
+            "signed_up" : "1 year ago",
+            "signed_up_timestamp" : 1500000000,
+            "last_logged_in" : "Online Now" if username in game.sessions else "1 day ago",
+            "last_logged_in_timestamp" : int(time.time()),
+            "status" : "Active",
+            "developer_name" : username,
+            "developer_website" : "",
+            "developer_description" : "",
+        } for username in usernames]}
+    
+    def usersAuth(self, game, params):
+        game.authenticate(params)
+        return {}
+    
+    # Sessions
+    def sessionsOpen(self, game, params):
+        game.sessions[game.authenticate(params)] = ["active", time.time()]
+        return {}
+    
+    def sessionsPing(self, game, params):
+        session = game.sessions.get(game.authenticate(params))
+        
+        if session is None or time.time() - session[1] > game.SESSION_TIMEOUT:
+            raise StandInFailure("Could not find an open session. You must open a new one.")
+        
+        session[:] = [params.get("status", session[0]), time.time()]
+        return {}
+    
+    def sessionsCheck(self, game, params):
+        session = game.sessions.get(game.authenticate(params))
+        
+        if session is None or time.time() - session[1] > game.SESSION_TIMEOUT:
+            raise StandInFailure("The session is closed.")
+        
+        return {}
+    
+    def sessionsClose(self, game, params):
+        if game.sessions.pop(game.authenticate(params), None) is None:
+            raise StandInFailure("Could not find an open session.")
+        
+        return {}
+    
+    # Scores
+    def scoresFetch(self, game, params):
+        scores = game.scores[game.table(params)]
+        limit = min(int(params.get("limit", 10)), 100)
+        
+        if "username" in params or "user_token" in params:
+            username = game.authenticate(params)
+            scores = [score for score in scores if score["user"] == username]
+        
+        elif "guest" in params:
+            scores = [score for score in scores if score["guest"] == params["guest"]]
+        
+        if "better_than" in params:
+            scores = [score for score in scores if score["sort"] > int(params["better_than"])]
+        
+        if "worse_than" in params:
+            scores = [score for score in scores if score["sort"] < int(params["worse_than"])]
+        
+        return {"scores" : [dict(score, sort=str(score["sort"])) for score in scores[:limit]]}
+    
+    def scoresTables(self, game, params):
+        return {"tables" : game.tables}
+    
+    def scoresAdd(self, game, params):
+        tableId = game.table(params)
+        
+        if "score" not in params or "sort" not in params:
+            raise StandInFailure("You must enter a score and a sort value.")
+        
+        if "guest" in params:
+            username, userId, guest = "", "", params["guest"]
+        else:
+            username = game.authenticate(params)
+            userId, guest = str(game.userId(username)), ""
+        
+        scores = game.scores[tableId]
+        score = {
+            "score" : params["score"],
+            "sort" : int(params["sort"]),
+            "extra_data" : params.get("extra_data", ""),
+            "user" : username,
+            "user_id" : userId,
+            "guest" : guest,
+            "stored" : "Just now",
+            "stored_timestamp" : int(time.time()),
+        }
+        
+        # Kept sorted from the best score, newer scores after the older ones of the same sort
+        index = len(scores)
+        
+        while index and scores[index - 1]["sort"] < score["sort"]:
+            index -= 1
+        
+        scores.insert(index, score)
+        return {}
+    
+    def scoresGetRank(self, game, params):
+        if "sort" not in params:
+            raise StandInFailure("You must enter a sort value.")
+        
+        scores = game.scores[game.table(params)]
+        return {"rank" : 1 + len([score for score in scores if score["sort"] > int(params["sort"])])}
+    
+    # Trophies
+    def trophiesFetch(self, game, params):
+        achieved = game.achieved.get(game.authenticate(params), {})
+        trophies = game.trophies
+        
+        if "trophy_id" in params:
+            ids = {int(trophyId) for trophyId in params["trophy_id"].split(",") if trophyId.strip().isdigit()}
+            trophies = [trophy for trophy in trophies if trophy["id"] in ids]
+        
+        if params.get("achieved") in ("true", "false"):
+            trophies = [trophy for trophy in trophies if (trophy["id"] in achieved) == (params["achieved"] == "true")]
+        
+        return {"trophies" : [dict(trophy, id=str(trophy["id"]), achieved="Just now" if trophy["id"] in achieved else "false") for trophy in trophies]}
+    
+    def trophy(self, game, params):
+        trophyId = int(params.get("trophy_id", 0))
+        
+        if trophyId not in [trophy["id"] for trophy in game.trophies]:
+            raise StandInFailure("The trophy ID you entered does not point to a valid trophy.")
+        
+        return trophyId
+    
+    def trophiesAddAchieved(self, game, params):
+        achieved = game.achieved.setdefault(game.authenticate(params), {})
+        trophyId = self.trophy(game, params)
+        
+        if trophyId in achieved:
+            raise StandInFailure("The user already has this trophy.")
+        
+        achieved[trophyId] = int(time.time())
+        return {}
+    
+    def trophiesRemoveAchieved(self, game, params):
+        achieved = game.achieved.setdefault(game.authenticate(params), {})
+        
+        if achieved.pop(self.trophy(game, params), None) is None:
+            raise StandInFailure("The user does not have this trophy.")
+        
+        return {}
+    
+    # Data store
+    def dataStoreSet(self, game, params):
+        if "data" not in params:
+            raise StandInFailure("You must enter data with the request.")
+        
+        game.dataStore(params)[game.key(params)] = params["data"]
+        return {}
+    
+    def dataStoreUpdate(self, game, params):
+        store = game.dataStore(params)
+        key = game.key(params)
+        operation = params.get("operation")
+        value = params.get("value", "")
+        
+        if key not in store:
+            raise StandInFailure("There is no item with the key passed in.")
+        
+        if operation in ("append", "prepend"):
+            store[key] = store[key] + value if operation == "append" else value + store[key]
+        
+        elif operation in ("add", "subtract", "multiply", "divide"):
+            try:
+                current, number = float(store[key]), float(value)
+            except ValueError:
+                raise StandInFailure("Mathematical operations require numeric values.")
+            
+            if operation == "divide" and number == 0:
+                raise StandInFailure("Cannot divide by zero.")
+            
+            result = {"add" : current + number, "subtract" : current - number, "multiply" : current * number}.get(operation, current / number if number else 0)
+            store[key] = formatNumber(result)
+        
+        else:
+            raise StandInFailure("The operation you entered is not valid.")
+        
+        return {"data" : store[key]}
+    
+    def dataStoreRemove(self, game, params):
+        if game.dataStore(params).pop(game.key(params), None) is None:
+            raise StandInFailure("There is no item with the key passed in.")
+        
+        return {}
+    
+    def dataStoreFetch(self, game, params):
+        store = game.dataStore(params)
+        key = game.key(params)
+        
+        if key not in store:
+            raise StandInFailure("There is no item with the key passed in.")
+        
+        return {"data" : store[key]}
+    
+    def dataStoreGetKeys(self, game, params):
+        pattern = params.get("pattern", "*")
+        return {"keys" : [{"key" : key} for key in game.dataStore(params) if fnmatch.fnmatchcase(key, pattern)]}
+    
+    # Friends
+    def friends(self, game, params):
+        game.authenticate(params)
+        return {"friends" : []}
+    
+    # Time
+    def time(self, game, params):
+        now = time.gmtime()
+        return {
+            "timestamp" : int(time.time()),
+            "timezone" : "UTC",
+            "year" : now.tm_year,
+            "month" : now.tm_mon,
+            "day" : now.tm_mday,
+            "hour" : now.tm_hour,
+            "minute" : now.tm_min,
+            "second" : now.tm_sec,
+        }
+
+
+def _createCertificate(directory):
+    """Creates a self-signed certificate for ``localhost`` using the ``openssl`` command."""
+    
+    certFile = os.path.join(directory, "cert.pem")
+    keyFile = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=localhost", "-keyout", keyFile, "-out", certFile],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return certFile, keyFile
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.requests = 0 # Requests received by a FaultInjectingHandler
+
+
+def startServer(handler=StandInHandler, https=True, game=None):
+    """Starts the stand-in server on a free local port in a background thread.
+    
+    Returns the server and the API base URL to pass as ``apiUrl`` to ``GameJoltAPI``.
+    HTTPS requires the ``openssl`` command, falling back to plain HTTP otherwise.
+    ``GameHandler`` serves ``game``, a new ``StandInGame`` if not given."""
+    
+    server = StandInServer(("127.0.0.1", 0), handler)
+    server.game = game if game is not None else StandInGame()
+    scheme = "http"
+    
+    if https and shutil.which("openssl"):
+        directory = tempfile.mkdtemp()
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*_createCertificate(directory))
+        # Handshake in the handler threads instead of serially in the accept loop
+        server.socket = context.wrap_socket(server.socket, server_side=True, do_handshake_on_connect=False)
+        shutil.rmtree(directory)
+        scheme = "https"
+    
+    server.scheme = scheme
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, "%s://localhost:%d%s" % (scheme, server.server_address[1], API_PATH)
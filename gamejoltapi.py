@@ -1,12 +1,44 @@
 import ssl as _ssl
+import os as _os
+import asyncio as _asyncio
+import threading as _threading
+import random as _random
+import bisect as _bisect
+import heapq as _heapq
+import itertools as _itertools
+import atexit as _atexit
+import zlib as _zlib
+import base64 as _base64
+import sys as _sys
 
-from urllib.parse import urlencode as _urlencode, quote as _quote
-from urllib.request import urlopen as _urlopen
+from urllib.parse import quote as _quote, quote_plus as _quotePlus, unquote_plus as _unquotePlus, parse_qsl as _parseQsl, urlsplit as _urlsplit
+from urllib.error import HTTPError as _HTTPError
+from http.client import HTTPConnection as _HTTPConnection, HTTPSConnection as _HTTPSConnection, HTTPException as _HTTPException, RemoteDisconnected as _RemoteDisconnected
+from io import BytesIO as _BytesIO
+from concurrent.futures import Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+from time import monotonic as _monotonic, perf_counter as _perfCounter, sleep as _sleep, time as _time
 from hashlib import md5 as _md5
-from ast import literal_eval as _literal_eval
-from collections import OrderedDict as _OrderedDict
+from uuid import uuid4 as _uuid4
+from array import array as _array
+from collections import OrderedDict as _OrderedDict, namedtuple as _namedtuple, deque as _deque
+
+# Use the fastest JSON decoder available, all of them accept bytes
+try:
+    from orjson import loads as _jsonLoads
+except ImportError:
+    try:
+        from ujson import loads as _jsonLoads
+    except ImportError:
+        from json import loads as _jsonLoads
+
+# Zstandard compression is optional
+try:
+    import zstandard as _zstandard
+except ImportError:
+    _zstandard = None
 
 _DEBUG = False
+_BATCH_LIMIT = 50 # Maximum amount of sub-requests accepted by the server in one batch request
 _ssl._create_default_https_context = _ssl._create_unverified_context
 
 
@@ -40,864 +72,5947 @@ class GameJoltDataCollision(Exception):
         super().__init__(self.message)
 
 
-class GameJoltAPI:
-    """ The main Game Jolt API class. Aside from the required arguments, most of the 
-    optional arguments are provided to avoid asking for them in every single method.
+class GameJoltBatchError(Exception):
+    """ Exception raised when a sub-request of a batch request got no response, 
+    e.g. because a previous sub-request failed with ``breakOnError`` enabled.
     
-    :param gameId: The game ID. Required in all requests.
-    :type gameId: int
+    :param response: The response of the batch request.
+    :type response: dict
+    """
     
-    :param privateKey: The API private key. Required in all requests.
-    :type privateKey: str
+    def __init__(self, response):
+        # type: (dict) -> None
+        
+        self.response = response
+        self.message = "Sub-request not processed by the batch request: " + repr(response.get("message", response))
+        super().__init__(self.message)
+
+
+class GameJoltConnectError(OSError):
+    """ Exception raised when a connection to the API cannot be established. The request 
+    was not sent, so it is always safe to retry it.
     
-    :param username: Username used in some requests. Optional.
-    :type username: str
+    :param host: The host which could not be connected to.
+    :type host: str
+    """
     
-    :param userToken: User access token used in some requests. Optional.
-    :type userToken: str
+    def __init__(self, host):
+        # type: (str) -> None
+        
+        self.host = host
+        self.message = "Cannot connect to " + repr(host)
+        super().__init__(self.message)
+
+
+class GameJoltCircuitOpen(Exception):
+    """ Exception raised without sending the request while a :class:`GameJoltCircuitBreaker` 
+    is open because the API is failing.
     
-    :param responseFormat: The response format of the requests. Can be ``"json"``, ``"xml"``, ``"keypair"`` or ``"dump"``. Optional, defaults to ``"json"``.
-    :type responseFormat: str
+    :param retryIn: Seconds until the circuit breaker lets a trial request through.
+    :type retryIn: float
+    """
     
-    :param submitRequests: If submit the requests or just get the generated URLs from the method calls. Useful to generate URLs for batch requests. Optional, defaults to ``True``.
-    :type submitRequests: bool
+    def __init__(self, retryIn):
+        # type: (float) -> None
+        
+        self.retryIn = retryIn
+        self.message = "API is failing, requests are rejected for %.1f more seconds" % retryIn
+        super().__init__(self.message)
+
+
+def _isTransientError(exception):
+    # type: (BaseException) -> bool
     
-    .. py:attribute:: gameId
-       :type: int
-       
-       The game ID. Required in all requests.
+    if isinstance(exception, _HTTPError):
+        return exception.code >= 500 or exception.code == 429
+    return isinstance(exception, (OSError, _HTTPException, _asyncio.IncompleteReadError, _asyncio.TimeoutError))
+
+
+def _isNotProcessed(exception):
+    # type: (BaseException) -> bool
     
-    .. py:attribute:: privateKey
-       :type: str
-       
-        The API private key. Required in all requests.
+    # The request was not sent at all, or rejected before being processed
+    return isinstance(exception, GameJoltConnectError) or (isinstance(exception, _HTTPError) and exception.code == 429)
+
+
+class GameJoltRetryPolicy:
+    """ Decides if and when a failed request is retried, with exponential backoff and 
+    full jitter. Passed as ``retryPolicy`` to :class:`GameJoltAPI`.
     
-    .. py:attribute:: username
-       :type: str
-       
-        Username used in some requests. Optional.
+    Only transient errors are retried: connection errors, timeouts, HTTP ``5xx`` and ``429`` 
+    status codes. Operations which are not idempotent (``"scores/add"``, ``"data-store/update"`` 
+    and ``"batch"``) could be applied twice if retried after the server received them, so by 
+    default they are only retried when the request was not sent at all 
+    (:class:`GameJoltConnectError`) or was rejected with ``429``.
     
-    .. py:attribute:: userToken
-       :type: str
-       
-        User access token used in some requests. Optional.
+    :param maxRetries: The maximum amount of retries of a request. Optional, defaults to ``3``.
+    :type maxRetries: int
     
-    .. py:attribute:: responseFormat
-       :type: str
-       
-        The response format of the requests. Can be ``"json"``, ``"xml"``, ``"keypair"`` or ``"dump"``. Optional, defaults to ``"json"``.
+    :param backoff: Base delay in seconds, doubled on each retry. Optional, defaults to ``0.2``.
+    :type backoff: float
     
-    .. py:attribute:: submitRequests
-       :type: bool
-       
-        If submit the requests or just get the generated URLs from the method calls. Useful to generate URLs for batch requests. Optional, defaults to ``True``."""
+    :param maxBackoff: The maximum delay in seconds between retries. Optional, defaults to ``10``.
+    :type maxBackoff: float
+    
+    :param retryWrites: If ``True``, also retries non-idempotent operations on any transient error. Optional, defaults to ``False``.
+    :type retryWrites: bool
+    """
     
-    def __init__(self, gameId, privateKey, username=None, userToken=None, responseFormat="json", submitRequests=True):
-        # type: (int, str, str, str, str, bool) -> None
+    NON_IDEMPOTENT = ("scores/add", "data-store/update", "batch")
+    
+    def __init__(self, maxRetries=3, backoff=0.2, maxBackoff=10.0, retryWrites=False):
+        # type: (int, float, float, bool) -> None
         
-        self.__API_URL = "https://api.gamejolt.com/api/game/v1_2"
-        self.__RETURN_FORMATS = ["json", "keypair", "dump", "xml"]
+        self.maxRetries = maxRetries
+        self.backoff = backoff
+        self.maxBackoff = maxBackoff
+        self.retryWrites = retryWrites
         
-        self.gameId = str(gameId)
-        self.privateKey = privateKey
-        self.username = username
-        self.userToken = userToken
-        self.responseFormat = responseFormat if responseFormat in self.__RETURN_FORMATS else "json"
-        self.submitRequests = submitRequests
-        self.operations = {
-            "users/fetch" : self.__API_URL + "/users/" + "?",
-            "users/auth" : self.__API_URL + "/users/auth/" + "?",
-            "sessions/open" : self.__API_URL + "/sessions/open/" + "?",
-            "sessions/ping" : self.__API_URL + "/sessions/ping/" + "?",
-            "sessions/check" : self.__API_URL + "/sessions/check/" + "?",
-            "sessions/close" : self.__API_URL + "/sessions/close/" + "?",
-            "scores/fetch" : self.__API_URL + "/scores/" + "?",
-            "scores/tables" : self.__API_URL + "/scores/tables/" + "?",
-            "scores/add" : self.__API_URL + "/scores/add/" + "?",
-            "scores/get-rank" : self.__API_URL + "/scores/get-rank/" + "?",
-            "trophies/fetch" : self.__API_URL + "/trophies/" + "?",
-            "trophies/add-achieved" : self.__API_URL + "/trophies/add-achieved/" + "?",
-            "trophies/remove-achieved" : self.__API_URL + "/trophies/remove-achieved/" + "?",
-            "data-store/set" : self.__API_URL + "/data-store/set/" + "?",
-            "data-store/update" : self.__API_URL + "/data-store/update/" + "?",
-            "data-store/remove" : self.__API_URL + "/data-store/remove/" + "?",
-            "data-store/fetch" : self.__API_URL + "/data-store/" + "?",
-            "data-store/get-keys" : self.__API_URL + "/data-store/get-keys/" + "?",
-            "friends" : self.__API_URL + "/friends/" + "?",
-            "time" : self.__API_URL + "/time/" + "?",
-            "batch" : self.__API_URL + "/batch/" + "?",
-        }
+    def retryDelay(self, operation, exception, attempt):
+        # type: (str, BaseException, int) -> float
         
-    def _submit(self, operationUrl, data):
-        # type: (str, dict) -> dict
+        """Returns the seconds to wait before retrying a failed request.
         
-        orderedData = _OrderedDict()
-        isBatch = "batch" in operationUrl
+        :param operation: The operation name.
+        :type operation: str
         
-        if not self.submitRequests and "format" in data.keys():
-            data.pop("format")
+        :param exception: The exception raised by the request.
+        :type exception: Exception
         
-        for key in sorted(data.keys()):
-            orderedData[key] = data[key]
-        data = orderedData
+        :param attempt: The amount of retries already made.
+        :type attempt: int
         
-        requestUrls = data.pop("requests") if isBatch else []
-        requestAsParams = "&".join(["requests[]=" + url for url in requestUrls]) if isBatch else ""
+        :return: The delay, or ``None`` if the request must not be retried.
+        :rtype: float"""
+        
+        if attempt >= self.maxRetries or not _isTransientError(exception):
+            return None
             
-        urlParams = _urlencode(data)
-        urlParams += "&" + requestAsParams if isBatch else ""
-        urlToSignature = operationUrl + urlParams + self.privateKey
-        signature = _md5(urlToSignature.encode()).hexdigest()
-        finalUrl = operationUrl + urlParams + "&signature=" + signature
+        if operation in self.NON_IDEMPOTENT and not self.retryWrites and not _isNotProcessed(exception):
+            return None
+            
+        delay = _random.uniform(0, min(self.maxBackoff, self.backoff * 2 ** attempt))
+        retryAfter = exception.headers.get("Retry-After") if isinstance(exception, _HTTPError) and exception.headers is not None else None
         
-        if self.submitRequests:
-            if _DEBUG: print("Requesting URL:", finalUrl)
-            response = _urlopen(finalUrl).read().decode()
+        if retryAfter is not None and retryAfter.isdigit():
+            delay = max(delay, min(self.maxBackoff, float(retryAfter)))
             
-            if self.responseFormat == "json":
-                return _literal_eval(response)["response"]
-            else:
-                return response
-        else:
-            if _DEBUG: print("Generated URL:", finalUrl)
-            return finalUrl
+        return delay
 
-    def _validateRequiredData(self, data):
-        # type: (dict) -> bool
+
+class GameJoltCircuitBreaker:
+    """ Rejects requests right away while the API is failing, instead of letting every 
+    caller wait for its own timeout. Passed as ``circuitBreaker`` to :class:`GameJoltAPI`, 
+    and can be shared by any number of instances and threads.
+    
+    After ``failureThreshold`` consecutive transient errors the breaker opens and requests 
+    raise :class:`GameJoltCircuitOpen`. After ``resetTimeout`` seconds one trial request is 
+    let through: if it succeeds the breaker closes, otherwise it opens again.
+    
+    :param failureThreshold: Consecutive transient errors which open the breaker. Optional, defaults to ``5``.
+    :type failureThreshold: int
+    
+    :param resetTimeout: Seconds the breaker stays open before a trial request. Optional, defaults to ``30``.
+    :type resetTimeout: float
+    """
+    
+    def __init__(self, failureThreshold=5, resetTimeout=30.0):
+        # type: (int, float) -> None
+        
+        self.failureThreshold = failureThreshold
+        self.resetTimeout = resetTimeout
+        self.failures = 0
+        self.openedAt = None
+        self._trialInFlight = False
+        self._lock = _threading.Lock()
+        
+    @property
+    def state(self):
+        # type: () -> str
+        
+        """The state of the breaker, ``"closed"``, ``"open"`` or ``"half-open"``."""
+        
+        with self._lock:
+            if self.openedAt is None:
+                return "closed"
+            return "half-open" if _monotonic() - self.openedAt >= self.resetTimeout else "open"
+            
+    def beforeRequest(self):
+        # type: () -> bool
         
-        for key in data.keys():
-            if data[key] is None:
-                raise GameJoltDataRequired(key)
-        return True
+        """Called before each request.
         
-    def _getValidData(self, data):
-        # type: (dict) -> dict
+        :return: If the request is the trial request of the half-open breaker.
+        :rtype: bool
         
-        validatedData = {}
-        if self.responseFormat != "json":
-            validatedData["format"] = self.responseFormat
+        :raises GameJoltCircuitOpen: If the breaker is open, or half-open with a trial request already in flight."""
         
-        for key in data.keys():
-            if data[key] is not None:
-                validatedData[key] = data[key]
-        return validatedData
-    
-    def _processBoolean(self, value):
-        # type: (bool) -> str
+        with self._lock:
+            if self.openedAt is None:
+                return False
+                
+            elapsed = _monotonic() - self.openedAt
+            
+            if elapsed < self.resetTimeout or self._trialInFlight:
+                raise GameJoltCircuitOpen(max(0.0, self.resetTimeout - elapsed))
+                
+            self._trialInFlight = True
+            return True
+            
+    def releaseTrial(self):
+        # type: () -> None
         
-        if value is not None:
-            return str(value).lower()
-    
-    # Users
-    def usersFetch(self, username=None, userId=None):
-        # type: (str, str | int | list) -> dict
+        """Called when the trial request stops without an outcome, for example when its task 
+        is cancelled, so the next request can be the trial."""
         
-        """Returns a user's data.
+        with self._lock:
+            self._trialInFlight = False
+            
+    def recordSuccess(self):
+        # type: () -> None
         
-        :param username: The username of the user whose data you'd like to fetch.
-        :type username: str
+        """Called after each request which did not fail with a transient error."""
         
-        :param userId: The ID of the user whose data you'd like to fetch.
-        :type userId: str, int or list
+        with self._lock:
+            self.failures = 0
+            self.openedAt = None
+            self._trialInFlight = False
+            
+    def recordFailure(self):
+        # type: () -> None
         
-        .. note::
-           
-           - Only one parameter, ``username`` or ``userId``, is required.
-           - You can pass in multiple user ids by providing a list or separating them with commas in a string (example: ``"13,89,35"``)."""
+        """Called after each request which failed with a transient error."""
         
-        if type(userId) in (list, tuple, set):
-            userId = ",".join(userId)
+        with self._lock:
+            self.failures += 1
+            
+            if self._trialInFlight or self.failures >= self.failureThreshold:
+                self.openedAt = _monotonic()
+                
+            self._trialInFlight = False
+
+
+class GameJoltRateLimiter:
+    """ A thread-safe token bucket limiting the requests sent per second. Passed as 
+    ``rateLimiter`` to :class:`GameJoltAPI`, usually through :meth:`shared` so all the 
+    instances of a game in the process share the same limit.
+    
+    Requests wait for a token when the bucket is empty. Waiting requests are served by 
+    priority first, then round-robin across the API instances, so one busy instance 
+    cannot starve the others.
+    
+    :param rate: Tokens added per second, the sustained amount of requests per second. Optional, defaults to ``10``.
+    :type rate: float
+    
+    :param burst: The maximum amount of tokens, the amount of requests which can be sent at once after an idle period. Optional, defaults to ``20``.
+    :type burst: int
+    
+    :param priorities: Priority per operation name, updating the default ones. Lower values are served first. Optional.
+    :type priorities: dict
+    
+    .. note::
+    
+       By default session requests have priority ``0``, data-store writes ``2`` and every other operation ``1``, 
+       so session pings are not delayed behind analytics writes.
+       
+    .. code-block:: python
+       
+       limiter = gamejoltapi.GameJoltRateLimiter.shared(GAME_ID, rate=20, burst=40)
+       api = gamejoltapi.GameJoltAPI(GAME_ID, PRIVATE_KEY, username=USERNAME, userToken=TOKEN, rateLimiter=limiter)
+       
+    """
+    
+    DEFAULT_PRIORITIES = {
+        "sessions/open" : 0,
+        "sessions/ping" : 0,
+        "sessions/check" : 0,
+        "sessions/close" : 0,
+        "data-store/set" : 2,
+        "data-store/update" : 2,
+        "data-store/remove" : 2,
+    }
+    
+    _shared = {}
+    _sharedLock = _threading.Lock()
+    
+    def __init__(self, rate=10.0, burst=20, priorities=None):
+        # type: (float, int, dict) -> None
         
-        # Required data
-        data = {
-            "game_id" : self.gameId
-        }
+        if rate <= 0:
+            raise ValueError("The rate must be positive, not %r" % (rate,))
             
-        if username is not None: 
-            data["username"] = username
+        if burst < 1:
+            raise ValueError("The burst must be at least 1, not %r" % (burst,))
             
-        elif userId is not None: 
-            data["user_id"] = userId
+        self.rate = rate
+        self.burst = burst
+        self.priorities = dict(self.DEFAULT_PRIORITIES)
+        self.priorities.update(priorities if priorities is not None else {})
+        self.waits = 0
+        self.waitTime = 0.0
+        self._tokens = float(burst)
+        self._updatedAt = _monotonic()
+        self._waiters = [] # Heap of [priority, ownerRound, sequence]
+        self._ownerWaiting = {} # id(owner) -> amount of waiting requests
+        self._sequence = _itertools.count()
+        self._condition = _threading.Condition()
+        
+    @classmethod
+    def shared(cls, gameId, rate=10.0, burst=20, priorities=None):
+        # type: (int, float, int, dict) -> GameJoltRateLimiter
+        
+        """Returns the rate limiter shared by the whole process for a game, creating it 
+        with the given arguments on the first call.
+        
+        :param gameId: The game ID.
+        :type gameId: int
+        
+        :rtype: GameJoltRateLimiter"""
+        
+        with cls._sharedLock:
+            limiter = cls._shared.get(str(gameId))
+            
+            if limiter is None:
+                limiter = cls._shared[str(gameId)] = cls(rate, burst, priorities)
+            return limiter
+            
+    def _refill(self):
+        # type: () -> None
         
-        else:
-            data["username"] = self.username
+        now = _monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updatedAt) * self.rate)
+        self._updatedAt = now
         
-        self._validateRequiredData(data)
-        return self._submit(self.operations["users/fetch"], data)
+    def tryAcquire(self):
+        # type: () -> bool
         
-    def usersAuth(self):
-        # type: () -> dict
+        """Takes a token if one is available and no request is waiting, without blocking.
         
-        """Authenticates the user's information. This should be done before you make 
-        any calls for the user, to make sure the user's credentials (username and 
-        token) are valid."""
+        :return: If a token was taken.
+        :rtype: bool"""
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+        with self._condition:
+            self._refill()
+            
+            if not self._waiters and self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+            
+    def _enqueue(self, operation, owner):
+        # type: (str, object) -> list
         
-        self._validateRequiredData(data)
-        return self._submit(self.operations["users/auth"], data)
-    
-    # Sessions
-    def sessionsOpen(self):
-        # type: () -> dict
+        ownerKey = id(owner)
+        ownerRound = self._ownerWaiting.get(ownerKey, 0)
+        self._ownerWaiting[ownerKey] = ownerRound + 1
+        entry = [self.priorities.get(operation, 1), ownerRound, next(self._sequence)]
+        _heapq.heappush(self._waiters, entry)
+        return entry
         
-        """Opens a game session for a particular user and allows you to tell Game Jolt 
-        that a user is playing your game. You must ping the session to keep it active 
-        and you must close it when you're done with it.
+    def _take(self, entry):
+        # type: (list) -> float
         
-        .. note::
-           You can only have one open session for a user at a time. If you try to open a new session while one is running, the system will close out the current one before opening the new one.
+        # Takes a token for a waiting request and returns 0, or returns the seconds to wait for one, None while other requests are served first
+        self._refill()
         
-        """
+        if self._waiters[0] is not entry:
+            return None
+            
+        if self._tokens >= 1:
+            _heapq.heappop(self._waiters)
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+        
+    def _dequeue(self, entry, owner, start):
+        # type: (list, object, float) -> float
+        
+        if entry in self._waiters:
+            self._waiters.remove(entry)
+            _heapq.heapify(self._waiters)
+            
+        ownerKey = id(owner)
+        self._ownerWaiting[ownerKey] -= 1
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+        if not self._ownerWaiting[ownerKey]:
+            del self._ownerWaiting[ownerKey]
+            
+        self._condition.notify_all()
+        waited = _monotonic() - start
+        self.waits += 1
+        self.waitTime += waited
+        return waited
         
-        self._validateRequiredData(data)
-        return self._submit(self.operations["sessions/open"], data)
+    def acquire(self, operation=None, owner=None):
+        # type: (str, object) -> float
         
-    def sessionsPing(self, status=None):
-        # type: (str) -> dict
+        """Waits until a token is available and takes it.
         
-        """Pings an open session to tell the system that it's still active. If the session 
-        hasn't been pinged within 120 seconds, the system will close the session and you 
-        will have to open another one. It's recommended that you ping about every 30 
-        seconds or so to keep the system from clearing out your session.
+        :param operation: The operation name of the request, which sets its priority. Optional.
+        :type operation: str
         
-        You can also let the system know whether the player is in an active or idle state 
-        within your game.
+        :param owner: The object sending the request, usually the API instance, used to queue fairly. Optional.
+        :type owner: object
         
-        :param status: Sets the status of the session.
-        :type status: str
+        :return: The seconds waited.
+        :rtype: float"""
         
-        .. note::
-           Valid Values for ``status``:
-           
-           - ``"active"``: Sets the session to the ``"active"`` state.
-           - ``"idle"``: Sets the session to the ``"idle"`` state.
-        """
+        if self.tryAcquire():
+            return 0.0
+            
+        start = _monotonic()
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+        with self._condition:
+            entry = self._enqueue(operation, owner)
+            
+            try:
+                delay = self._take(entry)
+                
+                while delay != 0.0:
+                    self._condition.wait(delay)
+                    delay = self._take(entry)
+                    
+            finally:
+                waited = self._dequeue(entry, owner, start)
+                
+        return waited
+        
+    async def acquireAsync(self, operation=None, owner=None):
+        # type: (str, object) -> float
+        
+        """Waits until a token is available and takes it, without blocking the event loop 
+        nor a thread. Requests waiting in :meth:`acquire` and :meth:`acquireAsync` share the same queue.
+        
+        :param operation: The operation name of the request, which sets its priority. Optional.
+        :type operation: str
         
-        # Optional data
-        optionalData = {
-            "status" : status # active or idle
-        }
+        :param owner: The object sending the request, usually the API instance, used to queue fairly. Optional.
+        :type owner: object
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
-        return self._submit(self.operations["sessions/ping"], data)
-    
-    def sessionsCheck(self):
-        # type: () -> dict
+        :return: The seconds waited.
+        :rtype: float"""
         
-        """Checks to see if there is an open session for the user. Can be used to see 
-        if a particular user account is active in the game.
+        if self.tryAcquire():
+            return 0.0
+            
+        start = _monotonic()
         
-        .. note::
-           
-           This endpoint returns ``"false"`` for the ``"success"`` field when no open session exists. That behaviour is different from other endpoints which use this field to indicate an error state.
+        with self._condition:
+            entry = self._enqueue(operation, owner)
+            
+        try:
+            while True:
+                with self._condition:
+                    delay = self._take(entry)
+                    
+                if delay == 0.0:
+                    break
+                    
+                # Not notified by the condition, so requests served first are checked again after a token interval
+                await _asyncio.sleep(delay if delay is not None else 1.0 / self.rate)
+                
+        finally:
+            with self._condition:
+                waited = self._dequeue(entry, owner, start)
+                
+        return waited
 
-        """
-        
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+
+class GameJoltConnectionPool:
+    """ A thread-safe pool of persistent HTTP(S) connections. Connections are kept alive
+    between requests and reused, avoiding a new TCP and TLS handshake on every API call.
+    
+    :param maxSize: The maximum amount of idle connections kept per host. Optional, defaults to ``10``.
+    :type maxSize: int
+    
+    :param idleTimeout: Seconds an idle connection is kept before being evicted from the pool. Optional, defaults to ``30``.
+    :type idleTimeout: float
+    
+    :param timeout: Socket timeout in seconds of the created connections. Optional, defaults to ``None`` (no timeout).
+    :type timeout: float
+    
+    :param connectTimeout: Timeout in seconds to establish a connection. Optional, defaults to ``timeout``.
+    :type connectTimeout: float
+    
+    :param readTimeout: Timeout in seconds of each socket operation once connected, e.g. waiting for the response. Optional, defaults to ``timeout``.
+    :type readTimeout: float
+    
+    .. note::
+    
+       - The same pool can be shared by any number of :class:`GameJoltAPI` instances and threads.
+       - A reused connection that was closed by the server in the meantime is transparently replaced by a new one, as long as the server did not receive the request or closed it without answering.
+       - An error once the request went out, e.g. a read timeout, is raised and never resent by the pool, so a :class:`GameJoltRetryPolicy` decides if retrying is safe.
+       - A connection that cannot be established, or a request that could not be sent, raises :class:`GameJoltConnectError`.
+    """
+    
+    def __init__(self, maxSize=10, idleTimeout=30.0, timeout=None, connectTimeout=None, readTimeout=None):
+        # type: (int, float, float, float, float) -> None
         
-        self._validateRequiredData(data)
-        return self._submit(self.operations["sessions/check"], data)
+        self.maxSize = maxSize
+        self.idleTimeout = idleTimeout
+        self.timeout = timeout
+        self.connectTimeout = connectTimeout if connectTimeout is not None else timeout
+        self.readTimeout = readTimeout if readTimeout is not None else timeout
+        self._lock = _threading.Lock()
+        self._idle = {} # (scheme, host, port) -> [[connection, lastUsed], ...]
         
-    def sessionsClose(self):
-        # type: () -> dict
+    def _newConnection(self, scheme, host, port):
+        # type: (str, str, int) -> _HTTPConnection
         
-        """Closes the active session."""
+        connectionClass = _HTTPSConnection if scheme == "https" else _HTTPConnection
+        return connectionClass(host, port, timeout=self.connectTimeout)
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+    def _getConnection(self, hostKey):
+        # type: (tuple) -> tuple
         
-        self._validateRequiredData(data)
-        return self._submit(self.operations["sessions/close"], data)
+        expired = []
+        connection = None
+        now = _monotonic()
         
-    # Scores
-    def scoresFetch(self, limit=None, tableId=None, guest=None, betterThan=None, worseThan=None, thisUser=False):
-        # type: (int, int, str, int, int, bool) -> dict
+        with self._lock:
+            idle = self._idle.get(hostKey)
+            
+            while idle:
+                candidate, lastUsed = idle.pop()
+                
+                if now - lastUsed <= self.idleTimeout:
+                    connection = candidate
+                    break
+                expired.append(candidate)
+                
+        for candidate in expired:
+            candidate.close()
+            
+        if connection is not None:
+            return connection, True
+        return self._newConnection(*hostKey), False
         
-        """Returns a list of scores either for a user or globally for a game.
+    def _releaseConnection(self, hostKey, connection):
+        # type: (tuple, _HTTPConnection) -> None
         
-        :param limit: The number of scores you'd like to return.
-        :type limit: int
+        with self._lock:
+            idle = self._idle.setdefault(hostKey, [])
+            
+            if len(idle) < self.maxSize:
+                idle.append([connection, _monotonic()])
+                return
+                
+        connection.close()
         
-        :param tableId: The ID of the score table.
-        :type tableId: int
+    def request(self, url, method="GET", body=None, headers=None, timings=None):
+        # type: (str, str, bytes, dict, dict) -> bytes
         
-        :param guest: A guest's name.
-        :type guest: str
+        """Performs a request through a pooled connection and returns the response body.
         
-        :param betterThan: Fetch only scores better than this score sort value.
-        :type betterThan: int
+        :param url: The absolute URL to request.
+        :type url: str
         
-        :param worseThan: Fetch only scores worse than this score sort value.
-        :type worseThan: int
+        :param method: The HTTP method. Optional, defaults to ``"GET"``.
+        :type method: str
         
-        :param thisUser: If ``True``, fetch only scores of current user. Else, fetch scores of all users.
-        :type thisUser: bool
+        :param body: The request body. Optional.
+        :type body: bytes
         
-        .. note::
-           
-           - The default value for ``limit`` is ``10`` scores. The maximum amount of scores you can retrieve is ``100``.
-           - If ``tableId`` is left blank, the scores from the primary score table will be returned.
-           - Only pass in ``thisUser=True`` if you would like to retrieve scores for just the user set in the class constructor. Leave ``thisUser=False`` and ``guest=None`` to retrieve all scores.
-           - ``guest`` allows you to fetch scores by a specific guest name. Only pass either the ``thisUser=True`` or the ``guest`` (or none), never both.
-           - Scores are returned in the order of the score table's sorting direction. e.g. for descending tables the bigger scores are returned first.
-        """
+        :param headers: Additional request headers. Optional.
+        :type headers: dict
         
-        # Required data
-        data = {
-            "game_id" : self.gameId
-        }
+        :param timings: A dictionary receiving the ``"connect"``, ``"ttfb"`` and ``"read"`` durations in seconds. Optional.
+        :type timings: dict
         
-        # Optional data
-        optionalData = {
-            "username" : self.username if guest is None and thisUser else None,
-            "user_token" : self.userToken if guest is None and thisUser else None,
-            "limit" : limit,
-            "table_id" : tableId,
-            "guest" : guest if guest is not None and not thisUser else None,
-            "better_than" : betterThan,
-            "worse_than" : worseThan,
-        }
+        :raises urllib.error.HTTPError: If the server responds with an error status code, same as :func:`urllib.request.urlopen`."""
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
+        start = _perfCounter() if timings is not None else 0.0
+        splitUrl = _urlsplit(url)
+        scheme = splitUrl.scheme.lower()
+        port = splitUrl.port or (443 if scheme == "https" else 80)
+        hostKey = (scheme, splitUrl.hostname, port)
+        target = (splitUrl.path or "/") + ("?" + splitUrl.query if splitUrl.query else "")
+        headers = headers if headers is not None else {}
         
-        return self._submit(self.operations["scores/fetch"], data)
+        while True:
+            connection, reused = self._getConnection(hostKey)
+            
+            if not reused:
+                try:
+                    connection.connect()
+                except OSError as exception:
+                    connection.close()
+                    raise GameJoltConnectError(splitUrl.netloc) from exception
+                    
+            connection.sock.settimeout(self.readTimeout)
+            
+            if timings is not None:
+                connected = _perfCounter()
+                timings["connect"] = connected - start
+                
+            try:
+                connection.request(method, target, body=body, headers=headers)
+            except (_HTTPException, OSError) as exception:
+                connection.close()
+                
+                # The request did not go out, so it can be sent again on a fresh connection
+                if reused:
+                    continue
+                raise GameJoltConnectError(splitUrl.netloc) from exception
+                
+            try:
+                response = connection.getresponse()
+                
+                if timings is not None:
+                    firstByte = _perfCounter()
+                    timings["ttfb"] = firstByte - connected
+                    
+                responseBody = response.read()
+                
+                if timings is not None:
+                    timings["read"] = _perfCounter() - firstByte
+                    
+            except _RemoteDisconnected:
+                connection.close()
+                
+                # Server closed the kept alive connection without answering, retry once on a fresh one
+                if reused:
+                    continue
+                raise
+                
+            except (_HTTPException, OSError):
+                # The server may have processed the request, let the retry policy decide
+                connection.close()
+                raise
+                
+            if response.will_close:
+                connection.close()
+            else:
+                self._releaseConnection(hostKey, connection)
+                
+            if response.status >= 400:
+                raise _HTTPError(url, response.status, response.reason, response.headers, _BytesIO(responseBody))
+                
+            return responseBody
+            
+    def evictIdle(self):
+        # type: () -> int
         
-    def scoresTables(self):
-        # type: () -> dict
+        """Closes all idle connections which exceeded the ``idleTimeout``.
         
-        """Returns a list of high score tables for a game."""
+        :return: The amount of closed connections.
+        :rtype: int"""
         
-        # Required data
-        data = {
-            "game_id" : self.gameId
-        }
+        expired = []
+        now = _monotonic()
         
-        self._validateRequiredData(data)
-        return self._submit(self.operations["scores/tables"], data)
+        with self._lock:
+            for hostKey, idle in self._idle.items():
+                alive = [entry for entry in idle if now - entry[1] <= self.idleTimeout]
+                expired.extend([entry[0] for entry in idle if now - entry[1] > self.idleTimeout])
+                self._idle[hostKey] = alive
+                
+        for connection in expired:
+            connection.close()
+        return len(expired)
         
-    def scoresAdd(self, score, sort, tableId=None, guest=None, extraData=None):
-        # type: (str, int, int, str, str) -> dict
+    def close(self):
+        # type: () -> None
         
-        """Adds a score for a user or guest. 
+        """Closes all idle connections of the pool."""
         
-        :param score: This is a string value associated with the score. Example: ``"500 Points"``
-        :type score: str
+        with self._lock:
+            idle = self._idle
+            self._idle = {}
+            
+        for entries in idle.values():
+            for connection, lastUsed in entries:
+                connection.close()
+
+
+_defaultConnectionPool = None
+_defaultConnectionPoolLock = _threading.Lock()
+
+
+def _getDefaultConnectionPool():
+    # type: () -> GameJoltConnectionPool
+    
+    global _defaultConnectionPool
+    
+    with _defaultConnectionPoolLock:
+        if _defaultConnectionPool is None:
+            _defaultConnectionPool = GameJoltConnectionPool()
+        return _defaultConnectionPool
+
+
+class GameJoltAsyncConnectionPool:
+    """ A non-blocking pool of persistent HTTP(S) connections built on :mod:`asyncio` streams.
+    Used by :class:`AsyncGameJoltAPI`, it keeps connections alive between requests and limits
+    how many requests are in flight at the same time.
+    
+    :param maxSize: The maximum amount of idle connections kept per host. Optional, defaults to ``10``.
+    :type maxSize: int
+    
+    :param maxConcurrency: The maximum amount of requests in flight at the same time. Optional, defaults to ``100``.
+    :type maxConcurrency: int
+    
+    :param idleTimeout: Seconds an idle connection is kept before being evicted from the pool. Optional, defaults to ``30``.
+    :type idleTimeout: float
+    
+    :param timeout: Timeout in seconds of a whole request. Optional, defaults to ``None`` (no timeout).
+    :type timeout: float
+    
+    :param connectTimeout: Timeout in seconds to establish a connection. Optional, defaults to ``None`` (no timeout).
+    :type connectTimeout: float
+    
+    .. note::
+    
+       - A pool must only be used from the event loop it was first used in.
+       - A connection that cannot be established raises :class:`GameJoltConnectError`.
+    """
+    
+    def __init__(self, maxSize=10, maxConcurrency=100, idleTimeout=30.0, timeout=None, connectTimeout=None):
+        # type: (int, int, float, float, float) -> None
         
-        :param sort: This is a numerical sorting value associated with the score. All sorting will be based on this number. Example: ``500``
-        :type sort: int
+        self.maxSize = maxSize
+        self.maxConcurrency = maxConcurrency
+        self.idleTimeout = idleTimeout
+        self.timeout = timeout
+        self.connectTimeout = connectTimeout
+        self._semaphore = None
+        self._idle = {} # (scheme, host, port) -> [[reader, writer, lastUsed], ...]
         
-        :param tableId: The ID of the score table to submit to.
-        :type table_id: int
+    async def _getConnection(self, hostKey):
+        # type: (tuple) -> tuple
         
-        :param guest: The guest's name. Overrides the ``username`` set in the constructor.
-        :type guest: str
+        now = _monotonic()
+        idle = self._idle.get(hostKey)
         
-        :param extraData: If there's any extra data you would like to store as a string, you can use this variable.
-        :type extra_data: str
+        while idle:
+            reader, writer, lastUsed = idle.pop()
+            
+            if now - lastUsed <= self.idleTimeout and not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+            
+        scheme, host, port = hostKey
+        sslContext = _ssl._create_default_https_context() if scheme == "https" else None
         
-        .. note::
-           
-           - You can either store a score for a user or a guest. If you're storing for a user, you must pass in the ``username`` and ``userToken`` parameters in the class constructor and leave ``guest`` as ``None``. If you're storing for a guest, you must pass in the ``guest`` parameter.
-           - The ``extraData`` value is only retrievable through the API and your game's dashboard. It's never displayed publicly to users on the site. If there is other data associated with the score such as time played, coins collected, etc., you should definitely include it. It will be helpful in cases where you believe a gamer has illegitimately achieved a high score.
-           - If ``tableId`` is left blank, the score will be submitted to the primary high score table.
+        try:
+            reader, writer = await _asyncio.wait_for(_asyncio.open_connection(host, port, ssl=sslContext), self.connectTimeout)
+        except (OSError, _asyncio.TimeoutError) as exception:
+            raise GameJoltConnectError(host + ":" + str(port)) from exception
+            
+        return reader, writer, False
         
-        """
+    def _releaseConnection(self, hostKey, reader, writer):
+        # type: (tuple, _asyncio.StreamReader, _asyncio.StreamWriter) -> None
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "score" : score,
-            "sort" : sort
-        }
+        idle = self._idle.setdefault(hostKey, [])
         
-        # Optional data
-        optionalData = {
-            "username" : self.username if guest is None else None,
-            "user_token" : self.userToken if guest is None else None,
-            "table_id" : tableId,
-            "guest" : guest if guest is not None else None,
-            "extra_data" : extraData,
-        }
+        if len(idle) < self.maxSize:
+            idle.append([reader, writer, _monotonic()])
+        else:
+            writer.close()
+            
+    async def _readResponse(self, reader, timings=None, sentAt=0.0):
+        # type: (_asyncio.StreamReader, dict, float) -> tuple
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
-        return self._submit(self.operations["scores/add"], data)
+        statusLine = await reader.readline()
         
-    def scoresGetRank(self, sort, tableId=None):
-        # type: (int, int) -> dict
+        if not statusLine:
+            raise _RemoteDisconnected("Connection closed by the server without response")
+            
+        if timings is not None:
+            firstByte = _perfCounter()
+            timings["ttfb"] = firstByte - sentAt
+            
+        statusParts = statusLine.decode("latin-1").split(" ", 2)
+        status = int(statusParts[1])
+        reason = statusParts[2].strip() if len(statusParts) > 2 else ""
+        headers = {}
         
-        """Returns the rank of a particular score on a score table.
+        while True:
+            line = await reader.readline()
+            
+            if line in (b"\r\n", b"\n", b""):
+                break
+                
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+            
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                
+                if size == 0:
+                    await reader.readline()
+                    break
+                    
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b"".join(chunks)
+            
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+            
+        else:
+            body = await reader.read()
+            headers["connection"] = "close"
+            
+        if timings is not None:
+            timings["read"] = _perfCounter() - firstByte
+            
+        willClose = headers.get("connection", "").lower() == "close"
+        return status, reason, headers, body, willClose
         
-        :param sort: This is a numerical sorting value that is represented by a rank on the score table.
-        :type sort: int
+    async def _request(self, url, method, body, headers, timings):
+        # type: (str, str, bytes, dict, dict) -> bytes
         
-        :param tableId: The ID of the score table from which you want to get the rank.
-        :type tableId: int
+        start = _perfCounter() if timings is not None else 0.0
+        splitUrl = _urlsplit(url)
+        scheme = splitUrl.scheme.lower()
+        port = splitUrl.port or (443 if scheme == "https" else 80)
+        hostKey = (scheme, splitUrl.hostname, port)
+        target = (splitUrl.path or "/") + ("?" + splitUrl.query if splitUrl.query else "")
+        host = splitUrl.hostname if splitUrl.port is None else splitUrl.hostname + ":" + str(port)
         
-        .. note::
-           
-           - If ``tableId`` is left blank, the ranks from the primary high score table will be returned.
-           - If the score is not represented by any rank on the score table, the request will return the rank that is closest to the requested score.
-        """
+        requestHeaders = {"Host" : host, "Accept-Encoding" : "identity", "Connection" : "keep-alive"}
+        requestHeaders.update(headers if headers is not None else {})
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "sort" : sort
-        }
+        if body is not None:
+            requestHeaders["Content-Length"] = str(len(body))
+            
+        head = method + " " + target + " HTTP/1.1\r\n"
+        head += "".join([name + ": " + value + "\r\n" for name, value in requestHeaders.items()]) + "\r\n"
         
-        # Optional data
-        optionalData = {
-            "table_id" : tableId,
-        }
+        while True:
+            reader, writer, reused = await self._getConnection(hostKey)
+            
+            if timings is not None:
+                connected = _perfCounter()
+                timings["connect"] = connected - start
+                
+            try:
+                if body is None or isinstance(body, (bytes, bytearray)):
+                    writer.write(head.encode("latin-1") + (body if body is not None else b""))
+                else:
+                    writer.write(head.encode("latin-1"))
+                    
+                    for chunk in body:
+                        writer.write(chunk)
+                        await writer.drain()
+                        
+                await writer.drain()
+            except OSError as exception:
+                writer.close()
+                
+                # The request did not go out, so it can be sent again on a fresh connection
+                if reused:
+                    continue
+                raise GameJoltConnectError(hostKey[1] + ":" + str(port)) from exception
+                
+            try:
+                status, reason, responseHeaders, responseBody, willClose = await self._readResponse(reader, timings, connected if timings is not None else 0.0)
+                
+            except _RemoteDisconnected:
+                writer.close()
+                
+                # Server closed the kept alive connection without answering, retry once on a fresh one
+                if reused:
+                    continue
+                raise
+                
+            except (OSError, _asyncio.IncompleteReadError):
+                # The server may have processed the request, let the retry policy decide
+                writer.close()
+                raise
+                
+            if willClose:
+                writer.close()
+            else:
+                self._releaseConnection(hostKey, reader, writer)
+                
+            if status >= 400:
+                raise _HTTPError(url, status, reason, responseHeaders, _BytesIO(responseBody))
+                
+            return responseBody
+            
+    async def request(self, url, method="GET", body=None, headers=None, timings=None):
+        # type: (str, str, bytes, dict, dict) -> bytes
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
-        return self._submit(self.operations["scores/get-rank"], data)
+        """Performs a request through a pooled connection and returns the response body.
         
-    # Trophies
-    def trophiesFetch(self, achieved=None, trophyId=None):
-        # type: (bool, str | int | list) -> dict
+        :param url: The absolute URL to request.
+        :type url: str
         
-        """Returns one trophy or multiple trophies, depending on the parameters passed in.
+        :param method: The HTTP method. Optional, defaults to ``"GET"``.
+        :type method: str
         
-        :param achieved: Pass in ``True`` to return only the achieved trophies for a user. Pass in ``False`` to return only trophies the user hasn't achieved. Leave blank to retrieve all trophies.
-        :type achieved: bool
+        :param body: The request body. Optional.
+        :type body: bytes
         
-        :param trophyId: If you would like to return just one trophy, you may pass the trophy ID with this parameter. If you do, only that trophy will be returned in the response. You may also pass multiple trophy IDs here if you want to return a subset of all the trophies. You do this as a list or a string with comma-separated values in the same way you would for retrieving multiple users (example: ``"13,89,35"``). Passing a ``trophyId`` will ignore the ``achieved`` parameter if it is passed.
-        :type trophyId: str, int or list
+        :param headers: Additional request headers. Optional.
+        :type headers: dict
         
-        """
+        :param timings: A dictionary receiving the ``"connect"``, ``"ttfb"`` and ``"read"`` durations in seconds. Optional.
+        :type timings: dict
         
-        if type(trophyId) in (list, tuple, set):
-            trophyId = ",".join(trophyId)
+        :raises urllib.error.HTTPError: If the server responds with an error status code."""
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+        if self._semaphore is None:
+            self._semaphore = _asyncio.Semaphore(self.maxConcurrency)
+            
+        async with self._semaphore:
+            if self.timeout is None:
+                return await self._request(url, method, body, headers, timings)
+            return await _asyncio.wait_for(self._request(url, method, body, headers, timings), self.timeout)
+            
+    async def close(self):
+        # type: () -> None
         
-        # Optional data
-        optionalData = {
-            "achieved" : self._processBoolean(achieved) if trophyId is None else None,
-            "trophy_id" : trophyId
-        }
+        """Closes all idle connections of the pool."""
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
+        idle = self._idle
+        self._idle = {}
         
-        return self._submit(self.operations["trophies/fetch"], data)
+        for entries in idle.values():
+            for reader, writer, lastUsed in entries:
+                writer.close()
+
+
+class _GameJoltMultipartBody:
+    """ A ``multipart/form-data`` request body streamed from strings, bytes-like objects 
+    or binary files without copying them into one buffer. It can be iterated more than 
+    once, so a request can be retried on a new connection."""
+    
+    CHUNK_SIZE = 65536
+    
+    def __init__(self, fields):
+        # type: (dict) -> None
         
-    def trophiesAddAchieved(self, trophyId):
-        # type: (int) -> dict
+        self.boundary = _uuid4().hex
+        self.contentType = "multipart/form-data; boundary=" + self.boundary
+        self._parts = [] # [(header, value, start, size), ...]
+        self._end = ("--" + self.boundary + "--\r\n").encode()
+        self._length = len(self._end)
         
-        """Sets a trophy as achieved for a particular user.
+        for name, value in fields.items():
+            header = ("--" + self.boundary + "\r\nContent-Disposition: form-data; name=\"" + name + "\"\r\n\r\n").encode()
+            
+            if hasattr(value, "read"):
+                start = value.tell()
+                size = value.seek(0, 2) - start
+                value.seek(start)
+            else:
+                value = value.encode() if isinstance(value, str) else memoryview(value).cast("B")
+                start, size = 0, len(value)
+                
+            self._parts.append((header, value, start, size))
+            self._length += len(header) + size + 2
+            
+    def __len__(self):
+        # type: () -> int
         
-        :param trophyId: The ID of the trophy to add for the user.
-        :type trophyId: int
-        """
+        return self._length
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "username" : self.username,
-            "user_token" : self.userToken,
-            "trophy_id" : trophyId
-        }
+    def __iter__(self):
+        for header, value, start, size in self._parts:
+            yield header
+            
+            if hasattr(value, "read"):
+                value.seek(start)
+                remaining = size
+                
+                while remaining > 0:
+                    chunk = value.read(min(self.CHUNK_SIZE, remaining))
+                    
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+            else:
+                for i in range(0, size, self.CHUNK_SIZE):
+                    yield value[i:i + self.CHUNK_SIZE]
+                    
+            yield b"\r\n"
+            
+        yield self._end
+
+
+class GameJoltResponseCache:
+    """ A thread-safe LRU cache of API responses with a time to live per operation. 
+    Passed as ``cache`` to :class:`GameJoltAPI`, responses of the cached operations are 
+    served from memory until they expire. Entries are keyed by the signed request URL, 
+    so a cache can be shared by instances of different users.
+    
+    :param maxSize: The maximum amount of cached responses. The least recently used ones are evicted first. Optional, defaults to ``1024``.
+    :type maxSize: int
+    
+    :param ttls: Seconds each response is kept per operation name (the keys of :attr:`GameJoltAPI.operations`), updating the default ones. A TTL of ``0`` or ``None`` disables caching of that operation. Optional.
+    :type ttls: dict
+    
+    .. note::
+    
+       - By default ``"scores/tables"``, ``"trophies/fetch"``, ``"users/fetch"`` and ``"time"`` are cached.
+       - Write operations, including the ones sent through :meth:`GameJoltAPI.batch`, invalidate the cached responses of the related read operations. For example ``"scores/add"`` invalidates ``"scores/fetch"`` and ``"scores/get-rank"``.
+       - Cached responses are shared between callers and must not be modified.
+       - Concurrent misses of the same request are coalesced: the first one is sent, the others wait for its response, counted in ``coalesced``.
+       
+    .. code-block:: python
+       
+       cache = gamejoltapi.GameJoltResponseCache(ttls={"scores/fetch" : 10})
+       api = gamejoltapi.GameJoltAPI(GAME_ID, PRIVATE_KEY, cache=cache)
+       
+    """
+    
+    DEFAULT_TTLS = {
+        "scores/tables" : 300.0,
+        "trophies/fetch" : 60.0,
+        "users/fetch" : 300.0,
+        "time" : 1.0,
+    }
+    
+    # Write operation -> read operations whose responses it changes
+    INVALIDATES = {
+        "sessions/open" : ["sessions/check"],
+        "sessions/close" : ["sessions/check"],
+        "scores/add" : ["scores/fetch", "scores/get-rank"],
+        "trophies/add-achieved" : ["trophies/fetch"],
+        "trophies/remove-achieved" : ["trophies/fetch"],
+        "data-store/set" : ["data-store/fetch", "data-store/get-keys"],
+        "data-store/update" : ["data-store/fetch"],
+        "data-store/remove" : ["data-store/fetch", "data-store/get-keys"],
+    }
+    
+    def __init__(self, maxSize=1024, ttls=None):
+        # type: (int, dict) -> None
         
-        self._validateRequiredData(data)
+        self.maxSize = maxSize
+        self.ttls = dict(self.DEFAULT_TTLS)
+        self.ttls.update(ttls if ttls is not None else {})
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._lock = _threading.Lock()
+        self._entries = _OrderedDict() # url -> [operation, expiresAt, response]
+        self._operationUrls = {} # operation -> {url, ...}
+        self._inFlight = {} # url -> _Future of the request sent for a miss
         
-        return self._submit(self.operations["trophies/add-achieved"], data)
+    def _remove(self, url):
+        # type: (str) -> None
         
-    def trophiesRemoveAchieved(self, trophyId):
-        # type: (int) -> dict
+        operation = self._entries.pop(url)[0]
+        self._operationUrls[operation].discard(url)
         
-        """Remove a previously achieved trophy for a particular user.
+    def get(self, operation, url):
+        # type: (str, str) -> dict
         
-        :param trophyId: The ID of the trophy to remove from the user.
-        :type trophyId: int
-        """
+        """Returns the cached response of a request.
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "username" : self.username,
-            "user_token" : self.userToken,
-            "trophy_id" : trophyId
-        }
+        :param operation: The operation name.
+        :type operation: str
         
-        self._validateRequiredData(data)
+        :param url: The signed request URL.
+        :type url: str
         
-        return self._submit(self.operations["trophies/remove-achieved"], data)
-    
-    # Data Storage
+        :return: The cached response, or ``None`` if not cached or expired.
+        :rtype: dict"""
+        
+        if not self.ttls.get(operation):
+            return None
+            
+        with self._lock:
+            return self._getLocked(url)
+            
+    def _getLocked(self, url):
+        # type: (str) -> dict
+        
+        entry = self._entries.get(url)
+        
+        if entry is not None and entry[1] > _monotonic():
+            self._entries.move_to_end(url)
+            self.hits += 1
+            return entry[2]
+            
+        if entry is not None:
+            self._remove(url)
+        self.misses += 1
+        return None
+        
+    def lookup(self, operation, url):
+        # type: (str, str) -> tuple
+        
+        """Same as :meth:`get`, but coalesces concurrent misses of the same request. The 
+        first miss must send the request, then call :meth:`put` with its response or 
+        :meth:`release` if it fails. The next misses get a future of that response.
+        
+        :param operation: The operation name.
+        :type operation: str
+        
+        :param url: The signed request URL.
+        :type url: str
+        
+        :return: The cached response or ``None``, and the future of the same request in flight or ``None``.
+        :rtype: tuple"""
+        
+        if not self.ttls.get(operation):
+            return None, None
+            
+        with self._lock:
+            response = self._getLocked(url)
+            
+            if response is not None:
+                return response, None
+                
+            future = self._inFlight.get(url)
+            
+            if future is not None:
+                self.coalesced += 1
+                return None, future
+                
+            self._inFlight[url] = _Future()
+            return None, None
+            
+    def release(self, url, exception=None):
+        # type: (str, Exception) -> None
+        
+        """Ends a request sent after a :meth:`lookup` miss without a response. The futures 
+        of the waiting requests raise its exception, or return ``None`` if it was interrupted 
+        so they can send the request themselves.
+        
+        :param url: The signed request URL.
+        :type url: str
+        
+        :param exception: The exception raised by the request. Optional.
+        :type exception: Exception"""
+        
+        with self._lock:
+            future = self._inFlight.pop(url, None)
+            
+        if future is not None and exception is not None:
+            future.set_exception(exception)
+        elif future is not None:
+            future.set_result(None)
+            
+    def put(self, operation, url, response):
+        # type: (str, str, dict) -> None
+        
+        """Stores the response of a request if its operation is cached, and invalidates 
+        the operations changed by it. Unsuccessful JSON responses are not cached.
+        
+        :param operation: The operation name.
+        :type operation: str
+        
+        :param url: The signed request URL.
+        :type url: str
+        
+        :param response: The response of the request.
+        :type response: dict"""
+        
+        self.invalidateFor(operation)
+        ttl = self.ttls.get(operation)
+        
+        with self._lock:
+            future = self._inFlight.pop(url, None)
+            
+            if ttl and not (isinstance(response, dict) and response.get("success") not in ("true", True)):
+                if url in self._entries:
+                    self._remove(url)
+                    
+                self._entries[url] = [operation, _monotonic() + ttl, response]
+                self._operationUrls.setdefault(operation, set()).add(url)
+                
+                while len(self._entries) > self.maxSize:
+                    self._remove(next(iter(self._entries)))
+                    
+        # Also shares unsuccessful responses with the coalesced requests
+        if future is not None:
+            future.set_result(response)
+            
+    def invalidate(self, operation=None):
+        # type: (str) -> None
+        
+        """Removes the cached responses of an operation.
+        
+        :param operation: The operation name. Optional, removes all cached responses if ``None``.
+        :type operation: str"""
+        
+        with self._lock:
+            if operation is None:
+                self._entries.clear()
+                self._operationUrls.clear()
+                return
+                
+            for url in list(self._operationUrls.get(operation, ())):
+                self._remove(url)
+                
+    def invalidateFor(self, operation):
+        # type: (str) -> None
+        
+        """Removes the cached responses of the operations changed by a write operation.
+        
+        :param operation: The name of the write operation.
+        :type operation: str"""
+        
+        for invalidated in self.INVALIDATES.get(operation, ()):
+            self.invalidate(invalidated)
+
+
+class GameJoltRequestEvent(_namedtuple("GameJoltRequestEvent", ["operation", "outcome", "exception", "retries", "responseSize", "build", "connect", "ttfb", "read", "parse", "total"])):
+    """ Describes a submitted request, passed to the observers added with 
+    :meth:`GameJoltAPI.addObserver`. Durations are in seconds, and are ``None`` for the 
+    phases the request did not go through.
+    
+    .. py:attribute:: operation
+       :type: str
+       
+        The name of the operation, one of the keys of :attr:`GameJoltAPI.operations`.
+    
+    .. py:attribute:: outcome
+       :type: str
+       
+        ``"success"``, ``"failure"`` if the API answered with ``success`` false, ``"cached"`` if served by the cache or ``"error"`` if an exception was raised.
+    
+    .. py:attribute:: exception
+       :type: Exception
+       
+        The raised exception, or ``None``.
+    
+    .. py:attribute:: retries
+       :type: int
+       
+        The amount of retried attempts.
+    
+    .. py:attribute:: responseSize
+       :type: int
+       
+        The size of the response body in bytes.
+    
+    .. py:attribute:: build
+       :type: float
+       
+        Time spent building and signing the request URL.
+    
+    .. py:attribute:: connect
+       :type: float
+       
+        Time spent getting a connection from the pool, including establishing a new one, for the last attempt.
+    
+    .. py:attribute:: ttfb
+       :type: float
+       
+        Time from sending the request until the first byte of the response, for the last attempt.
+    
+    .. py:attribute:: read
+       :type: float
+       
+        Time spent reading the response, for the last attempt.
+    
+    .. py:attribute:: parse
+       :type: float
+       
+        Time spent parsing the response.
+    
+    .. py:attribute:: total
+       :type: float
+       
+        Time spent in the whole call, including retries and rate limiting."""
+    
+    __slots__ = ()
+
+
+class GameJoltHistogram:
+    """ A log-linear histogram of durations in the style of HdrHistogram. Values are kept 
+    with a microsecond resolution in buckets whose width grows with the value, so it uses 
+    little memory and the relative error of its percentiles is below 1%. It is not 
+    thread-safe, :class:`GameJoltMetrics` records them under a lock.
+    
+    .. py:attribute:: count
+       :type: int
+       
+        The amount of recorded values.
+    
+    .. py:attribute:: sum
+       :type: float
+       
+        The sum of the recorded values, in seconds."""
+    
+    SIGNIFICANT_BITS = 8
+    
+    def __init__(self):
+        # type: () -> None
+        
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._counts = {} # Lower bound of the bucket in microseconds -> count
+        
+    def record(self, seconds):
+        # type: (float) -> None
+        
+        """Records a duration.
+        
+        :param seconds: The duration in seconds.
+        :type seconds: float"""
+        
+        value = max(0, int(seconds * 1000000))
+        shift = value.bit_length() - self.SIGNIFICANT_BITS
+        bucket = value >> shift << shift if shift > 0 else value
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        
+    def buckets(self):
+        # type: () -> list[tuple[float, int]]
+        
+        """Returns the non-empty buckets.
+        
+        :return: A sorted list of ``(upperBound, count)`` tuples, with the bound in seconds.
+        :rtype: list"""
+        
+        result = []
+        
+        for bucket in sorted(self._counts):
+            shift = bucket.bit_length() - self.SIGNIFICANT_BITS
+            result.append(((bucket + (1 << shift) if shift > 0 else bucket + 1) / 1000000, self._counts[bucket]))
+        return result
+        
+    def percentile(self, percent):
+        # type: (float) -> float
+        
+        """Returns a percentile of the recorded values.
+        
+        :param percent: The percentile, from ``0`` to ``100``.
+        :type percent: float
+        
+        :return: The upper bound in seconds of the bucket holding the percentile, or ``None`` if nothing was recorded.
+        :rtype: float"""
+        
+        if not self.count:
+            return None
+            
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        
+        for upperBound, count in self.buckets():
+            seen += count
+            
+            if seen >= rank:
+                return min(upperBound, self.max)
+        return self.max
+
+
+class GameJoltMetrics:
+    """ An observer for :meth:`GameJoltAPI.addObserver` collecting a :class:`GameJoltHistogram` 
+    per operation and phase, and counters of outcomes, retries and response bytes. The 
+    collected metrics can be exported in the Prometheus / OpenMetrics text format.
+    
+    :param buckets: The upper bounds in seconds of the exported histogram buckets. Optional, defaults to :attr:`DEFAULT_BUCKETS`.
+    :type buckets: list[float]
+    
+    :param prefix: The prefix of the exported metric names. Optional, defaults to ``"gamejolt"``.
+    :type prefix: str
+    
+    .. code-block:: python
+       
+       metrics = gamejoltapi.GameJoltMetrics()
+       api.addObserver(metrics)
+       
+       print(metrics.percentile("scores/add", 99))
+       print(metrics.exportOpenMetrics())
+       
+    """
+    
+    PHASES = ("total", "build", "connect", "ttfb", "read", "parse")
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self, buckets=None, prefix="gamejolt"):
+        # type: (list[float], str) -> None
+        
+        self.buckets = sorted(buckets if buckets is not None else self.DEFAULT_BUCKETS)
+        self.prefix = prefix
+        self._lock = _threading.Lock()
+        self._histograms = {} # operation -> {phase : GameJoltHistogram}
+        self._outcomes = {} # (operation, outcome) -> count
+        self._retries = {} # operation -> count
+        self._responseBytes = {} # operation -> bytes
+        
+    def __call__(self, event):
+        # type: (GameJoltRequestEvent) -> None
+        
+        operation = event.operation
+        
+        with self._lock:
+            histograms = self._histograms.get(operation)
+            
+            if histograms is None:
+                histograms = self._histograms[operation] = {phase : GameJoltHistogram() for phase in self.PHASES}
+                
+            for phase in self.PHASES:
+                value = getattr(event, phase)
+                
+                if value is not None:
+                    histograms[phase].record(value)
+                    
+            self._outcomes[(operation, event.outcome)] = self._outcomes.get((operation, event.outcome), 0) + 1
+            self._retries[operation] = self._retries.get(operation, 0) + event.retries
+            self._responseBytes[operation] = self._responseBytes.get(operation, 0) + (event.responseSize or 0)
+            
+    def histogram(self, operation, phase="total"):
+        # type: (str, str) -> GameJoltHistogram
+        
+        """Returns the live histogram of an operation phase.
+        
+        :param operation: The operation name.
+        :type operation: str
+        
+        :param phase: One of :attr:`PHASES`. Optional, defaults to ``"total"``.
+        :type phase: str
+        
+        :return: The histogram, or ``None`` if the operation was never observed.
+        :rtype: GameJoltHistogram"""
+        
+        with self._lock:
+            return self._histograms.get(operation, {}).get(phase)
+            
+    def percentile(self, operation, percent, phase="total"):
+        # type: (str, float, str) -> float
+        
+        """Returns a percentile in seconds of an operation phase, or ``None`` if not observed.
+        
+        :param operation: The operation name.
+        :type operation: str
+        
+        :param percent: The percentile, from ``0`` to ``100``.
+        :type percent: float
+        
+        :param phase: One of :attr:`PHASES`. Optional, defaults to ``"total"``.
+        :type phase: str
+        
+        :rtype: float"""
+        
+        with self._lock:
+            histogram = self._histograms.get(operation, {}).get(phase)
+            return histogram.percentile(percent) if histogram is not None else None
+            
+    def exportOpenMetrics(self):
+        # type: () -> str
+        
+        """Returns the collected metrics in the OpenMetrics text format, also accepted by Prometheus.
+        
+        :rtype: str"""
+        
+        duration = self.prefix + "_request_duration_seconds"
+        requests = self.prefix + "_requests"
+        retries = self.prefix + "_request_retries"
+        responseBytes = self.prefix + "_response_bytes"
+        lines = [
+            "# TYPE %s histogram" % duration,
+            "# UNIT %s seconds" % duration,
+            "# HELP %s Duration of the Game Jolt API requests per operation and phase." % duration,
+        ]
+        
+        with self._lock:
+            for operation in sorted(self._histograms):
+                for phase in self.PHASES:
+                    histogram = self._histograms[operation][phase]
+                    
+                    if not histogram.count:
+                        continue
+                        
+                    labels = 'operation="%s",phase="%s"' % (operation, phase)
+                    histogramBuckets = histogram.buckets()
+                    
+                    for bound in self.buckets:
+                        count = sum([count for upperBound, count in histogramBuckets if upperBound <= bound])
+                        lines.append('%s_bucket{%s,le="%r"} %d' % (duration, labels, float(bound), count))
+                        
+                    lines.append('%s_bucket{%s,le="+Inf"} %d' % (duration, labels, histogram.count))
+                    lines.append("%s_count{%s} %d" % (duration, labels, histogram.count))
+                    lines.append("%s_sum{%s} %r" % (duration, labels, histogram.sum))
+                    
+            lines.extend(["# TYPE %s counter" % requests, "# HELP %s Game Jolt API requests per operation and outcome." % requests])
+            
+            for (operation, outcome), count in sorted(self._outcomes.items()):
+                lines.append('%s_total{operation="%s",outcome="%s"} %d' % (requests, operation, outcome, count))
+                
+            lines.extend(["# TYPE %s counter" % retries, "# HELP %s Retried attempts of Game Jolt API requests per operation." % retries])
+            
+            for operation, count in sorted(self._retries.items()):
+                lines.append('%s_total{operation="%s"} %d' % (retries, operation, count))
+                
+            lines.extend([
+                "# TYPE %s counter" % responseBytes,
+                "# UNIT %s bytes" % responseBytes,
+                "# HELP %s Size of the Game Jolt API responses per operation." % responseBytes,
+            ])
+            
+            for operation, count in sorted(self._responseBytes.items()):
+                lines.append('%s_total{operation="%s"} %d' % (responseBytes, operation, count))
+                
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class GameJoltAPI:
+    """ The main Game Jolt API class. Aside from the required arguments, most of the 
+    optional arguments are provided to avoid asking for them in every single method.
+    
+    :param gameId: The game ID. Required in all requests.
+    :type gameId: int
+    
+    :param privateKey: The API private key. Required in all requests.
+    :type privateKey: str
+    
+    :param username: Username used in some requests. Optional.
+    :type username: str
+    
+    :param userToken: User access token used in some requests. Optional.
+    :type userToken: str
+    
+    :param responseFormat: The response format of the requests. Can be ``"json"``, ``"xml"``, ``"keypair"`` or ``"dump"``. Optional, defaults to ``"json"``.
+    :type responseFormat: str
+    
+    :param submitRequests: If submit the requests or just get the generated URLs from the method calls. To generate URLs for batch requests prefer :attr:`build`, which is thread-safe. Optional, defaults to ``True``.
+    :type submitRequests: bool
+    
+    :param connectionPool: The pool of persistent connections used to submit the requests. Optional, defaults to a pool shared by all instances.
+    :type connectionPool: GameJoltConnectionPool
+    
+    :param apiUrl: The base URL of the API. Optional, defaults to ``"https://api.gamejolt.com/api/game/v1_2"``.
+    :type apiUrl: str
+    
+    :param cache: A cache of the responses of read-only operations. Optional, defaults to ``None`` (no caching).
+    :type cache: GameJoltResponseCache
+    
+    :param retryPolicy: The policy retrying requests which failed with transient errors. Optional, defaults to ``None`` (no retries).
+    :type retryPolicy: GameJoltRetryPolicy
+    
+    :param circuitBreaker: A circuit breaker rejecting requests while the API is failing. Optional, defaults to ``None``.
+    :type circuitBreaker: GameJoltCircuitBreaker
+    
+    :param rateLimiter: A rate limiter delaying the requests, usually shared by all instances of the game. Optional, defaults to ``None`` (no limit).
+    :type rateLimiter: GameJoltRateLimiter
+    
+    .. py:attribute:: gameId
+       :type: int
+       
+       The game ID. Required in all requests.
+    
+    .. py:attribute:: privateKey
+       :type: str
+       
+        The API private key. Required in all requests.
+    
+    .. py:attribute:: username
+       :type: str
+       
+        Username used in some requests. Optional.
+    
+    .. py:attribute:: userToken
+       :type: str
+       
+        User access token used in some requests. Optional.
+    
+    .. py:attribute:: responseFormat
+       :type: str
+       
+        The response format of the requests. Can be ``"json"``, ``"xml"``, ``"keypair"`` or ``"dump"``. Optional, defaults to ``"json"``.
+    
+    .. py:attribute:: submitRequests
+       :type: bool
+       
+        If submit the requests or just get the generated URLs from the method calls. To generate URLs for batch requests prefer :attr:`build`, which is thread-safe. Optional, defaults to ``True``.
+        
+    .. py:attribute:: connectionPool
+       :type: GameJoltConnectionPool
+       
+        The pool of persistent connections used to submit the requests.
+        
+    .. py:attribute:: cache
+       :type: GameJoltResponseCache
+       
+        The cache of the responses of read-only operations, or ``None``.
+        
+    .. py:attribute:: retryPolicy
+       :type: GameJoltRetryPolicy
+       
+        The policy retrying requests which failed with transient errors, or ``None``.
+        
+    .. py:attribute:: circuitBreaker
+       :type: GameJoltCircuitBreaker
+       
+        The circuit breaker rejecting requests while the API is failing, or ``None``.
+        
+    .. py:attribute:: rateLimiter
+       :type: GameJoltRateLimiter
+       
+        The rate limiter delaying the requests, or ``None``.
+        
+    .. py:attribute:: observers
+       :type: list
+       
+        The callables receiving a :class:`GameJoltRequestEvent` after every submitted request. See :meth:`addObserver`.
+        
+    .. py:attribute:: postThreshold
+       :type: int
+       
+        Data-store values longer than this amount of characters, as well as bytes-like objects and files, are sent in a POST request body instead of the URL. Defaults to ``2048``.
+        
+    .. py:attribute:: build
+       :type: GameJoltRequestBuilder
+       
+        Has the same API methods as this instance, but they return a signed :class:`GameJoltRequest` instead of submitting it. Safe to use concurrently with live calls."""
+    
+    def __init__(self, gameId, privateKey, username=None, userToken=None, responseFormat="json", submitRequests=True, connectionPool=None, apiUrl=None, cache=None, retryPolicy=None, circuitBreaker=None, rateLimiter=None):
+        # type: (int, str, str, str, str, bool, GameJoltConnectionPool, str, GameJoltResponseCache, GameJoltRetryPolicy, GameJoltCircuitBreaker, GameJoltRateLimiter) -> None
+        
+        self.__API_URL = apiUrl.rstrip("/") if apiUrl is not None else "https://api.gamejolt.com/api/game/v1_2"
+        self.__RETURN_FORMATS = ["json", "keypair", "dump", "xml"]
+        
+        self.gameId = str(gameId)
+        self.privateKey = privateKey
+        self.username = username
+        self.userToken = userToken
+        self.responseFormat = responseFormat if responseFormat in self.__RETURN_FORMATS else "json"
+        self.submitRequests = submitRequests
+        self.connectionPool = connectionPool if connectionPool is not None else _getDefaultConnectionPool()
+        self.cache = cache
+        self.retryPolicy = retryPolicy
+        self.circuitBreaker = circuitBreaker
+        self.rateLimiter = rateLimiter
+        self.observers = []
+        self.postThreshold = 2048
+        self.build = GameJoltRequestBuilder(self)
+        self.operations = {
+            "users/fetch" : self.__API_URL + "/users/" + "?",
+            "users/auth" : self.__API_URL + "/users/auth/" + "?",
+            "sessions/open" : self.__API_URL + "/sessions/open/" + "?",
+            "sessions/ping" : self.__API_URL + "/sessions/ping/" + "?",
+            "sessions/check" : self.__API_URL + "/sessions/check/" + "?",
+            "sessions/close" : self.__API_URL + "/sessions/close/" + "?",
+            "scores/fetch" : self.__API_URL + "/scores/" + "?",
+            "scores/tables" : self.__API_URL + "/scores/tables/" + "?",
+            "scores/add" : self.__API_URL + "/scores/add/" + "?",
+            "scores/get-rank" : self.__API_URL + "/scores/get-rank/" + "?",
+            "trophies/fetch" : self.__API_URL + "/trophies/" + "?",
+            "trophies/add-achieved" : self.__API_URL + "/trophies/add-achieved/" + "?",
+            "trophies/remove-achieved" : self.__API_URL + "/trophies/remove-achieved/" + "?",
+            "data-store/set" : self.__API_URL + "/data-store/set/" + "?",
+            "data-store/update" : self.__API_URL + "/data-store/update/" + "?",
+            "data-store/remove" : self.__API_URL + "/data-store/remove/" + "?",
+            "data-store/fetch" : self.__API_URL + "/data-store/" + "?",
+            "data-store/get-keys" : self.__API_URL + "/data-store/get-keys/" + "?",
+            "friends" : self.__API_URL + "/friends/" + "?",
+            "time" : self.__API_URL + "/time/" + "?",
+            "batch" : self.__API_URL + "/batch/" + "?",
+        }
+        self._operationNames = {url : name for name, url in self.operations.items()}
+        self._signaturePrefixes = {} # operationUrl -> md5 state seeded with the URL
+        self._encodedParams = {} # (key, value) -> "key=value" for the parameters of _STATIC_PARAMS
+        
+    def forUser(self, username, userToken=None):
+        # type: (str, str) -> GameJoltUserHandle
+        
+        """Returns a lightweight handle sending requests as another user. The handle only stores 
+        the user credentials and shares everything else with this instance: the game config, 
+        connection pool, cache, retry policy, circuit breaker and rate limiter. Use it instead of 
+        one :class:`GameJoltAPI` per player when serving many players.
+        
+        :param username: The username.
+        :type username: str
+        
+        :param userToken: The user access token. Optional.
+        :type userToken: str
+        
+        :return: A :class:`GameJoltUserHandle`, or an :class:`AsyncGameJoltUserHandle` for :class:`AsyncGameJoltAPI`.
+        :rtype: GameJoltUserHandle
+        
+        .. code-block:: python
+           
+           client = gamejoltapi.GameJoltAPI(GAME_ID, PRIVATE_KEY)
+           
+           player = client.forUser(USERNAME, TOKEN)
+           player.sessionsOpen()
+           player.trophiesAddAchieved(TROPHY_ID)
+           
+        """
+        
+        if isinstance(self, AsyncGameJoltAPI):
+            return AsyncGameJoltUserHandle(self, username, userToken)
+        return GameJoltUserHandle(self, username, userToken)
+        
+    # Only the parameters with the same value in every call, user credentials vary across handles
+    _STATIC_PARAMS = frozenset(["game_id", "format"])
+    
+    def _encodeParam(self, key, value):
+        # type: (str, object) -> str
+        
+        # Same encoding as urllib.parse.urlencode
+        if key in self._STATIC_PARAMS:
+            encoded = self._encodedParams.get((key, value))
+            
+            if encoded is None:
+                encoded = self._encodedParams[(key, value)] = key + "=" + _quotePlus(value if isinstance(value, (str, bytes)) else str(value))
+            return encoded
+            
+        return _quotePlus(key) + "=" + _quotePlus(value if isinstance(value, (str, bytes)) else str(value))
+        
+    def _buildRequestUrl(self, operationUrl, data):
+        # type: (str, dict) -> str
+        
+        isBatch = "batch" in operationUrl
+        
+        if not self.submitRequests and "format" in data:
+            data.pop("format")
+            
+        requestUrls = data.pop("requests") if isBatch else []
+        params = [self._encodeParam(key, data[key]) for key in sorted(data)]
+        params.extend(["requests[]=" + url for url in requestUrls])
+        urlParams = "&".join(params)
+        
+        # The signature is the md5 of the URL followed by the private key, so the hash of the static URL is computed once
+        prefix = self._signaturePrefixes.get(operationUrl)
+        
+        if prefix is None:
+            prefix = self._signaturePrefixes[operationUrl] = _md5(operationUrl.encode())
+            
+        signature = prefix.copy()
+        signature.update((urlParams + self.privateKey).encode())
+        return operationUrl + urlParams + "&signature=" + signature.hexdigest()
+        
+    def _parseResponse(self, response):
+        # type: (bytes) -> dict
+        
+        if self.responseFormat == "json":
+            return _jsonLoads(response)["response"]
+        else:
+            return response.decode()
+            
+    def _takePostData(self, data, key):
+        # type: (dict, str) -> dict
+        
+        value = data[key]
+        
+        if hasattr(value, "read") or isinstance(value, (bytes, bytearray, memoryview)) or len(str(value)) > self.postThreshold:
+            return {key : data.pop(key)}
+        return None
+        
+    def _mergePostData(self, data, postData):
+        # type: (dict, dict) -> dict
+        
+        # Generated URLs cannot carry a body, so the POST data goes back to the query string
+        for key, value in (postData if postData is not None else {}).items():
+            value = value.read() if hasattr(value, "read") else value
+            data[key] = bytes(value) if isinstance(value, (bytearray, memoryview)) else value
+        return data
+        
+    def _postRequestArgs(self, postData):
+        # type: (dict) -> tuple
+        
+        if postData is None:
+            return "GET", None, None
+            
+        body = _GameJoltMultipartBody(postData)
+        return "POST", body, {"Content-Type" : body.contentType, "Content-Length" : str(len(body))}
+        
+    def _retryDelay(self, operation, exception, attempt):
+        # type: (str, BaseException, int) -> float
+        
+        transient = _isTransientError(exception)
+        
+        if self.circuitBreaker is not None:
+            if transient:
+                self.circuitBreaker.recordFailure()
+            else:
+                self.circuitBreaker.recordSuccess()
+                
+        if self.retryPolicy is None:
+            return None
+        return self.retryPolicy.retryDelay(operation, exception, attempt)
+        
+    def addObserver(self, observer):
+        # type: (callable) -> None
+        
+        """Adds a callable called with a :class:`GameJoltRequestEvent` after every submitted 
+        request, with its timings, response size, retries and outcome. Observers are called 
+        from the thread (or event loop) which sent the request, so they must be fast. Requests 
+        are only timed while at least one observer is added.
+        
+        :param observer: The callable, for example a :class:`GameJoltMetrics` instance.
+        :type observer: callable
+        
+        .. code-block:: python
+           
+           metrics = gamejoltapi.GameJoltMetrics()
+           api.addObserver(metrics)
+           
+           # Serve metrics.exportOpenMetrics() on the /metrics endpoint of the game server
+           
+        """
+        
+        self.observers = self.observers + [observer]
+        
+    def removeObserver(self, observer):
+        # type: (callable) -> None
+        
+        """Removes an observer added with :meth:`addObserver`.
+        
+        :param observer: The callable.
+        :type observer: callable"""
+        
+        self.observers = [item for item in self.observers if item is not observer]
+        
+    def _notifyObservers(self, operation, timings, outcome, exception=None):
+        # type: (str, dict, str, BaseException) -> None
+        
+        event = GameJoltRequestEvent(
+            operation, outcome, exception, timings.get("retries", 0), timings.get("size"), timings.get("build"),
+            timings.get("connect"), timings.get("ttfb"), timings.get("read"), timings.get("parse"), _perfCounter() - timings["start"],
+        )
+        
+        for observer in self.observers:
+            try:
+                observer(event)
+            except Exception as observerException:
+                if _DEBUG: print("Observer failed:", repr(observerException))
+                
+    def _responseOutcome(self, response):
+        # type: (dict) -> str
+        
+        if isinstance(response, dict) and not self._isSuccess(response):
+            return "failure"
+        return "success"
+        
+    def _sendRequest(self, operation, url, method, body, headers, timings=None):
+        # type: (str, str, str, object, dict, dict) -> bytes
+        
+        attempt = 0
+        
+        while True:
+            if timings is not None:
+                timings["retries"] = attempt
+                
+            trial = self.circuitBreaker is not None and self.circuitBreaker.beforeRequest()
+            
+            try:
+                if self.rateLimiter is not None:
+                    self.rateLimiter.acquire(operation, self)
+                    
+                response = self.connectionPool.request(url, method, body, headers, timings)
+                
+            except Exception as exception:
+                # The outcome of the trial is recorded here
+                trial = False
+                delay = self._retryDelay(operation, exception, attempt)
+                
+                if delay is None:
+                    raise
+                    
+                if _DEBUG: print("Retrying in %.3f seconds:" % delay, repr(exception))
+                attempt += 1
+                _sleep(delay)
+                continue
+                
+            else:
+                if self.circuitBreaker is not None:
+                    self.circuitBreaker.recordSuccess()
+                return response
+                
+            finally:
+                # A trial stopped without an outcome, such as a cancelled task, must not keep the breaker half-open
+                if trial:
+                    self.circuitBreaker.releaseTrial()
+            
+    def _prepareRequest(self, operationUrl, data, postData=None, resultType=None):
+        # type: (str, dict, dict, type) -> tuple
+        
+        # Returns the arguments of _sendRequest, or None and the result if nothing has to be sent.
+        # Only timed while observed
+        timings = {"start" : _perfCounter()} if self.observers else None
+        
+        if not self.submitRequests:
+            data = self._mergePostData(data, postData)
+            
+        finalUrl = self._buildRequestUrl(operationUrl, data)
+        
+        if not self.submitRequests:
+            if _DEBUG: print("Generated URL:", finalUrl)
+            return None, finalUrl
+            
+        if resultType is not None and self.responseFormat != "json":
+            raise ValueError("Typed results require the \"json\" response format, not \"%s\"" % self.responseFormat)
+            
+        operation = self._operationNames[operationUrl]
+        
+        if timings is not None:
+            timings["build"] = _perfCounter() - timings["start"]
+            
+        inFlight = None
+        
+        if self.cache is not None:
+            cached, inFlight = self.cache.lookup(operation, finalUrl)
+            
+            if cached is not None:
+                if timings is not None:
+                    self._notifyObservers(operation, timings, "cached")
+                return None, resultType(cached) if resultType is not None else cached
+                
+        if _DEBUG: print("Requesting URL:", finalUrl)
+        method, body, headers = self._postRequestArgs(postData)
+        
+        # With the future of the same request in flight, whose response is waited for instead of sending it
+        return (operation, finalUrl, method, body, headers, timings), inFlight
+        
+    def _requestFailed(self, request, exception):
+        # type: (tuple, BaseException) -> None
+        
+        operation, finalUrl, method, body, headers, timings = request
+        
+        # A cancelled task or an interrupt is not a failure of the coalesced requests
+        if self.cache is not None:
+            self.cache.release(finalUrl, exception if isinstance(exception, Exception) else None)
+            
+        if timings is not None:
+            self._notifyObservers(operation, timings, "error", exception)
+            
+    def _sharedResponse(self, request, response, resultType=None):
+        # type: (tuple, dict, type) -> dict
+        
+        operation, finalUrl, method, body, headers, timings = request
+        
+        if timings is not None:
+            self._notifyObservers(operation, timings, "cached")
+        return resultType(response) if resultType is not None else response
+        
+    def _processResponse(self, request, responseBody, resultType=None):
+        # type: (tuple, bytes, type) -> dict
+        
+        operation, finalUrl, method, body, headers, timings = request
+        
+        try:
+            if timings is not None:
+                parseStart = _perfCounter()
+                timings["size"] = len(responseBody)
+                
+            response = self._parseResponse(responseBody)
+            
+        except Exception as exception:
+            self._requestFailed(request, exception)
+            raise
+            
+        if timings is not None:
+            timings["parse"] = _perfCounter() - parseStart
+            self._notifyObservers(operation, timings, self._responseOutcome(response))
+            
+        if self.cache is not None:
+            self.cache.put(operation, finalUrl, response)
+        return resultType(response) if resultType is not None else response
+        
+    def _submit(self, operationUrl, data, postData=None, resultType=None):
+        # type: (str, dict, dict, type) -> dict
+        
+        request, result = self._prepareRequest(operationUrl, data, postData, resultType)
+        
+        if request is None:
+            return result
+            
+        # The same request is in flight, its response is shared
+        while result is not None:
+            response = result.result()
+            
+            if response is not None:
+                return self._sharedResponse(request, response, resultType)
+                
+            response, result = self.cache.lookup(request[0], request[1])
+            
+            if response is not None:
+                return self._sharedResponse(request, response, resultType)
+                
+        try:
+            responseBody = self._sendRequest(*request)
+        except BaseException as exception:
+            self._requestFailed(request, exception)
+            raise
+            
+        return self._processResponse(request, responseBody, resultType)
+
+    def _validateRequiredData(self, data):
+        # type: (dict) -> bool
+        
+        for key in data.keys():
+            if data[key] is None:
+                raise GameJoltDataRequired(key)
+        return True
+        
+    def _getValidData(self, data):
+        # type: (dict) -> dict
+        
+        validatedData = {}
+        if self.responseFormat != "json":
+            validatedData["format"] = self.responseFormat
+        
+        for key in data.keys():
+            if data[key] is not None:
+                validatedData[key] = data[key]
+        return validatedData
+    
+    def _processBoolean(self, value):
+        # type: (bool) -> str
+        
+        if value is not None:
+            return str(value).lower()
+    
+    # Users
+    def usersFetch(self, username=None, userId=None, typed=False):
+        # type: (str, str | int | list, bool) -> dict
+        
+        """Returns a user's data.
+        
+        :param username: The username of the user whose data you'd like to fetch.
+        :type username: str
+        
+        :param userId: The ID of the user whose data you'd like to fetch.
+        :type userId: str, int or list
+        
+        :param typed: Returns a compact :class:`GameJoltUsers` instead of a dict. Requires the ``"json"`` response format. Optional, defaults to ``False``.
+        :type typed: bool
+        
+        .. note::
+           
+           - Only one parameter, ``username`` or ``userId``, is required.
+           - You can pass in multiple user ids by providing a list or separating them with commas in a string (example: ``"13,89,35"``)."""
+        
+        if type(userId) in (list, tuple, set):
+            userId = ",".join([str(item) for item in userId])
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId
+        }
+            
+        if username is not None: 
+            data["username"] = username
+            
+        elif userId is not None: 
+            data["user_id"] = userId
+        
+        else:
+            data["username"] = self.username
+        
+        self._validateRequiredData(data)
+        return self._submit(self.operations["users/fetch"], data, resultType=GameJoltUsers if typed else None)
+        
+    def usersAuth(self):
+        # type: () -> dict
+        
+        """Authenticates the user's information. This should be done before you make 
+        any calls for the user, to make sure the user's credentials (username and 
+        token) are valid."""
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        self._validateRequiredData(data)
+        return self._submit(self.operations["users/auth"], data)
+    
+    # Sessions
+    def sessionsOpen(self):
+        # type: () -> dict
+        
+        """Opens a game session for a particular user and allows you to tell Game Jolt 
+        that a user is playing your game. You must ping the session to keep it active 
+        and you must close it when you're done with it.
+        
+        .. note::
+           You can only have one open session for a user at a time. If you try to open a new session while one is running, the system will close out the current one before opening the new one.
+        
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        self._validateRequiredData(data)
+        return self._submit(self.operations["sessions/open"], data)
+        
+    def sessionsPing(self, status=None):
+        # type: (str) -> dict
+        
+        """Pings an open session to tell the system that it's still active. If the session 
+        hasn't been pinged within 120 seconds, the system will close the session and you 
+        will have to open another one. It's recommended that you ping about every 30 
+        seconds or so to keep the system from clearing out your session.
+        
+        You can also let the system know whether the player is in an active or idle state 
+        within your game.
+        
+        :param status: Sets the status of the session.
+        :type status: str
+        
+        .. note::
+           Valid Values for ``status``:
+           
+           - ``"active"``: Sets the session to the ``"active"`` state.
+           - ``"idle"``: Sets the session to the ``"idle"`` state.
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        # Optional data
+        optionalData = {
+            "status" : status # active or idle
+        }
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        return self._submit(self.operations["sessions/ping"], data)
+    
+    def sessionsCheck(self):
+        # type: () -> dict
+        
+        """Checks to see if there is an open session for the user. Can be used to see 
+        if a particular user account is active in the game.
+        
+        .. note::
+           
+           This endpoint returns ``"false"`` for the ``"success"`` field when no open session exists. That behaviour is different from other endpoints which use this field to indicate an error state.
+
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        self._validateRequiredData(data)
+        return self._submit(self.operations["sessions/check"], data)
+        
+    def sessionsClose(self):
+        # type: () -> dict
+        
+        """Closes the active session."""
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        self._validateRequiredData(data)
+        return self._submit(self.operations["sessions/close"], data)
+        
+    # Scores
+    def scoresFetch(self, limit=None, tableId=None, guest=None, betterThan=None, worseThan=None, thisUser=False, typed=False):
+        # type: (int, int, str, int, int, bool, bool) -> dict
+        
+        """Returns a list of scores either for a user or globally for a game.
+        
+        :param limit: The number of scores you'd like to return.
+        :type limit: int
+        
+        :param tableId: The ID of the score table.
+        :type tableId: int
+        
+        :param guest: A guest's name.
+        :type guest: str
+        
+        :param betterThan: Fetch only scores better than this score sort value.
+        :type betterThan: int
+        
+        :param worseThan: Fetch only scores worse than this score sort value.
+        :type worseThan: int
+        
+        :param thisUser: If ``True``, fetch only scores of current user. Else, fetch scores of all users.
+        :type thisUser: bool
+        
+        :param typed: Returns a compact :class:`GameJoltScores` instead of a dict. Requires the ``"json"`` response format. Optional, defaults to ``False``.
+        :type typed: bool
+        
+        .. note::
+           
+           - The default value for ``limit`` is ``10`` scores. The maximum amount of scores you can retrieve is ``100``.
+           - If ``tableId`` is left blank, the scores from the primary score table will be returned.
+           - Only pass in ``thisUser=True`` if you would like to retrieve scores for just the user set in the class constructor. Leave ``thisUser=False`` and ``guest=None`` to retrieve all scores.
+           - ``guest`` allows you to fetch scores by a specific guest name. Only pass either the ``thisUser=True`` or the ``guest`` (or none), never both.
+           - Scores are returned in the order of the score table's sorting direction. e.g. for descending tables the bigger scores are returned first.
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId
+        }
+        
+        # Optional data
+        optionalData = {
+            "username" : self.username if guest is None and thisUser else None,
+            "user_token" : self.userToken if guest is None and thisUser else None,
+            "limit" : limit,
+            "table_id" : tableId,
+            "guest" : guest if guest is not None and not thisUser else None,
+            "better_than" : betterThan,
+            "worse_than" : worseThan,
+        }
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        
+        return self._submit(self.operations["scores/fetch"], data, resultType=GameJoltScores if typed else None)
+        
+    def scoresTables(self, typed=False):
+        # type: (bool) -> dict
+        
+        """Returns a list of high score tables for a game.
+        
+        :param typed: Returns a compact :class:`GameJoltTables` instead of a dict. Requires the ``"json"`` response format. Optional, defaults to ``False``.
+        :type typed: bool"""
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId
+        }
+        
+        self._validateRequiredData(data)
+        return self._submit(self.operations["scores/tables"], data, resultType=GameJoltTables if typed else None)
+        
+    def scoresAdd(self, score, sort, tableId=None, guest=None, extraData=None):
+        # type: (str, int, int, str, str) -> dict
+        
+        """Adds a score for a user or guest. 
+        
+        :param score: This is a string value associated with the score. Example: ``"500 Points"``
+        :type score: str
+        
+        :param sort: This is a numerical sorting value associated with the score. All sorting will be based on this number. Example: ``500``
+        :type sort: int
+        
+        :param tableId: The ID of the score table to submit to.
+        :type table_id: int
+        
+        :param guest: The guest's name. Overrides the ``username`` set in the constructor.
+        :type guest: str
+        
+        :param extraData: If there's any extra data you would like to store as a string, you can use this variable.
+        :type extra_data: str
+        
+        .. note::
+           
+           - You can either store a score for a user or a guest. If you're storing for a user, you must pass in the ``username`` and ``userToken`` parameters in the class constructor and leave ``guest`` as ``None``. If you're storing for a guest, you must pass in the ``guest`` parameter.
+           - The ``extraData`` value is only retrievable through the API and your game's dashboard. It's never displayed publicly to users on the site. If there is other data associated with the score such as time played, coins collected, etc., you should definitely include it. It will be helpful in cases where you believe a gamer has illegitimately achieved a high score.
+           - If ``tableId`` is left blank, the score will be submitted to the primary high score table.
+        
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "score" : score,
+            "sort" : sort
+        }
+        
+        # Optional data
+        optionalData = {
+            "username" : self.username if guest is None else None,
+            "user_token" : self.userToken if guest is None else None,
+            "table_id" : tableId,
+            "guest" : guest if guest is not None else None,
+            "extra_data" : extraData,
+        }
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        return self._submit(self.operations["scores/add"], data)
+        
+    def scoresGetRank(self, sort, tableId=None):
+        # type: (int, int) -> dict
+        
+        """Returns the rank of a particular score on a score table.
+        
+        :param sort: This is a numerical sorting value that is represented by a rank on the score table.
+        :type sort: int
+        
+        :param tableId: The ID of the score table from which you want to get the rank.
+        :type tableId: int
+        
+        .. note::
+           
+           - If ``tableId`` is left blank, the ranks from the primary high score table will be returned.
+           - If the score is not represented by any rank on the score table, the request will return the rank that is closest to the requested score.
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "sort" : sort
+        }
+        
+        # Optional data
+        optionalData = {
+            "table_id" : tableId,
+        }
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        return self._submit(self.operations["scores/get-rank"], data)
+        
+    # Trophies
+    def trophiesFetch(self, achieved=None, trophyId=None, typed=False):
+        # type: (bool, str | int | list, bool) -> dict
+        
+        """Returns one trophy or multiple trophies, depending on the parameters passed in.
+        
+        :param achieved: Pass in ``True`` to return only the achieved trophies for a user. Pass in ``False`` to return only trophies the user hasn't achieved. Leave blank to retrieve all trophies.
+        :type achieved: bool
+        
+        :param trophyId: If you would like to return just one trophy, you may pass the trophy ID with this parameter. If you do, only that trophy will be returned in the response. You may also pass multiple trophy IDs here if you want to return a subset of all the trophies. You do this as a list or a string with comma-separated values in the same way you would for retrieving multiple users (example: ``"13,89,35"``). Passing a ``trophyId`` will ignore the ``achieved`` parameter if it is passed.
+        :type trophyId: str, int or list
+        
+        :param typed: Returns a compact :class:`GameJoltTrophies` instead of a dict. Requires the ``"json"`` response format. Optional, defaults to ``False``.
+        :type typed: bool
+        """
+        
+        if type(trophyId) in (list, tuple, set):
+            trophyId = ",".join([str(item) for item in trophyId])
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        # Optional data
+        optionalData = {
+            "achieved" : self._processBoolean(achieved) if trophyId is None else None,
+            "trophy_id" : trophyId
+        }
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        
+        return self._submit(self.operations["trophies/fetch"], data, resultType=GameJoltTrophies if typed else None)
+        
+    def trophiesAddAchieved(self, trophyId):
+        # type: (int) -> dict
+        
+        """Sets a trophy as achieved for a particular user.
+        
+        :param trophyId: The ID of the trophy to add for the user.
+        :type trophyId: int
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "username" : self.username,
+            "user_token" : self.userToken,
+            "trophy_id" : trophyId
+        }
+        
+        self._validateRequiredData(data)
+        
+        return self._submit(self.operations["trophies/add-achieved"], data)
+        
+    def trophiesRemoveAchieved(self, trophyId):
+        # type: (int) -> dict
+        
+        """Remove a previously achieved trophy for a particular user.
+        
+        :param trophyId: The ID of the trophy to remove from the user.
+        :type trophyId: int
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "username" : self.username,
+            "user_token" : self.userToken,
+            "trophy_id" : trophyId
+        }
+        
+        self._validateRequiredData(data)
+        
+        return self._submit(self.operations["trophies/remove-achieved"], data)
+    
+    # Data Storage
     def dataStoreSet(self, key, data, globalData=False):
         # type: (str, str, bool) -> dict
         
-        """Sets data in the data store.
+        """Sets data in the data store.
+        
+        :param key: The key of the data item you'd like to set.
+        :type key: str
+        
+        :param data: The data you'd like to set. Can also be a bytes-like object or a file opened in binary mode.
+        :type data: str, bytes or file
+        
+        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
+        :type globalData: bool
+        
+        .. note::
+           
+           - You can create new data store items by passing in a key that doesn't yet exist in the data store.
+           - Data longer than :attr:`postThreshold`, bytes-like objects and files are streamed in a POST request body instead of the URL. The request signature is still computed from the URL.
+        
+        .. code-block:: python
+           
+           # Store on the key "some_global_value" the data "500" in the global data store
+           result = api.dataStoreSet("some_global_value", "500", globalData=True)
+           
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "key" : key,
+            "data" : data
+        }
+        
+        # Optional data
+        optionalData = {
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        # Process global data instead of user data
+        if globalData:
+            optionalData["username"] = None
+            optionalData["user_token"] = None
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        postData = self._takePostData(data, "data")
+        
+        return self._submit(self.operations["data-store/set"], data, postData)
+        
+    def dataStoreUpdate(self, key, operation, value, globalData=False):
+        # type: (str, str, str, bool) -> dict
+        
+        """Updates data in the data store.
+        
+        :param key: The key of the data item you'd like to update.
+        :type key: str
+        
+        :param operation: The operation you'd like to perform.
+        :type operation: str
+        
+        :param value: The value you'd like to apply to the data store item. (See values below.) Values longer than :attr:`postThreshold` are sent in a POST request body.
+        :type value: str
+        
+        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
+        :type globalData: bool
+        
+        .. note::
+        
+           Valid Values for ``operation``:
+           
+           - ``"add"``: Adds the ``value`` to the current data store item.
+           - ``"subtract"``: Substracts the ``value`` from the current data store item.
+           - ``"multiply"``: Multiplies the ``value`` by the current data store item.
+           - ``"divide"``: Divides the current data store item by the ``value``.
+           - ``"append"``: Appends the ``value`` to the current data store item.
+           - ``"prepend"``: Prepends the ``value`` to the current data store item.
+        
+        .. note::
+        
+           You can only perform mathematic operations on numerical data.
+        
+        .. code-block:: python
+           
+           # Adds "100" to "some_global_value" in the global data store
+           result = api.dataStoreUpdate("some_global_value", "add", "100", globalData=True)
+           
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "key" : key,
+            "operation" : operation,
+            "value" : value
+        }
+        
+        # Optional data
+        optionalData = {
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        # Process global data instead of user data
+        if globalData:
+            optionalData["username"] = None
+            optionalData["user_token"] = None
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        postData = self._takePostData(data, "value")
+        
+        return self._submit(self.operations["data-store/update"], data, postData)
+        
+    def dataStoreRemove(self, key, globalData=False):
+        # type: (str, bool) -> dict
+        
+        """Removes data from the data store.
+        
+        :param key: The key of the data item you'd like to remove.
+        :type key: str
+        
+        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
+        :type globalData: bool
+        
+        .. code-block:: python
+           
+           # Remove "some_global_value" from global data store
+           result = api.dataStoreRemove("some_global_value", globalData=True)
+           
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "key" : key
+        }
+        
+        # Optional data
+        optionalData = {
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        # Process global data instead of user data
+        if globalData:
+            optionalData["username"] = None
+            optionalData["user_token"] = None
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        
+        return self._submit(self.operations["data-store/remove"], data)
+        
+    def dataStoreFetch(self, key, globalData=False):
+        # type: (str, bool) -> dict
+        
+        """Returns data from the data store.
+        
+        :param key: The key of the data item you'd like to fetch.
+        :type key: str
+        
+        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
+        :type globalData: bool
+        
+        .. code-block:: python
+           
+           # Get "some_global_value" from global data store
+           result = api.dataStoreFetch("some_global_value", globalData=True)
+           
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "key" : key
+        }
+        
+        # Optional data
+        optionalData = {
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        # Process global data instead of user data
+        if globalData:
+            optionalData["username"] = None
+            optionalData["user_token"] = None
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        
+        return self._submit(self.operations["data-store/fetch"], data)
+        
+    def dataStoreGetKeys(self, pattern=None, globalData=False):
+        # type: (str, bool) -> dict
+        
+        """Returns either all the keys in the game's global data store, or all the keys in a user's data store.
+        
+        :param pattern: The pattern to apply to the key names in the data store.
+        :type pattern: str
+        
+        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
+        :type globalData: bool
+        
+        .. note::
+           
+           - If you apply a pattern to the request, only keys with applicable key names will be returned. The placeholder character for patterns is ``*``.
+           - This request will return a list of the ``key`` values. The ``key`` return value can appear more than once.
+        
+        .. code-block:: python
+           
+           # Get keys from global data store starting with "some_global"
+           result = api.dataStoreGetKeys("some_global_*", globalData=True)
+           
+        """
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId
+        }
+        
+        # Optional data
+        optionalData = {
+            "username" : self.username,
+            "user_token" : self.userToken,
+            "pattern" : pattern
+        }
+        
+        # Process global data instead of user data
+        if globalData:
+            optionalData["username"] = None
+            optionalData["user_token"] = None
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        
+        return self._submit(self.operations["data-store/get-keys"], data)
+        
+    # Friends
+    def friends(self):
+        # type: () -> dict
+        
+        """Returns the list of a user's friends."""
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "username" : self.username,
+            "user_token" : self.userToken
+        }
+        
+        self._validateRequiredData(data)
+        
+        return self._submit(self.operations["friends"], data)
+    
+    # Time
+    def time(self):
+        # type: () -> dict
+        
+        """Returns the time of the Game Jolt server."""
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId
+        }
+        
+        self._validateRequiredData(data)
+        return self._submit(self.operations["time"], data)
+    
+    # Batch Calls
+    def batch(self, requests=[], parallel=None, breakOnError=None):
+        # type: (list[GameJoltRequest | str], bool, bool) -> dict
+        
+        """A batch request is a collection of sub-requests that enables developers to send multiple API calls with one HTTP request. 
+        
+        :param requests: An list of sub-requests generated by :attr:`build`, or their URLs. Each request will be executed and the responses of each one will be returned in the payload.
+        :type requests: list of GameJoltRequest or str
+        
+        :param parallel: By default, each sub-request is processed on the servers sequentially. If this is set to ``True``, then all sub-requests are processed at the same time, without waiting for the previous sub-request to finish before the next one is started.
+        :type parallel: bool
+        
+        :param breakOnError: If this is set to ``True``, one sub-request failure will cause the entire batch to stop processing subsequent sub-requests and return a value of ``"false"`` for success.
+        :type breakOnError: bool
+        
+        .. note::
+           - The maximum amount of sub requests in one batch request is 50. Use :meth:`batchMany` to submit more.
+           - Dump format is not supported in batch calls.
+           - The ``parallel`` and ``breakOnError`` parameters cannot be used in the same request.
+        
+        .. code-block:: python
+           
+           # Generate list of sub-requests without submitting them
+           requests = [
+               api.build.usersFetch(),
+               api.build.sessionsCheck(),
+               api.build.scoresTables(),
+               api.build.trophiesFetch(),
+               api.build.dataStoreGetKeys("*", globalData=True),
+               api.build.friends(),
+               api.build.time()
+           ]
+           
+           # Submit batch request and get all results
+           result = api.batch(requests=requests)
+        
+        """
+        
+        if parallel is not None and breakOnError is not None:
+            raise GameJoltDataCollision(["parallel", "break_on_error"])
+        
+        subRequests = []
+        
+        for request in requests:
+            if self.cache is not None and self.submitRequests:
+                operation = request.operation if isinstance(request, GameJoltRequest) else self._operationNames.get(request.split("?")[0] + "?")
+                self.cache.invalidateFor(operation)
+                
+            request = request.url if isinstance(request, GameJoltRequest) else request
+            request = request.replace(self.__API_URL, "")
+            request = request.split("&signature=")[0]
+            request += "&signature=" + _md5((request + self.privateKey).encode()).hexdigest()
+            subRequests.append(_quote(request, safe=""))
+        requests = subRequests
+        
+        # Required data
+        data = {
+            "game_id" : self.gameId,
+            "requests" : requests if len(requests) > 0 else None
+        }
+        
+        # Optional data
+        optionalData = {
+            "parallel" : self._processBoolean(parallel),
+            "break_on_error" : self._processBoolean(breakOnError)
+        }
+        
+        self._validateRequiredData(data)
+        data.update(self._getValidData(optionalData))
+        
+        return self._submit(self.operations["batch"], data)
+        
+    def _isSuccess(self, response):
+        # type: (dict) -> bool
+        
+        return response is not None and response.get("success") in ("true", True)
+        
+    def _failedChunk(self, exception):
+        # type: (Exception) -> dict
+        
+        response = {"success" : "false", "message" : repr(exception)}
+        
+        if _isNotProcessed(exception):
+            response["processed"] = "false"
+        return response
+        
+    def _mergeBatchResponses(self, chunks, chunkResponses):
+        # type: (list, list) -> dict
+        
+        responses = []
+        chunkResults = []
+        
+        for chunk, response in zip(chunks, chunkResponses):
+            if response is None:
+                response = {"success" : "false", "message" : "Not processed, a previous chunk failed"}
+                
+            subResponses = response.get("responses", [])[:len(chunk)]
+            responses.extend(subResponses + [None] * (len(chunk) - len(subResponses)))
+            chunkResults.append({key : value for key, value in response.items() if key != "responses"})
+            
+        return {
+            "success" : "true" if all([self._isSuccess(result) for result in chunkResults]) else "false",
+            "responses" : responses,
+            "chunks" : chunkResults,
+        }
+        
+    def batchMany(self, requests, parallel=None, breakOnError=None, maxWorkers=4):
+        # type: (list[GameJoltRequest | str], bool, bool, int) -> dict
+        
+        """Submits any amount of sub-requests, split into batch requests of 50 sub-requests 
+        (the server limit) sent concurrently. The arguments are the same as :meth:`batch`.
+        
+        :param maxWorkers: The maximum amount of batch requests in flight at the same time. Optional, defaults to ``4``.
+        :type maxWorkers: int
+        
+        :return: A dict with the ``"responses"`` of all sub-requests in the original order, a ``"chunks"`` list with the result of each batch request (without its responses) and a ``"success"`` field which is ``"false"`` if any of them failed.
+        :rtype: dict
+        
+        .. note::
+           
+           - Only the ``"json"`` response format is supported.
+           - A batch request failing due to a connection or HTTP error is reported in its ``"chunks"`` entry instead of raising, and the responses of its sub-requests are ``None``. The entry has ``"processed"`` set to ``"false"`` when the server certainly did not process it (:class:`GameJoltConnectError` or status ``429``).
+           - If ``breakOnError`` is ``True`` the batch requests are sent one after another, and the ones after a failed batch request are not sent, so no sub-request is processed after a failure.
+        
+        .. code-block:: python
+           
+           # Fetch hundreds of keys using as few HTTP requests as possible
+           result = api.batchMany([api.build.dataStoreFetch(key, globalData=True) for key in keys])
+           values = [response["data"] for response in result["responses"]]
+           
+        """
+        
+        if parallel is not None and breakOnError is not None:
+            raise GameJoltDataCollision(["parallel", "break_on_error"])
+            
+        chunks = [requests[i:i + _BATCH_LIMIT] for i in range(0, len(requests), _BATCH_LIMIT)]
+        
+        def sendChunk(chunk):
+            try:
+                return self.batch(chunk, parallel=parallel, breakOnError=breakOnError)
+            except (_HTTPException, OSError) as exception:
+                return self._failedChunk(exception)
+                
+        if breakOnError:
+            chunkResponses = []
+            
+            for chunk in chunks:
+                if chunkResponses and not self._isSuccess(chunkResponses[-1]):
+                    chunkResponses.append(None)
+                else:
+                    chunkResponses.append(sendChunk(chunk))
+                    
+        elif len(chunks) > 1:
+            with _ThreadPoolExecutor(min(maxWorkers, len(chunks))) as executor:
+                chunkResponses = list(executor.map(sendChunk, chunks))
+                
+        else:
+            chunkResponses = [sendChunk(chunk) for chunk in chunks]
+            
+        return self._mergeBatchResponses(chunks, chunkResponses)
+        
+    def _dataStoreKeyChunks(self, response):
+        # type: (dict) -> list
+        
+        if not self._isSuccess(response):
+            return []
+            
+        # The same key can appear more than once
+        keys = list(_OrderedDict.fromkeys([item["key"] for item in response.get("keys", [])]))
+        return [keys[i:i + _BATCH_LIMIT] for i in range(0, len(keys), _BATCH_LIMIT)]
+        
+    def _dataStoreChunkResponses(self, chunk, response):
+        # type: (list, dict) -> list
+        
+        # Skipping the keys of a rejected batch request would end the iteration with items missing
+        responses = response.get("responses")
+        
+        if responses is None or len(responses) < len(chunk):
+            raise GameJoltBatchError(response)
+            
+        return responses
+        
+    def iterDataStore(self, pattern=None, globalData=False, prefetch=2):
+        # type: (str, bool, int) -> object
+        
+        """Iterates over the items of the data store, fetching the values lazily in batch 
+        requests of 50 keys. While the items of one batch request are consumed, up to 
+        ``prefetch`` following batch requests are already in flight, so only a bounded 
+        amount of values is held in memory regardless of the size of the data store.
+        
+        :param pattern: The pattern to apply to the key names, same as :meth:`dataStoreGetKeys`. Optional.
+        :type pattern: str
+        
+        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
+        :type globalData: bool
+        
+        :param prefetch: The maximum amount of batch requests in flight ahead of the consumer. Optional, defaults to ``2``.
+        :type prefetch: int
+        
+        :return: A generator of ``(key, value)`` tuples.
+        :rtype: generator
+        
+        .. note::
+           
+           - Only the ``"json"`` response format is supported.
+           - The key names are listed with one ``data-store/get-keys`` request when the iteration starts. Keys removed before their value is fetched are skipped.
+           - A batch request rejected as a whole raises :class:`GameJoltBatchError`, so the iteration never ends early without notice.
+        
+        .. code-block:: python
+           
+           for key, value in api.iterDataStore("player_*", globalData=True):
+               process(key, value)
+               
+        """
+        
+        chunks = iter(self._dataStoreKeyChunks(self.dataStoreGetKeys(pattern, globalData)))
+        pending = _deque()
+        
+        def fetchChunk(chunk):
+            return chunk, self.batch([self.build.dataStoreFetch(key, globalData) for key in chunk])
+            
+        with _ThreadPoolExecutor(max(1, prefetch)) as executor:
+            for chunk in chunks:
+                pending.append(executor.submit(fetchChunk, chunk))
+                
+                if len(pending) >= max(1, prefetch):
+                    break
+                    
+            while pending:
+                chunk, response = pending.popleft().result()
+                nextChunk = next(chunks, None)
+                
+                if nextChunk is not None:
+                    pending.append(executor.submit(fetchChunk, nextChunk))
+                    
+                for key, subResponse in zip(chunk, self._dataStoreChunkResponses(chunk, response)):
+                    if self._isSuccess(subResponse):
+                        yield key, subResponse["data"]
+
+
+class AsyncGameJoltAPI(GameJoltAPI):
+    """ The :mod:`asyncio` version of :class:`GameJoltAPI`. It has the same methods and arguments, 
+    but every API method returns an awaitable instead of blocking until the response arrives. 
+    Requests are sent through a :class:`GameJoltAsyncConnectionPool`, so many of them can be 
+    in flight at the same time.
+    
+    :param connectionPool: The non-blocking pool of persistent connections used to submit the requests. Optional, defaults to a new pool owned by the instance.
+    :type connectionPool: GameJoltAsyncConnectionPool
+    
+    .. note::
+    
+       With ``submitRequests=False`` the methods still have to be awaited and return the generated URLs.
+       
+    .. code-block:: python
+    
+       api = gamejoltapi.AsyncGameJoltAPI(GAME_ID, PRIVATE_KEY, username=USERNAME, userToken=TOKEN)
+       
+       # Run requests concurrently
+       scores, trophies = await asyncio.gather(api.scoresFetch(limit=100), api.trophiesFetch())
+       
+       # Close the pooled connections when done
+       await api.close()
+       
+    """
+    
+    def __init__(self, gameId, privateKey, username=None, userToken=None, responseFormat="json", submitRequests=True, connectionPool=None, apiUrl=None, cache=None, retryPolicy=None, circuitBreaker=None, rateLimiter=None):
+        # type: (int, str, str, str, str, bool, GameJoltAsyncConnectionPool, str, GameJoltResponseCache, GameJoltRetryPolicy, GameJoltCircuitBreaker, GameJoltRateLimiter) -> None
+        
+        connectionPool = connectionPool if connectionPool is not None else GameJoltAsyncConnectionPool()
+        super().__init__(gameId, privateKey, username, userToken, responseFormat, submitRequests, connectionPool, apiUrl, cache, retryPolicy, circuitBreaker, rateLimiter)
+        
+    async def _sendRequest(self, operation, url, method, body, headers, timings=None):
+        # type: (str, str, str, object, dict, dict) -> bytes
+        
+        attempt = 0
+        
+        while True:
+            if timings is not None:
+                timings["retries"] = attempt
+                
+            trial = self.circuitBreaker is not None and self.circuitBreaker.beforeRequest()
+            
+            try:
+                if self.rateLimiter is not None:
+                    await self.rateLimiter.acquireAsync(operation, self)
+                    
+                response = await self.connectionPool.request(url, method, body, headers, timings)
+                
+            except Exception as exception:
+                # The outcome of the trial is recorded here
+                trial = False
+                delay = self._retryDelay(operation, exception, attempt)
+                
+                if delay is None:
+                    raise
+                    
+                if _DEBUG: print("Retrying in %.3f seconds:" % delay, repr(exception))
+                attempt += 1
+                await _asyncio.sleep(delay)
+                continue
+                
+            else:
+                if self.circuitBreaker is not None:
+                    self.circuitBreaker.recordSuccess()
+                return response
+                
+            finally:
+                # A trial stopped without an outcome, such as a cancelled task, must not keep the breaker half-open
+                if trial:
+                    self.circuitBreaker.releaseTrial()
+            
+    async def _submit(self, operationUrl, data, postData=None, resultType=None):
+        # type: (str, dict, dict, type) -> dict
+        
+        request, result = self._prepareRequest(operationUrl, data, postData, resultType)
+        
+        if request is None:
+            return result
+            
+        # The same request is in flight, its response is shared. Shielded, so a cancelled caller does not cancel it for the others
+        while result is not None:
+            response = await _asyncio.shield(_asyncio.wrap_future(result))
+            
+            if response is not None:
+                return self._sharedResponse(request, response, resultType)
+                
+            response, result = self.cache.lookup(request[0], request[1])
+            
+            if response is not None:
+                return self._sharedResponse(request, response, resultType)
+                
+        try:
+            responseBody = await self._sendRequest(*request)
+        except BaseException as exception:
+            self._requestFailed(request, exception)
+            raise
+            
+        return self._processResponse(request, responseBody, resultType)
+        
+    async def batchMany(self, requests, parallel=None, breakOnError=None, maxWorkers=4):
+        # type: (list[GameJoltRequest | str], bool, bool, int) -> dict
+        
+        if parallel is not None and breakOnError is not None:
+            raise GameJoltDataCollision(["parallel", "break_on_error"])
+            
+        chunks = [requests[i:i + _BATCH_LIMIT] for i in range(0, len(requests), _BATCH_LIMIT)]
+        semaphore = _asyncio.Semaphore(maxWorkers)
+        
+        async def sendChunk(chunk):
+            async with semaphore:
+                try:
+                    return await self.batch(chunk, parallel=parallel, breakOnError=breakOnError)
+                except (_HTTPException, OSError, _asyncio.IncompleteReadError, _asyncio.TimeoutError) as exception:
+                    return self._failedChunk(exception)
+                    
+        if breakOnError:
+            chunkResponses = []
+            
+            for chunk in chunks:
+                if chunkResponses and not self._isSuccess(chunkResponses[-1]):
+                    chunkResponses.append(None)
+                else:
+                    chunkResponses.append(await sendChunk(chunk))
+        else:
+            chunkResponses = await _asyncio.gather(*[sendChunk(chunk) for chunk in chunks])
+            
+        return self._mergeBatchResponses(chunks, chunkResponses)
+        
+    async def iterDataStore(self, pattern=None, globalData=False, prefetch=2):
+        # type: (str, bool, int) -> object
+        
+        """The asynchronous generator version of :meth:`GameJoltAPI.iterDataStore`.
+        
+        .. code-block:: python
+           
+           async for key, value in api.iterDataStore("player_*", globalData=True):
+               process(key, value)
+               
+        """
+        
+        chunks = iter(self._dataStoreKeyChunks(await self.dataStoreGetKeys(pattern, globalData)))
+        pending = _deque()
+        
+        async def fetchChunk(chunk):
+            return chunk, await self.batch([self.build.dataStoreFetch(key, globalData) for key in chunk])
+            
+        try:
+            for chunk in chunks:
+                pending.append(_asyncio.ensure_future(fetchChunk(chunk)))
+                
+                if len(pending) >= max(1, prefetch):
+                    break
+                    
+            while pending:
+                chunk, response = await pending.popleft()
+                nextChunk = next(chunks, None)
+                
+                if nextChunk is not None:
+                    pending.append(_asyncio.ensure_future(fetchChunk(nextChunk)))
+                    
+                for key, subResponse in zip(chunk, self._dataStoreChunkResponses(chunk, response)):
+                    if self._isSuccess(subResponse):
+                        yield key, subResponse["data"]
+                        
+        finally:
+            for task in pending:
+                task.cancel()
+                
+    async def close(self):
+        # type: () -> None
+        
+        """Closes the idle pooled connections of this instance."""
+        
+        await self.connectionPool.close()
+
+
+class GameJoltRequest(_namedtuple("GameJoltRequest", ["operation", "url"])):
+    """ An immutable signed request generated by :attr:`GameJoltAPI.build`, ready to be 
+    passed to :meth:`GameJoltAPI.batch`.
+    
+    .. py:attribute:: operation
+       :type: str
+       
+        The name of the operation, one of the keys of :attr:`GameJoltAPI.operations`.
+    
+    .. py:attribute:: url
+       :type: str
+       
+        The signed request URL."""
+    
+    __slots__ = ()
+
+
+def _decodeNumbers(values):
+    # type: (list) -> object
+    
+    numbers = [_toNumber(value) if value not in (None, "") else None for value in values]
+    
+    # Whole numbers are packed in an array, other columns and numbers beyond 64 bits keep a tuple
+    if all([type(number) is int for number in numbers]):
+        try:
+            return _array("q", numbers)
+        except OverflowError:
+            pass
+    return tuple(numbers)
+
+
+def _decodeBooleans(values):
+    # type: (list) -> tuple
+    
+    return tuple([value in ("true", True) for value in values])
+
+
+def _decodeAchieved(values):
+    # type: (list) -> tuple
+    
+    return tuple([value not in (None, "false", False) for value in values])
+
+
+_CATEGORY = "category" # Low cardinality strings, interned when the container is created
+
+
+class GameJoltRecord:
+    """ A row of a :class:`GameJoltRecords` container. It only references the container 
+    and its index, and reads its fields from the container columns."""
+    
+    __slots__ = ("_records", "_index")
+    
+    def __init__(self, records, index):
+        # type: (GameJoltRecords, int) -> None
+        
+        self._records = records
+        self._index = index
+        
+    def asDict(self):
+        # type: () -> dict
+        
+        """Returns the decoded fields of the row.
+        
+        :rtype: dict"""
+        
+        return {attribute : self._records.column(attribute)[self._index] for attribute, key, decoder in self._records.FIELDS}
+        
+    def __eq__(self, other):
+        # type: (object) -> bool
+        
+        return type(other) is type(self) and self.asDict() == other.asDict()
+        
+    def __repr__(self):
+        # type: () -> str
+        
+        return "%s(%s)" % (type(self).__name__, ", ".join(["%s=%r" % item for item in self.asDict().items()]))
+
+
+def _recordField(attribute):
+    # type: (str) -> property
+    
+    return property(lambda record: record._records.column(attribute)[record._index])
+
+
+class GameJoltRecords:
+    """ A compact, read-only container of the records of a response, created by the API 
+    methods called with ``typed=True``. Fields are stored per column instead of one dict 
+    per record, and numeric and boolean columns are only decoded on their first access, 
+    whole numbers being packed into an :class:`array.array`. Records are indexed and 
+    iterated as :class:`GameJoltRecord` rows, and a whole column can be read with :meth:`column`.
+    
+    :param response: The parsed JSON response.
+    :type response: dict
+    
+    .. py:attribute:: success
+       :type: bool
+       
+        If the request succeeded.
+    
+    .. py:attribute:: message
+       :type: str
+       
+        The error message of a failed request, or ``None``."""
+    
+    __slots__ = ("success", "message", "_length", "_columns")
+    
+    KEY = None # Key of the record list in the response
+    RECORD = GameJoltRecord
+    FIELDS = () # (attribute, response key, decoder or None or _CATEGORY)
+    
+    def __init__(self, response):
+        # type: (dict) -> None
+        
+        items = response.get(self.KEY) or []
+        self.success = response.get("success") in ("true", True)
+        self.message = response.get("message")
+        self._length = len(items)
+        self._columns = {}
+        
+        for attribute, key, decoder in self.FIELDS:
+            values = [item.get(key) for item in items]
+            
+            if decoder is None:
+                self._columns[attribute] = tuple(values)
+            elif decoder is _CATEGORY:
+                self._columns[attribute] = tuple([_sys.intern(value) if type(value) is str else value for value in values])
+            else:
+                self._columns[attribute] = values # Decoded on first access
+                
+    def column(self, attribute):
+        # type: (str) -> tuple
+        
+        """Returns all the values of a field, decoding them on the first call.
+        
+        :param attribute: The field name, for example ``"sort"``.
+        :type attribute: str
+        
+        :return: A tuple, or an :class:`array.array` for columns of whole numbers.
+        :rtype: tuple"""
+        
+        values = self._columns[attribute]
+        
+        if type(values) is list:
+            decoder = [field[2] for field in self.FIELDS if field[0] == attribute][0]
+            values = self._columns[attribute] = decoder(values)
+        return values
+        
+    def __len__(self):
+        # type: () -> int
+        
+        return self._length
+        
+    def __getitem__(self, index):
+        # type: (int) -> GameJoltRecord
+        
+        if index < 0:
+            index += self._length
+            
+        if not 0 <= index < self._length:
+            raise IndexError("Record index out of range")
+        return self.RECORD(self, index)
+        
+    def __iter__(self):
+        # type: () -> iter
+        
+        return iter([self.RECORD(self, index) for index in range(self._length)])
+        
+    def __repr__(self):
+        # type: () -> str
+        
+        return "<%s of %d records, success=%r>" % (type(self).__name__, self._length, self.success)
+
+
+class GameJoltScore(GameJoltRecord):
+    """ A score of :class:`GameJoltScores`.
+    
+    .. py:attribute:: score
+       :type: str
+    
+    .. py:attribute:: sort
+       :type: int
+    
+    .. py:attribute:: extraData
+       :type: str
+    
+    .. py:attribute:: user
+       :type: str
+       
+        The username, empty for guest scores.
+    
+    .. py:attribute:: userId
+       :type: int
+       
+        The user ID, ``None`` for guest scores.
+    
+    .. py:attribute:: guest
+       :type: str
+    
+    .. py:attribute:: stored
+       :type: str
+    
+    .. py:attribute:: storedTimestamp
+       :type: int"""
+    
+    __slots__ = ()
+    
+    score = _recordField("score")
+    sort = _recordField("sort")
+    extraData = _recordField("extraData")
+    user = _recordField("user")
+    userId = _recordField("userId")
+    guest = _recordField("guest")
+    stored = _recordField("stored")
+    storedTimestamp = _recordField("storedTimestamp")
+
+
+class GameJoltScores(GameJoltRecords):
+    """ The scores of :meth:`GameJoltAPI.scoresFetch` called with ``typed=True``, as :class:`GameJoltScore` rows.
+    
+    .. code-block:: python
+       
+       scores = api.scoresFetch(limit=100, typed=True)
+       
+       best = scores[0].sort
+       total = sum(scores.column("sort"))
+       
+    """
+    
+    __slots__ = ()
+    
+    KEY = "scores"
+    RECORD = GameJoltScore
+    FIELDS = (
+        ("score", "score", None),
+        ("sort", "sort", _decodeNumbers),
+        ("extraData", "extra_data", None),
+        ("user", "user", _CATEGORY),
+        ("userId", "user_id", _decodeNumbers),
+        ("guest", "guest", _CATEGORY),
+        ("stored", "stored", _CATEGORY),
+        ("storedTimestamp", "stored_timestamp", _decodeNumbers),
+    )
+
+
+class GameJoltUser(GameJoltRecord):
+    """ A user of :class:`GameJoltUsers`.
+    
+    .. py:attribute:: id
+       :type: int
+    
+    .. py:attribute:: type
+       :type: str
+    
+    .. py:attribute:: username
+       :type: str
+    
+    .. py:attribute:: avatarUrl
+       :type: str
+    
+    .. py:attribute:: signedUp
+       :type: str
+    
+    .. py:attribute:: signedUpTimestamp
+       :type: int
+    
+    .. py:attribute:: lastLoggedIn
+       :type: str
+    
+    .. py:attribute:: lastLoggedInTimestamp
+       :type: int
+    
+    .. py:attribute:: status
+       :type: str
+    
+    .. py:attribute:: developerName
+       :type: str
+    
+    .. py:attribute:: developerWebsite
+       :type: str
+    
+    .. py:attribute:: developerDescription
+       :type: str"""
+    
+    __slots__ = ()
+    
+    id = _recordField("id")
+    type = _recordField("type")
+    username = _recordField("username")
+    avatarUrl = _recordField("avatarUrl")
+    signedUp = _recordField("signedUp")
+    signedUpTimestamp = _recordField("signedUpTimestamp")
+    lastLoggedIn = _recordField("lastLoggedIn")
+    lastLoggedInTimestamp = _recordField("lastLoggedInTimestamp")
+    status = _recordField("status")
+    developerName = _recordField("developerName")
+    developerWebsite = _recordField("developerWebsite")
+    developerDescription = _recordField("developerDescription")
+
+
+class GameJoltUsers(GameJoltRecords):
+    """ The users of :meth:`GameJoltAPI.usersFetch` called with ``typed=True``, as :class:`GameJoltUser` rows."""
+    
+    __slots__ = ()
+    
+    KEY = "users"
+    RECORD = GameJoltUser
+    FIELDS = (
+        ("id", "id", _decodeNumbers),
+        ("type", "type", _CATEGORY),
+        ("username", "username", None),
+        ("avatarUrl", "avatar_url", None),
+        ("signedUp", "signed_up", _CATEGORY),
+        ("signedUpTimestamp", "signed_up_timestamp", _decodeNumbers),
+        ("lastLoggedIn", "last_logged_in", _CATEGORY),
+        ("lastLoggedInTimestamp", "last_logged_in_timestamp", _decodeNumbers),
+        ("status", "status", _CATEGORY),
+        ("developerName", "developer_name", None),
+        ("developerWebsite", "developer_website", _CATEGORY),
+        ("developerDescription", "developer_description", _CATEGORY),
+    )
+
+
+class GameJoltTrophy(GameJoltRecord):
+    """ A trophy of :class:`GameJoltTrophies`.
+    
+    .. py:attribute:: id
+       :type: int
+    
+    .. py:attribute:: title
+       :type: str
+    
+    .. py:attribute:: description
+       :type: str
+    
+    .. py:attribute:: difficulty
+       :type: str
+    
+    .. py:attribute:: imageUrl
+       :type: str
+    
+    .. py:attribute:: achieved
+       :type: bool
+       
+        If the user achieved the trophy."""
+    
+    __slots__ = ()
+    
+    id = _recordField("id")
+    title = _recordField("title")
+    description = _recordField("description")
+    difficulty = _recordField("difficulty")
+    imageUrl = _recordField("imageUrl")
+    achieved = _recordField("achieved")
+
+
+class GameJoltTrophies(GameJoltRecords):
+    """ The trophies of :meth:`GameJoltAPI.trophiesFetch` called with ``typed=True``, as :class:`GameJoltTrophy` rows."""
+    
+    __slots__ = ()
+    
+    KEY = "trophies"
+    RECORD = GameJoltTrophy
+    FIELDS = (
+        ("id", "id", _decodeNumbers),
+        ("title", "title", None),
+        ("description", "description", None),
+        ("difficulty", "difficulty", _CATEGORY),
+        ("imageUrl", "image_url", None),
+        ("achieved", "achieved", _decodeAchieved),
+    )
+
+
+class GameJoltTable(GameJoltRecord):
+    """ A score table of :class:`GameJoltTables`.
+    
+    .. py:attribute:: id
+       :type: int
+    
+    .. py:attribute:: name
+       :type: str
+    
+    .. py:attribute:: description
+       :type: str
+    
+    .. py:attribute:: primary
+       :type: bool"""
+    
+    __slots__ = ()
+    
+    id = _recordField("id")
+    name = _recordField("name")
+    description = _recordField("description")
+    primary = _recordField("primary")
+
+
+class GameJoltTables(GameJoltRecords):
+    """ The score tables of :meth:`GameJoltAPI.scoresTables` called with ``typed=True``, as :class:`GameJoltTable` rows."""
+    
+    __slots__ = ()
+    
+    KEY = "tables"
+    RECORD = GameJoltTable
+    FIELDS = (
+        ("id", "id", _decodeNumbers),
+        ("name", "name", None),
+        ("description", "description", None),
+        ("primary", "primary", _decodeBooleans),
+    )
+
+
+class GameJoltRequestBuilder(GameJoltAPI):
+    """ Generates signed requests of an API instance without submitting them. Available 
+    as :attr:`GameJoltAPI.build`, it has all the API methods but they return a 
+    :class:`GameJoltRequest` instead. It never touches the ``submitRequests`` attribute 
+    and has no side effects, so requests can be built from any thread while other 
+    threads submit live calls. Every other attribute is read from the wrapped instance.
+    
+    :param api: The API instance whose requests are generated.
+    :type api: GameJoltAPI
+    
+    :param username: Generates the requests for this user instead of the one of ``api``. Optional.
+    :type username: str
+    
+    :param userToken: Generates the requests with this user token instead of the one of ``api``. Optional.
+    :type userToken: str
+    
+    .. code-block:: python
+       
+       # Build the sub-requests from many threads, then submit them together
+       requests = list(executor.map(lambda trophyId: api.build.trophiesAddAchieved(trophyId), trophyIds))
+       result = api.batch(requests=requests)
+       
+    """
+    
+    submitRequests = False
+    
+    def __init__(self, api, username=None, userToken=None):
+        # type: (GameJoltAPI, str, str) -> None
+        
+        self._api = api
+        
+        # Instance attributes take precedence over the ones read from the wrapped instance
+        if username is not None:
+            self.username = username
+            
+        if userToken is not None:
+            self.userToken = userToken
+            
+    def __getattr__(self, name):
+        # type: (str) -> object
+        
+        if name == "_api":
+            raise AttributeError(name)
+        return getattr(self._api, name)
+        
+    def _submit(self, operationUrl, data, postData=None, resultType=None):
+        # type: (str, dict, dict, type) -> GameJoltRequest
+        
+        data = self._mergePostData(data, postData)
+        return GameJoltRequest(self._operationNames[operationUrl], self._buildRequestUrl(operationUrl, data))
+
+
+class _GameJoltUserHandleMixin:
+    __slots__ = ("_api", "username", "userToken")
+    
+    def __init__(self, api, username, userToken=None):
+        # type: (GameJoltAPI, str, str) -> None
+        
+        self._api = api
+        self.username = username
+        self.userToken = userToken
+        
+    def __getattr__(self, name):
+        # type: (str) -> object
+        
+        if name == "_api":
+            raise AttributeError(name)
+        return getattr(self._api, name)
+        
+    def __repr__(self):
+        # type: () -> str
+        
+        return "<%s %r of game %s>" % (type(self).__name__, self.username, self._api.gameId)
+        
+    @property
+    def build(self):
+        # type: () -> GameJoltRequestBuilder
+        
+        return GameJoltRequestBuilder(self)
+        
+    def forUser(self, username, userToken=None):
+        # type: (str, str) -> GameJoltUserHandle
+        
+        return self._api.forUser(username, userToken)
+        
+    def addObserver(self, observer):
+        # type: (callable) -> None
+        
+        self._api.addObserver(observer)
+        
+    def removeObserver(self, observer):
+        # type: (callable) -> None
+        
+        self._api.removeObserver(observer)
+        
+    def __setattr__(self, name, value):
+        # type: (str, object) -> None
+        
+        # GameJoltAPI has no __slots__, so handles still have a __dict__ which must stay empty
+        if name not in _GameJoltUserHandleMixin.__slots__:
+            raise AttributeError("Cannot set %r on a user handle, set it on the shared instance" % name)
+        object.__setattr__(self, name, value)
+
+
+class GameJoltUserHandle(_GameJoltUserHandleMixin, GameJoltAPI):
+    """ A per-user view of a :class:`GameJoltAPI` instance, returned by :meth:`GameJoltAPI.forUser`. 
+    It has all the API methods and sends the requests as its own user, but only stores 
+    ``username`` and ``userToken``, in slots. Every other attribute is read from the shared 
+    instance, so the handles of all players use the same connections, cache, observers and limits.
+    
+    .. note::
+    
+       Setting any other attribute (``cache``, ``rateLimiter``...) on a handle raises :class:`AttributeError`, change it on the shared instance instead.
+       
+    .. py:attribute:: username
+       :type: str
+       
+        The username of this handle.
+    
+    .. py:attribute:: userToken
+       :type: str
+       
+        The user access token of this handle."""
+
+
+class AsyncGameJoltUserHandle(_GameJoltUserHandleMixin, AsyncGameJoltAPI):
+    """ The :mod:`asyncio` version of :class:`GameJoltUserHandle`, returned by 
+    :meth:`GameJoltAPI.forUser` on an :class:`AsyncGameJoltAPI` instance.
+    
+    .. note::
+    
+       :meth:`AsyncGameJoltAPI.close` closes the connection pool shared by all the handles."""
+
+
+class GameJoltBatchDispatcher:
+    """ Coalesces individual API calls into batch requests. Calling any API method on the 
+    dispatcher (except :meth:`GameJoltAPI.batch`) queues its sub-request and immediately returns a 
+    :class:`concurrent.futures.Future`. Queued sub-requests are submitted together through 
+    :meth:`GameJoltAPI.batch` as soon as ``maxSize`` of them are queued or the oldest one has 
+    waited ``maxDelay`` seconds, and each future resolves with its own sub-response.
+    
+    :param api: The API instance used to generate and submit the requests. Its ``responseFormat`` must be ``"json"``.
+    :type api: GameJoltAPI
+    
+    :param maxDelay: Maximum seconds a sub-request waits in the queue before being submitted. Optional, defaults to ``0.05``.
+    :type maxDelay: float
+    
+    :param maxSize: Maximum amount of sub-requests per batch request. Optional, defaults to ``50`` (the server limit).
+    :type maxSize: int
+    
+    :param parallel: Passed to every :meth:`GameJoltAPI.batch` call. Optional.
+    :type parallel: bool
+    
+    :param breakOnError: Passed to every :meth:`GameJoltAPI.batch` call. Optional.
+    :type breakOnError: bool
+    
+    :param maxInFlight: The maximum amount of batch requests in flight at the same time. While all of them are in flight, calls keep queuing and are sent in fuller batch requests. Optional, defaults to ``4``.
+    :type maxInFlight: int
+    
+    .. note::
+    
+       - The dispatcher is thread-safe, any number of threads can queue calls at the same time.
+       - A future whose sub-request got no response raises :class:`GameJoltBatchError`, and if the whole batch request fails every future of it raises the same exception.
+       - Batch requests in flight at the same time can be processed in any order. Use ``maxInFlight=1`` if sub-requests must be processed in the order they were queued.
+       
+    .. code-block:: python
+       
+       dispatcher = gamejoltapi.GameJoltBatchDispatcher(api)
+       
+       # Queue calls, they are sent together in one HTTP request
+       futures = [dispatcher.scoresAdd(str(score) + " Points", score) for score in scores]
+       results = [future.result() for future in futures]
+       
+       # Submit the remaining calls and stop the dispatcher
+       dispatcher.close()
+       
+    """
+    
+    def __init__(self, api, maxDelay=0.05, maxSize=_BATCH_LIMIT, parallel=None, breakOnError=None, maxInFlight=4):
+        # type: (GameJoltAPI, float, int, bool, bool, int) -> None
+        
+        if parallel is not None and breakOnError is not None:
+            raise GameJoltDataCollision(["parallel", "break_on_error"])
+            
+        self.api = api
+        self.maxDelay = maxDelay
+        self.maxSize = maxSize
+        self.parallel = parallel
+        self.breakOnError = breakOnError
+        self.maxInFlight = maxInFlight
+        self._queue = [] # [[request, future, queuedTime], ...]
+        self._closed = False
+        self._condition = _threading.Condition()
+        self._inFlight = _threading.BoundedSemaphore(maxInFlight)
+        self._executor = _ThreadPoolExecutor(maxInFlight, thread_name_prefix="GameJoltBatchDispatcher")
+        self._thread = _threading.Thread(target=self._run, name="GameJoltBatchDispatcher", daemon=True)
+        self._thread.start()
+        
+    def __getattr__(self, name):
+        # type: (str) -> object
+        
+        if name.startswith("_") or name == "batch":
+            raise AttributeError(name)
+            
+        method = getattr(self.api.build, name)
+        
+        def queueCall(*args, **kwargs):
+            return self.submit(method(*args, **kwargs))
+            
+        queueCall.__name__ = name
+        queueCall.__doc__ = method.__doc__
+        return queueCall
+        
+    def submit(self, request):
+        # type: (GameJoltRequest | str) -> _Future
+        
+        """Queues an already generated sub-request.
+        
+        :param request: The sub-request generated by :attr:`GameJoltAPI.build`, or its URL.
+        :type request: GameJoltRequest or str
+        
+        :return: A future resolving with the sub-response.
+        :rtype: concurrent.futures.Future"""
+        
+        future = _Future()
+        
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot queue calls on a closed dispatcher")
+                
+            self._queue.append([request, future, _monotonic()])
+            
+            if len(self._queue) == 1 or len(self._queue) >= self.maxSize:
+                self._condition.notify()
+                
+        return future
+        
+    def _run(self):
+        # type: () -> None
+        
+        while True:
+            # Calls keep queuing while all the batch requests allowed are in flight
+            self._inFlight.acquire()
+            
+            with self._condition:
+                while True:
+                    if not self._queue:
+                        if self._closed:
+                            self._inFlight.release()
+                            return
+                        self._condition.wait()
+                        continue
+                        
+                    remaining = self._queue[0][2] + self.maxDelay - _monotonic()
+                    
+                    if len(self._queue) >= self.maxSize or self._closed or remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                    
+                pending = self._queue[:self.maxSize]
+                del self._queue[:self.maxSize]
+                
+            self._executor.submit(self._sendInFlight, pending)
+            
+    def _sendInFlight(self, pending):
+        # type: (list) -> None
+        
+        try:
+            self._sendBatch(pending)
+        finally:
+            self._inFlight.release()
+            
+    def _sendBatch(self, pending):
+        # type: (list) -> None
+        
+        # Skip the futures cancelled while queued
+        pending = [entry for entry in pending if entry[1].set_running_or_notify_cancel()]
+        
+        if not pending:
+            return
+            
+        try:
+            response = self.api.batch([entry[0] for entry in pending], parallel=self.parallel, breakOnError=self.breakOnError)
+            responses = response.get("responses", [])
+            
+        except BaseException as exception:
+            for request, future, queuedTime in pending:
+                future.set_exception(exception)
+            return
+            
+        for i, (request, future, queuedTime) in enumerate(pending):
+            if i < len(responses):
+                future.set_result(responses[i])
+            else:
+                future.set_exception(GameJoltBatchError(response))
+                
+    def flush(self):
+        # type: () -> None
+        
+        """Submits all queued sub-requests right away and waits for their responses."""
+        
+        with self._condition:
+            pending = self._queue
+            self._queue = []
+            
+        for i in range(0, len(pending), self.maxSize):
+            self._sendBatch(pending[i:i + self.maxSize])
+            
+    def close(self):
+        # type: () -> None
+        
+        """Submits the remaining queued sub-requests and stops the dispatcher. 
+        No more calls can be queued afterwards."""
+        
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            
+        self._thread.join()
+        self._executor.shutdown()
+
+
+class _GameJoltSession:
+    """ State of a session tracked by :class:`GameJoltSessionManager`."""
+    
+    __slots__ = ("builder", "status", "lastSuccess", "dueTick", "slot", "expired")
+    
+    def __init__(self, builder, status):
+        # type: (GameJoltRequestBuilder, str) -> None
+        
+        self.builder = builder
+        self.status = status
+        self.lastSuccess = _monotonic()
+        self.dueTick = 0
+        self.slot = None
+        self.expired = False
+
+
+class GameJoltSessionManager:
+    """ Keeps the sessions of many users alive from a background thread. Sessions opened 
+    through :meth:`open` are pinged about every ``interval`` seconds, with a random 
+    ``jitter`` so the pings of many users spread out over time. Pings are scheduled on a 
+    timer wheel, and all pings due at the same tick are sent together through 
+    :meth:`GameJoltAPI.batchMany`.
+    
+    :param api: The API instance used to generate and submit the requests. Its ``responseFormat`` must be ``"json"``.
+    :type api: GameJoltAPI
+    
+    :param interval: Seconds between the pings of a session. Optional, defaults to ``30``.
+    :type interval: float
+    
+    :param jitter: Maximum seconds randomly added to or subtracted from each ``interval``. Optional, defaults to ``5``.
+    :type jitter: float
+    
+    :param tickInterval: Resolution in seconds of the timer wheel. Optional, defaults to ``1``.
+    :type tickInterval: float
+    
+    :param retryDelay: Seconds before retrying a failed ping. Optional, defaults to ``5``.
+    :type retryDelay: float
+    
+    :param deadline: Seconds without a successful ping after which the server closes a session. Optional, defaults to ``120``.
+    :type deadline: float
+    
+    .. note::
+    
+       - A session which missed its ``deadline`` is counted in the ``"missedDeadlines"`` metric and opened again on its next scheduled ping.
+       - Call :meth:`shutdown` when done to close all sessions and stop the background thread.
+       
+    .. code-block:: python
+       
+       manager = gamejoltapi.GameJoltSessionManager(api)
+       
+       # When a player joins and leaves the server
+       manager.open(username, userToken)
+       manager.close(username, userToken)
+       
+       # When the server stops
+       manager.shutdown()
+       
+    """
+    
+    def __init__(self, api, interval=30.0, jitter=5.0, tickInterval=1.0, retryDelay=5.0, deadline=120.0):
+        # type: (GameJoltAPI, float, float, float, float, float) -> None
+        
+        self.api = api
+        self.interval = interval
+        self.jitter = jitter
+        self.tickInterval = tickInterval
+        self.retryDelay = retryDelay
+        self.deadline = deadline
+        self._sessions = {} # (username, userToken) -> _GameJoltSession
+        self._wheel = [set() for _ in range(int((max(interval, retryDelay) + jitter) / tickInterval) + 2)]
+        self._tick = 0
+        self._startTime = _monotonic()
+        self._lock = _threading.Lock()
+        self._stopped = _threading.Event()
+        self._metrics = {
+            "pingsSent" : 0,
+            "pingsFailed" : 0,
+            "pingErrors" : 0,
+            "batchRequests" : 0,
+            "lateTicks" : 0,
+            "maxTickLag" : 0.0,
+            "missedDeadlines" : 0,
+            "reopened" : 0,
+        }
+        self._thread = _threading.Thread(target=self._run, name="GameJoltSessionManager", daemon=True)
+        self._thread.start()
+        
+    def _schedule(self, key, session, delay):
+        # type: (tuple, _GameJoltSession, float) -> None
+        
+        ticks = min(max(1, int(round(delay / self.tickInterval))), len(self._wheel) - 1)
+        
+        if session.slot is not None:
+            self._wheel[session.slot].discard(key)
+            
+        session.dueTick = self._tick + ticks
+        session.slot = session.dueTick % len(self._wheel)
+        self._wheel[session.slot].add(key)
+        
+    def _nextDelay(self):
+        # type: () -> float
+        
+        return self.interval + _random.uniform(-self.jitter, self.jitter)
+        
+    def open(self, username, userToken, status=None):
+        # type: (str, str, str) -> dict
+        
+        """Opens a session for a user and starts pinging it.
+        
+        :param username: The username of the user.
+        :type username: str
+        
+        :param userToken: The user access token.
+        :type userToken: str
+        
+        :param status: The status sent with each ping, ``"active"`` or ``"idle"``. Optional.
+        :type status: str
+        
+        :return: The response of the ``sessions/open`` request.
+        :rtype: dict"""
+        
+        builder = GameJoltRequestBuilder(self.api, username, userToken)
+        response = self.api.forUser(username, userToken).sessionsOpen()
+        
+        if response.get("success") in ("true", True):
+            key = (username, userToken)
+            
+            with self._lock:
+                session = self._sessions.get(key)
+                
+                if session is None:
+                    session = self._sessions[key] = _GameJoltSession(builder, status)
+                    
+                session.status = status
+                session.lastSuccess = _monotonic()
+                session.expired = False
+                self._schedule(key, session, self._nextDelay())
+                
+        return response
+        
+    def setStatus(self, username, userToken, status):
+        # type: (str, str, str) -> None
+        
+        """Changes the status sent with the next pings of a session.
+        
+        :param status: ``"active"`` or ``"idle"``.
+        :type status: str"""
+        
+        with self._lock:
+            session = self._sessions.get((username, userToken))
+            
+            if session is not None:
+                session.status = status
+                
+    def close(self, username, userToken):
+        # type: (str, str) -> dict
+        
+        """Stops pinging a session and closes it.
+        
+        :return: The response of the ``sessions/close`` request, or ``None`` if the session was not open.
+        :rtype: dict"""
+        
+        with self._lock:
+            session = self._sessions.pop((username, userToken), None)
+            
+            if session is None:
+                return None
+                
+            if session.slot is not None:
+                self._wheel[session.slot].discard((username, userToken))
+                
+        return self.api.forUser(username, userToken).sessionsClose()
+        
+    def _collectDue(self, now):
+        # type: (float) -> list
+        
+        due = []
+        currentTick = int((now - self._startTime) / self.tickInterval)
+        
+        with self._lock:
+            lag = now - (self._startTime + (self._tick + 1) * self.tickInterval)
+            
+            if self._tick < currentTick and lag > self.tickInterval:
+                self._metrics["lateTicks"] += 1
+                self._metrics["maxTickLag"] = max(self._metrics["maxTickLag"], lag)
+                
+            while self._tick < currentTick:
+                self._tick += 1
+                slot = self._wheel[self._tick % len(self._wheel)]
+                
+                for key in list(slot):
+                    session = self._sessions[key]
+                    
+                    if session.dueTick > self._tick:
+                        continue
+                        
+                    slot.discard(key)
+                    session.slot = None
+                    
+                    if not session.expired and now - session.lastSuccess > self.deadline:
+                        session.expired = True
+                        self._metrics["missedDeadlines"] += 1
+                        
+                    request = session.builder.sessionsOpen() if session.expired else session.builder.sessionsPing(session.status)
+                    due.append((key, session, request))
+                    
+        return due
+        
+    def _ping(self, due):
+        # type: (list) -> None
+        
+        result = self.api.batchMany([request for key, session, request in due])
+        now = _monotonic()
+        
+        with self._lock:
+            self._metrics["batchRequests"] += len(result["chunks"])
+            
+            for (key, session, request), response in zip(due, result["responses"]):
+                self._metrics["pingsSent"] += 1
+                
+                # Session closed while its ping was in flight
+                if self._sessions.get(key) is not session:
+                    continue
+                    
+                if response is not None and response.get("success") in ("true", True):
+                    if session.expired:
+                        self._metrics["reopened"] += 1
+                        
+                    session.lastSuccess = now
+                    session.expired = False
+                    self._schedule(key, session, self._nextDelay())
+                    
+                else:
+                    self._metrics["pingsFailed"] += 1
+                    
+                    # A failed ping usually means the session was dropped, open it again
+                    session.expired = session.expired or (request.operation == "sessions/ping" and response is not None)
+                    self._schedule(key, session, self.retryDelay)
+                    
+    def _run(self):
+        # type: () -> None
+        
+        while not self._stopped.wait(max(0.0, self._startTime + (self._tick + 1) * self.tickInterval - _monotonic())):
+            due = []
+            
+            try:
+                due = self._collectDue(_monotonic())
+                
+                if due:
+                    self._ping(due)
+                    
+            except Exception:
+                # E.g. GameJoltCircuitOpen, the pings are retried instead of the sessions expiring
+                with self._lock:
+                    self._metrics["pingErrors"] += 1
+                    
+                    for key, session, request in due:
+                        if self._sessions.get(key) is session:
+                            self._schedule(key, session, self.retryDelay)
+                            
+    def metrics(self):
+        # type: () -> dict
+        
+        """Returns the counters of the manager.
+        
+        :return: A dict with the amount of tracked ``"sessions"``, ``"pingsSent"``, ``"pingsFailed"``, ``"pingErrors"`` (ticks whose pings raised, e.g. :class:`GameJoltCircuitOpen`, retried after ``retryDelay``), ``"batchRequests"``, ``"lateTicks"`` (ticks processed more than one tick late), ``"maxTickLag"`` in seconds, ``"missedDeadlines"`` (sessions without a successful ping within ``deadline``) and ``"reopened"`` sessions.
+        :rtype: dict"""
+        
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["sessions"] = len(self._sessions)
+            
+        return metrics
+        
+    def shutdown(self):
+        # type: () -> dict
+        
+        """Stops the background thread and closes all tracked sessions through batch requests.
+        
+        :return: The result of :meth:`GameJoltAPI.batchMany` for the ``sessions/close`` requests.
+        :rtype: dict"""
+        
+        self._stopped.set()
+        self._thread.join()
+        
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+            self._wheel = [set() for _ in self._wheel]
+            
+        return self.api.batchMany([session.builder.sessionsClose() for session in sessions])
+
+
+class GameJoltLeaderboard:
+    """ Serves :meth:`GameJoltAPI.scoresFetch` snapshots of global leaderboards with a 
+    stale-while-revalidate policy. A snapshot younger than ``maxAge`` is returned right 
+    away. An older one is still returned right away, but a refresh is started in the 
+    background. Concurrent requests for the same leaderboard never send more than one 
+    upstream request at a time, no matter how many clients poll it.
+    
+    :param api: The API instance used to fetch the scores.
+    :type api: GameJoltAPI
+    
+    :param maxAge: Seconds a snapshot is served without being refreshed. Optional, defaults to ``10``.
+    :type maxAge: float
+    
+    :param maxStale: Seconds after which a snapshot is too old to be served while it is refreshed, so callers wait for the new one. Optional, defaults to ``None`` (always serve the last snapshot).
+    :type maxStale: float
+    
+    :param maxWorkers: The maximum amount of background refreshes running at the same time. Optional, defaults to ``4``.
+    :type maxWorkers: int
+    
+    .. note::
+    
+       - Snapshots are keyed by ``(tableId, limit, betterThan, worseThan)``. Only global scores are supported, not the ones of a user or guest.
+       - A failed background refresh keeps the last snapshot, which is refreshed again on the next request.
+       - Snapshots are shared between callers and must not be modified.
+       
+    .. code-block:: python
+       
+       leaderboard = gamejoltapi.GameJoltLeaderboard(api, maxAge=5)
+       
+       # Called on every client poll, sends at most one request per table every 5 seconds
+       scores = leaderboard.fetch(limit=100, tableId=TABLE_ID)
+       
+    """
+    
+    def __init__(self, api, maxAge=10.0, maxStale=None, maxWorkers=4):
+        # type: (GameJoltAPI, float, float, int) -> None
+        
+        self.api = api
+        self.maxAge = maxAge
+        self.maxStale = maxStale
+        self.hits = 0
+        self.staleHits = 0
+        self.upstreamRequests = 0
+        self.refreshErrors = 0
+        self._lock = _threading.Lock()
+        self._snapshots = {} # (tableId, limit, betterThan, worseThan) -> [response, fetchedAt]
+        self._inFlight = {} # (tableId, limit, betterThan, worseThan) -> Future
+        self._executor = _ThreadPoolExecutor(maxWorkers, thread_name_prefix="GameJoltLeaderboard")
+        
+    def fetch(self, limit=None, tableId=None, betterThan=None, worseThan=None):
+        # type: (int, int, int, int) -> dict
+        
+        """Returns the snapshot of a leaderboard. The arguments are the same as :meth:`GameJoltAPI.scoresFetch`.
+        
+        :return: The ``scores/fetch`` response.
+        :rtype: dict"""
+        
+        key = (tableId, limit, betterThan, worseThan)
+        startRefresh = False
+        
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            age = _monotonic() - snapshot[1] if snapshot is not None else None
+            
+            if snapshot is not None and age <= self.maxAge:
+                self.hits += 1
+                return snapshot[0]
+                
+            future = self._inFlight.get(key)
+            
+            if future is None:
+                future = self._inFlight[key] = _Future()
+                startRefresh = True
+                
+            servable = snapshot is not None and (self.maxStale is None or age <= self.maxStale)
+            
+            if servable:
+                self.staleHits += 1
+                
+        if startRefresh:
+            if servable:
+                self._executor.submit(self._refresh, key, future)
+            else:
+                self._refresh(key, future)
+                
+        return snapshot[0] if servable else future.result()
+        
+    def _refresh(self, key, future):
+        # type: (tuple, _Future) -> None
+        
+        tableId, limit, betterThan, worseThan = key
+        
+        try:
+            with self._lock:
+                self.upstreamRequests += 1
+                
+            response = self.api.scoresFetch(limit=limit, tableId=tableId, betterThan=betterThan, worseThan=worseThan)
+            
+        except BaseException as exception:
+            with self._lock:
+                self.refreshErrors += 1
+                del self._inFlight[key]
+                
+            future.set_exception(exception)
+            return
+            
+        with self._lock:
+            if not isinstance(response, dict) or response.get("success") in ("true", True):
+                self._snapshots[key] = [response, _monotonic()]
+            else:
+                self.refreshErrors += 1
+                
+            del self._inFlight[key]
+            
+        future.set_result(response)
+        
+    def invalidate(self, tableId=None):
+        # type: (int) -> None
+        
+        """Drops the snapshots of a score table, so the next request waits for fresh scores.
+        
+        :param tableId: The ID of the score table. Optional, drops all snapshots if ``None``.
+        :type tableId: int"""
+        
+        with self._lock:
+            for key in list(self._snapshots.keys()):
+                if tableId is None or key[0] == tableId:
+                    del self._snapshots[key]
+                    
+    def close(self):
+        # type: () -> None
+        
+        """Waits for the background refreshes to finish and stops the refresh threads."""
+        
+        self._executor.shutdown(wait=True)
+
+
+class GameJoltRankIndex:
+    """ A local index of the scores of a score table, answering :meth:`scoresGetRank` 
+    without a network round trip. It is seeded from paged :meth:`GameJoltAPI.scoresFetch` 
+    calls and kept current with the scores submitted through :meth:`scoresAdd` or 
+    :meth:`insert`. Sort values are kept in a sorted list, so rank queries are ``O(log n)``.
+    
+    :param api: The API instance used to fetch and submit the scores.
+    :type api: GameJoltAPI
+    
+    :param tableId: The ID of the score table. Optional, defaults to the primary score table.
+    :type tableId: int
+    
+    :param descending: If bigger sort values are better, as set in the score table's sorting direction. Optional, defaults to ``True``.
+    :type descending: bool
+    
+    :param maxAge: Seconds after seeding the index is considered stale. Stale indexes answer through the remote endpoint while being seeded again in the background. Optional, defaults to ``300``.
+    :type maxAge: float
+    
+    :param maxPages: The maximum amount of pages of 100 scores fetched when seeding. Optional, defaults to ``100``.
+    :type maxPages: int
+    
+    .. note::
+    
+       - The remote ``scores/get-rank`` endpoint is used while the index is cold or stale, and for scores worse than all indexed ones when the table has more scores than ``maxPages`` pages.
+       - Seeding stops at a sort value shared by 100 scores or more, since pages cannot start past them. Worse scores are then also ranked through the remote endpoint.
+       - Scores submitted by other clients are only seen after the next seeding.
+       
+    .. code-block:: python
+       
+       index = gamejoltapi.GameJoltRankIndex(api, tableId=TABLE_ID)
+       index.seed()
+       
+       # After each match
+       index.scoresAdd(str(points) + " Points", points)
+       rank = index.scoresGetRank(points)["rank"]
+       
+    """
+    
+    def __init__(self, api, tableId=None, descending=True, maxAge=300.0, maxPages=100):
+        # type: (GameJoltAPI, int, bool, float, int) -> None
+        
+        self.api = api
+        self.tableId = tableId
+        self.descending = descending
+        self.maxAge = maxAge
+        self.maxPages = maxPages
+        self.localHits = 0
+        self.remoteHits = 0
+        self.upstreamRequests = 0
+        self.seedErrors = 0
+        self._lock = _threading.Lock()
+        self._keys = [] # Sorted keys, better scores first
+        self._seededAt = None
+        self._complete = False
+        self._seeding = False
+        
+    def _key(self, sort):
+        # type: (int) -> float
+        
+        return -float(sort) if self.descending else float(sort)
+        
+    def seed(self):
+        # type: () -> int
+        
+        """Fetches the scores of the table page by page and rebuilds the index. The previous 
+        index is kept if a page cannot be fetched.
+        
+        :return: The amount of indexed scores.
+        :rtype: int
+        
+        :raises RuntimeError: If the server rejected a ``scoresFetch`` request."""
+        
+        keys = []
+        worseThan = None
+        skip = 0 # Leading scores of the page already indexed from the previous page
+        complete = False
+        
+        for page in range(self.maxPages):
+            with self._lock:
+                self.upstreamRequests += 1
+                
+            response = self.api.scoresFetch(limit=100, tableId=self.tableId, worseThan=worseThan)
+            
+            if response.get("success") not in ("true", True):
+                raise RuntimeError("Cannot seed the rank index: " + repr(response.get("message", response)))
+                
+            scores = response.get("scores", [])
+            keys.extend([self._key(score["sort"]) for score in scores[skip:]])
+            
+            if len(scores) < 100:
+                complete = True
+                break
+                
+            # worse_than excludes the scores tied with the last one, so the next page starts at
+            # the first of them instead, skipping the ones indexed from this page
+            last = _toNumber(scores[-1]["sort"])
+            skip = len([score for score in scores if _toNumber(score["sort"]) == last])
+            
+            # A whole page of ties, or sort values which are not integers, cannot be paged past
+            if skip == len(scores) or not isinstance(last, int):
+                del keys[len(keys) - skip:]
+                break
+                
+            worseThan = last + 1 if self.descending else last - 1
+            
+        keys.sort()
+        
+        with self._lock:
+            self._keys = keys
+            self._seededAt = _monotonic()
+            self._complete = complete
+            
+        return len(keys)
+        
+    def _seedInBackground(self):
+        # type: () -> None
+        
+        try:
+            self.seed()
+        except Exception:
+            with self._lock:
+                self.seedErrors += 1
+        finally:
+            with self._lock:
+                self._seeding = False
+                
+    def insert(self, sort):
+        # type: (int) -> None
+        
+        """Adds a score submitted elsewhere to the index.
+        
+        :param sort: The sort value of the score.
+        :type sort: int"""
+        
+        with self._lock:
+            if self._seededAt is not None:
+                _bisect.insort(self._keys, self._key(sort))
+                
+    def scoresAdd(self, score, sort, guest=None, extraData=None):
+        # type: (str, int, str, str) -> dict
+        
+        """Submits a score to the table through :meth:`GameJoltAPI.scoresAdd` and adds it to the index 
+        if successful. The arguments are the same as :meth:`GameJoltAPI.scoresAdd`, except ``tableId``."""
+        
+        response = self.api.scoresAdd(score, sort, tableId=self.tableId, guest=guest, extraData=extraData)
+        
+        if response.get("success") in ("true", True):
+            self.insert(sort)
+            
+        return response
+        
+    def scoresGetRank(self, sort):
+        # type: (int) -> dict
         
-        :param key: The key of the data item you'd like to set.
-        :type key: str
+        """Returns the rank of a score on the table, the same as :meth:`GameJoltAPI.scoresGetRank`.
         
-        :param data: The data you'd like to set.
-        :type data: str
+        :param sort: The sort value of the score.
+        :type sort: int
         
-        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
-        :type globalData: bool
+        :return: A ``scores/get-rank`` response.
+        :rtype: dict"""
         
-        .. note::
-           
-           You can create new data store items by passing in a key that doesn't yet exist in the data store.
+        key = self._key(sort)
         
-        .. code-block:: python
-           
-           # Store on the key "some_global_value" the data "500" in the global data store
-           result = api.dataStoreSet("some_global_value", "500", globalData=True)
-           
-        """
+        with self._lock:
+            fresh = self._seededAt is not None and _monotonic() - self._seededAt <= self.maxAge
+            
+            if fresh and (self._complete or (self._keys and key <= self._keys[-1])):
+                self.localHits += 1
+                return {"success" : "true", "rank" : _bisect.bisect_left(self._keys, key) + 1}
+                
+            self.remoteHits += 1
+            self.upstreamRequests += 1
+            startSeeding = self._seededAt is not None and not fresh and not self._seeding
+            self._seeding = self._seeding or startSeeding
+            
+        if startSeeding:
+            _threading.Thread(target=self._seedInBackground, name="GameJoltRankIndex", daemon=True).start()
+            
+        return self.api.scoresGetRank(sort, tableId=self.tableId)
+
+
+class GameJoltUserLoader:
+    """ Loads user profiles in bulk for :meth:`GameJoltAPI.usersFetch`. Requested IDs are 
+    deduplicated, the known ones are served from an LRU cache, and the rest are split 
+    into chunks of ``chunkSize`` IDs, so the request URLs stay short, fetched concurrently. 
+    Results are returned in the order of the requested IDs.
+    
+    Like a DataLoader, :meth:`load` queues a single ID and returns a future. The IDs 
+    queued within ``maxDelay`` seconds from any thread are fetched together, so rendering 
+    many players one at a time still sends a few requests.
+    
+    :param api: The API instance used to fetch the users. Its ``responseFormat`` must be ``"json"``.
+    :type api: GameJoltAPI
+    
+    :param maxSize: The maximum amount of cached users. The least recently used ones are evicted first. Optional, defaults to ``10000``.
+    :type maxSize: int
+    
+    :param ttl: Seconds a user is served from the cache. Optional, defaults to ``300``.
+    :type ttl: float
+    
+    :param chunkSize: The maximum amount of IDs per request. Optional, defaults to ``100``.
+    :type chunkSize: int
+    
+    :param maxDelay: Seconds the IDs queued by :meth:`load` wait for others before being fetched. Optional, defaults to ``0.01``.
+    :type maxDelay: float
+    
+    :param maxWorkers: The maximum amount of requests in flight at the same time. Optional, defaults to ``4``.
+    :type maxWorkers: int
+    
+    .. note::
+    
+       - Unknown users are returned as ``None``.
+       - Cached users are shared between callers and must not be modified.
+       - Call :meth:`close` when done to stop the background thread.
+       
+    .. code-block:: python
+       
+       loader = gamejoltapi.GameJoltUserLoader(api)
+       
+       # One request per 100 players not seen in the last 5 minutes
+       users = loader.loadMany(lobbyUserIds)
+       
+       # Or one call per player, coalesced into the same requests
+       futures = [loader.load(userId) for userId in lobbyUserIds]
+       users = [future.result() for future in futures]
+       
+    """
+    
+    def __init__(self, api, maxSize=10000, ttl=300.0, chunkSize=100, maxDelay=0.01, maxWorkers=4):
+        # type: (GameJoltAPI, int, float, int, float, int) -> None
+        
+        self.api = api
+        self.maxSize = maxSize
+        self.ttl = ttl
+        self.chunkSize = chunkSize
+        self.maxDelay = maxDelay
+        self.hits = 0
+        self.misses = 0
+        self.upstreamRequests = 0
+        self._lock = _threading.Lock()
+        self._users = _OrderedDict() # userId -> [user, expiresAt]
+        self._queue = _OrderedDict() # userId -> [Future, ...]
+        self._queuedAt = None
+        self._closed = False
+        self._condition = _threading.Condition()
+        self._executor = _ThreadPoolExecutor(maxWorkers, thread_name_prefix="GameJoltUserLoader")
+        self._thread = _threading.Thread(target=self._run, name="GameJoltUserLoader", daemon=True)
+        self._thread.start()
+        
+    def _getCached(self, userId):
+        # type: (str) -> dict
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "key" : key,
-            "data" : data
-        }
+        with self._lock:
+            entry = self._users.get(userId)
+            
+            if entry is None or entry[1] <= _monotonic():
+                self.misses += 1
+                return None
+                
+            self._users.move_to_end(userId)
+            self.hits += 1
+            return entry[0]
+            
+    def _fetchChunk(self, userIds):
+        # type: (list[str]) -> list[dict]
         
-        # Optional data
-        optionalData = {
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+        with self._lock:
+            self.upstreamRequests += 1
+            
+        response = self.api.usersFetch(userId=userIds)
         
-        # Process global data instead of user data
-        if globalData:
-            optionalData["username"] = None
-            optionalData["user_token"] = None
+        # The server fails the request when none of the users exists
+        return response.get("users", []) if response.get("success") in ("true", True) else []
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
+    def _fetch(self, userIds):
+        # type: (list[str]) -> dict
+        
+        chunks = [userIds[i:i + self.chunkSize] for i in range(0, len(userIds), self.chunkSize)]
+        users = {}
+        
+        for chunkUsers in self._executor.map(self._fetchChunk, chunks):
+            for user in chunkUsers:
+                users[str(user["id"])] = user
+                
+        expiresAt = _monotonic() + self.ttl
+        
+        with self._lock:
+            for userId, user in users.items():
+                self._users[userId] = [user, expiresAt]
+                self._users.move_to_end(userId)
+                
+            while len(self._users) > self.maxSize:
+                self._users.popitem(last=False)
+                
+        return users
+        
+    def loadMany(self, userIds):
+        # type: (list[str | int]) -> list[dict]
+        
+        """Returns the users with the given IDs, fetching the ones not cached.
+        
+        :param userIds: The user IDs, which can repeat.
+        :type userIds: list[str or int]
+        
+        :return: The user dicts in the order of ``userIds``, ``None`` for unknown users.
+        :rtype: list[dict]"""
+        
+        userIds = [str(userId).strip() for userId in userIds]
+        users = {}
+        missing = []
+        
+        for userId in _OrderedDict.fromkeys(userIds):
+            user = self._getCached(userId)
+            
+            if user is not None:
+                users[userId] = user
+            else:
+                missing.append(userId)
+                
+        if missing:
+            users.update(self._fetch(missing))
+            
+        return [users.get(userId) for userId in userIds]
+        
+    def load(self, userId):
+        # type: (str | int) -> _Future
+        
+        """Queues a user ID, to be fetched together with the other IDs queued within ``maxDelay`` seconds.
+        
+        :param userId: The user ID.
+        :type userId: str or int
+        
+        :return: A future resolving with the user dict, or ``None`` for an unknown user.
+        :rtype: concurrent.futures.Future"""
+        
+        userId = str(userId).strip()
+        future = _Future()
+        user = self._getCached(userId)
+        
+        if user is not None:
+            future.set_result(user)
+            return future
+            
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot queue users on a closed loader")
+                
+            if not self._queue:
+                self._queuedAt = _monotonic()
+                self._condition.notify()
+                
+            self._queue.setdefault(userId, []).append(future)
+            
+        return future
+        
+    def _run(self):
+        # type: () -> None
+        
+        while True:
+            with self._condition:
+                while True:
+                    if not self._queue:
+                        if self._closed:
+                            return
+                        self._condition.wait()
+                        continue
+                        
+                    remaining = self._queuedAt + self.maxDelay - _monotonic()
+                    
+                    if self._closed or remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                    
+                queue = self._queue
+                self._queue = _OrderedDict()
+                
+            try:
+                users = self._fetch(list(queue))
+            except BaseException as exception:
+                for futures in queue.values():
+                    for future in futures:
+                        future.set_exception(exception)
+                continue
+                
+            for userId, futures in queue.items():
+                for future in futures:
+                    future.set_result(users.get(userId))
+                    
+    def invalidate(self, userId=None):
+        # type: (str | int) -> None
+        
+        """Removes a user from the cache, or all users if ``userId`` is ``None``.
+        
+        :param userId: The user ID. Optional.
+        :type userId: str or int"""
+        
+        with self._lock:
+            if userId is None:
+                self._users.clear()
+            else:
+                self._users.pop(str(userId).strip(), None)
+                
+    def close(self):
+        # type: () -> None
+        
+        """Fetches the remaining queued IDs and stops the background thread."""
+        
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            
+        self._thread.join()
+        self._executor.shutdown()
+
+
+class GameJoltTrophyMirror:
+    """ A local mirror of the trophies of a user, seeded by one :meth:`GameJoltAPI.trophiesFetch` 
+    and kept up to date by the trophy calls made through it. While the mirror is fresh, 
+    unlocking an already achieved trophy completes locally without a request, and 
+    :meth:`trophiesFetch` is answered from memory.
+    
+    :param api: The API instance of the user, or a handle returned by :meth:`GameJoltAPI.forUser`. Its ``responseFormat`` must be ``"json"``.
+    :type api: GameJoltAPI
+    
+    :param maxAge: Seconds the mirror is used after being seeded. Optional, defaults to ``300``.
+    :type maxAge: float
+    
+    .. note::
+    
+       - Trophies changed outside of the mirror, for example by another process, are only seen after it is seeded again.
+       - A trophy achieved through the mirror is marked with an ``"achieved"`` value of ``"Just now"``.
+       - Fetched trophies are shared between callers and must not be modified.
+       
+    .. code-block:: python
+       
+       trophies = gamejoltapi.GameJoltTrophyMirror(api)
+       trophies.seed()
+       
+       # Called on every unlock condition, only the first call sends a request
+       trophies.trophiesAddAchieved(TROPHY_ID)
+       
+    """
+    
+    def __init__(self, api, maxAge=300.0):
+        # type: (GameJoltAPI, float) -> None
+        
+        self.api = api
+        self.maxAge = maxAge
+        self.localHits = 0
+        self.upstreamRequests = 0
+        self._lock = _threading.Lock()
+        self._trophies = _OrderedDict() # trophyId -> trophy
+        self._seededAt = None
+        
+    def _isFresh(self):
+        # type: () -> bool
+        
+        return self._seededAt is not None and _monotonic() - self._seededAt < self.maxAge
+        
+    def _countUpstream(self):
+        # type: () -> None
+        
+        with self._lock:
+            self.upstreamRequests += 1
+            
+    def _refresh(self, trophyId):
+        # type: (str) -> None
+        
+        # Fetches one trophy known by the mirror again
+        self._countUpstream()
+        response = self.api.trophiesFetch(trophyId=trophyId)
+        
+        if response.get("success") in ("true", True):
+            with self._lock:
+                for trophy in response.get("trophies", []):
+                    if str(trophy["id"]) in self._trophies:
+                        self._trophies[str(trophy["id"])] = trophy
+                        
+    def _setAchieved(self, trophyId, achieved):
+        # type: (str, bool) -> None
+        
+        with self._lock:
+            trophy = self._trophies.get(trophyId)
+            
+            if trophy is not None and (trophy.get("achieved") not in ("false", False)) != achieved:
+                self._trophies[trophyId] = dict(trophy, achieved="Just now" if achieved else "false")
+                
+    def seed(self):
+        # type: () -> dict
+        
+        """Fetches all the trophies of the user into the mirror.
+        
+        :return: The ``trophies/fetch`` response.
+        :rtype: dict"""
+        
+        self._countUpstream()
+        response = self.api.trophiesFetch()
+        
+        if response.get("success") in ("true", True):
+            with self._lock:
+                self._trophies = _OrderedDict([(str(trophy["id"]), trophy) for trophy in response.get("trophies", [])])
+                self._seededAt = _monotonic()
+                
+        return response
+        
+    def isAchieved(self, trophyId):
+        # type: (int) -> bool
+        
+        """Returns if the user achieved a trophy according to the mirror.
+        
+        :param trophyId: The trophy ID.
+        :type trophyId: int
+        
+        :return: ``True`` or ``False``, or ``None`` if the mirror is not fresh or does not know the trophy.
+        :rtype: bool"""
+        
+        with self._lock:
+            trophy = self._trophies.get(str(trophyId)) if self._isFresh() else None
+            return trophy.get("achieved") not in ("false", False) if trophy is not None else None
+            
+    def trophiesAddAchieved(self, trophyId):
+        # type: (int) -> dict
+        
+        """Same as :meth:`GameJoltAPI.trophiesAddAchieved`, but completes locally with a 
+        successful response if the trophy is already achieved."""
+        
+        if self.isAchieved(trophyId):
+            with self._lock:
+                self.localHits += 1
+            return {"success" : "true"}
+            
+        self._countUpstream()
+        response = self.api.trophiesAddAchieved(trophyId)
+        
+        if response.get("success") in ("true", True):
+            self._setAchieved(str(trophyId), True)
+            
+        # The server also fails when the trophy was already achieved, which the mirror did not know
+        elif self.isAchieved(trophyId) is False:
+            self._refresh(str(trophyId))
+            
+        return response
+        
+    def trophiesRemoveAchieved(self, trophyId):
+        # type: (int) -> dict
+        
+        """Same as :meth:`GameJoltAPI.trophiesRemoveAchieved`, updating the mirror."""
+        
+        self._countUpstream()
+        response = self.api.trophiesRemoveAchieved(trophyId)
+        
+        if response.get("success") in ("true", True):
+            self._setAchieved(str(trophyId), False)
+        return response
+        
+    def trophiesFetch(self, achieved=None, trophyId=None):
+        # type: (bool, str | int | list) -> dict
+        
+        """Same as :meth:`GameJoltAPI.trophiesFetch`, answered from the mirror while it is 
+        fresh. Otherwise the mirror is seeded again first."""
+        
+        fresh = self._isFresh()
+        
+        if not fresh:
+            response = self.seed()
+            
+            if response.get("success") not in ("true", True):
+                return response
+                
+        with self._lock:
+            self.localHits += 1 if fresh else 0
+            trophies = list(self._trophies.values())
+            
+        if trophyId is not None:
+            trophyIds = trophyId if type(trophyId) in (list, tuple, set) else str(trophyId).split(",")
+            trophyIds = {str(item).strip() for item in trophyIds}
+            trophies = [trophy for trophy in trophies if str(trophy["id"]) in trophyIds]
+            
+        elif achieved is not None:
+            trophies = [trophy for trophy in trophies if (trophy.get("achieved") not in ("false", False)) == achieved]
+            
+        return {"success" : "true", "trophies" : trophies}
+
+
+class GameJoltClock:
+    """ Estimates the clock of the Game Jolt server from a few :meth:`GameJoltAPI.time` calls, 
+    so the server time can be read locally with :meth:`serverNow`. Each synchronization 
+    samples the server time ``samples`` times and, like NTP, keeps the sample with the 
+    lowest round trip time, assuming the server read its clock halfway through it. The 
+    estimate follows the local monotonic clock between synchronizations, which run in 
+    the background every ``resyncInterval`` seconds.
+    
+    :param api: The API instance used to call :meth:`GameJoltAPI.time`. Its ``responseFormat`` must be ``"json"``.
+    :type api: GameJoltAPI
+    
+    :param samples: The amount of ``time`` calls per synchronization. Optional, defaults to ``4``.
+    :type samples: int
+    
+    :param resyncInterval: Seconds between background synchronizations. Optional, defaults to ``300``.
+    :type resyncInterval: float
+    
+    :param maxHistory: The amount of past synchronizations used to estimate the drift of the local clock. Optional, defaults to ``24``.
+    :type maxHistory: int
+    
+    .. note::
+    
+       - The server returns whole seconds, so the estimate is within about half a second plus half the round trip time.
+       - The drift is only corrected once the past synchronizations span at least an hour, since shorter spans are dominated by the rounding of the server time.
+       - Call :meth:`close` when done to stop the background thread.
+       
+    .. code-block:: python
+       
+       clock = gamejoltapi.GameJoltClock(api)
+       
+       # No request, except for the first synchronization
+       timestamp = clock.serverNow()
+       
+    """
+    
+    MIN_DRIFT_SPAN = 3600.0
+    
+    def __init__(self, api, samples=4, resyncInterval=300.0, maxHistory=24):
+        # type: (GameJoltAPI, int, float, int) -> None
+        
+        self.api = api
+        self.samples = samples
+        self.resyncInterval = resyncInterval
+        self.drift = 0.0
+        self.rtt = None
+        self.syncs = 0
+        self.syncErrors = 0
+        self._history = _deque(maxlen=maxHistory) # [(monotonic, offset), ...]
+        self._offset = None # Server time minus monotonic time
+        self._syncedAt = None
+        self._lock = _threading.Lock()
+        self._syncLock = _threading.Lock()
+        self._wakeUp = _threading.Event()
+        self._closed = False
+        self._thread = _threading.Thread(target=self._run, name="GameJoltClock", daemon=True)
+        self._thread.start()
+        
+    def _sample(self):
+        # type: () -> tuple
+        
+        # A cached response would be as old as the cache entry
+        if self.api.cache is not None:
+            self.api.cache.invalidate("time")
+            
+        start = _monotonic()
+        response = self.api.time()
+        end = _monotonic()
+        
+        if response.get("success") not in ("true", True):
+            return None
+            
+        # The timestamp is truncated to the second, so the server was half a second later on average
+        return end - start, int(response["timestamp"]) + 0.5 - (start + end) / 2
+        
+    def sync(self):
+        # type: () -> bool
+        
+        """Synchronizes with the server right away.
+        
+        :return: If at least one sample succeeded.
+        :rtype: bool"""
+        
+        with self._syncLock:
+            samples = [sample for sample in [self._sample() for _ in range(self.samples)] if sample is not None]
+            
+            if not samples:
+                self.syncErrors += 1
+                return False
+                
+            rtt, offset = min(samples)
+            now = _monotonic()
+            
+            with self._lock:
+                self._history.append((now, offset))
+                self._offset = offset
+                self._syncedAt = now
+                self.rtt = rtt
+                self.drift = self._estimateDrift()
+                self.syncs += 1
+                
+            return True
+            
+    def _estimateDrift(self):
+        # type: () -> float
+        
+        if len(self._history) < 3 or self._history[-1][0] - self._history[0][0] < self.MIN_DRIFT_SPAN:
+            return 0.0
+            
+        # Least squares slope of the offset over time
+        count = len(self._history)
+        meanTime = sum([entry[0] for entry in self._history]) / count
+        meanOffset = sum([entry[1] for entry in self._history]) / count
+        covariance = sum([(entry[0] - meanTime) * (entry[1] - meanOffset) for entry in self._history])
+        variance = sum([(entry[0] - meanTime) ** 2 for entry in self._history])
+        return covariance / variance if variance else 0.0
+        
+    @property
+    def offset(self):
+        # type: () -> float
+        
+        """The estimated server time minus the local wall clock time, in seconds, or ``None`` before the first synchronization."""
+        
+        serverNow = self.serverNow(sync=False)
+        return serverNow - _time() if serverNow is not None else None
+        
+    def serverNow(self, sync=True):
+        # type: (bool) -> float
+        
+        """Returns the estimated current time of the server.
+        
+        :param sync: If synchronize first when never synchronized. Optional, defaults to ``True``.
+        :type sync: bool
+        
+        :return: A UNIX timestamp in seconds, or ``None`` if not synchronized.
+        :rtype: float"""
+        
+        if self._offset is None and sync:
+            self.sync()
+            
+        with self._lock:
+            if self._offset is None:
+                return None
+                
+            now = _monotonic()
+            return now + self._offset + (now - self._syncedAt) * self.drift
+            
+    def _run(self):
+        # type: () -> None
+        
+        while not self._closed:
+            self._wakeUp.wait(self.resyncInterval if self._offset is not None else min(self.resyncInterval, 5.0))
+            
+            if self._closed:
+                return
+                
+            try:
+                self.sync()
+            except Exception:
+                self.syncErrors += 1
+                
+    def close(self):
+        # type: () -> None
+        
+        """Stops the background synchronizations."""
+        
+        self._closed = True
+        self._wakeUp.set()
+        self._thread.join()
+
+
+def _toNumber(value):
+    # type: (str | int | float) -> int | float
+    
+    if isinstance(value, (int, float)):
+        return value
+        
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _formatNumber(value):
+    # type: (int | float) -> str
+    
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def _isFoldableNumber(value):
+    # type: (object) -> bool
+    
+    if isinstance(value, (int, float)):
+        return True
+        
+    try:
+        return _formatNumber(_toNumber(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+class GameJoltDataStoreBuffer:
+    """ A write-behind buffer for the data store. Writes made through :meth:`dataStoreSet` 
+    and :meth:`dataStoreUpdate` return immediately and are folded locally per key: 
+    consecutive ``"add"`` and ``"subtract"`` operations become one net ``"add"`` or 
+    ``"subtract"``, consecutive ``"multiply"``, ``"divide"``, ``"append"`` and ``"prepend"`` 
+    operations become one, and updates after a set are applied to the set value unless it is 
+    bytes or a file. Folded 
+    writes are flushed every ``flushInterval`` seconds through :meth:`GameJoltAPI.batchMany`.
+    
+    :param api: The API instance used to generate and submit the requests. Its ``responseFormat`` must be ``"json"``.
+    :type api: GameJoltAPI
+    
+    :param flushInterval: Maximum seconds a write stays buffered, which bounds the writes lost if the process dies. Optional, defaults to ``1``.
+    :type flushInterval: float
+    
+    :param maxPendingKeys: Flushes right away when this amount of keys have buffered writes. Optional, defaults to ``500``.
+    :type maxPendingKeys: int
+    
+    :param flushOnExit: If the buffered writes are flushed when the interpreter exits. Optional, defaults to ``True``.
+    :type flushOnExit: bool
+    
+    .. note::
+    
+       - Writes not processed due to a connection or HTTP error, or not sent at all because :meth:`flush` raised (e.g. :class:`GameJoltCircuitOpen`), are kept and retried on the next flush. Writes rejected by the server are dropped and counted in ``failedWrites``.
+       - Writes of the same key are always submitted in order.
+       - Call :meth:`close` when done to flush the remaining writes and stop the background thread.
+       
+    .. code-block:: python
+       
+       buffer = gamejoltapi.GameJoltDataStoreBuffer(api, flushInterval=5)
+       
+       # Many calls per second become one request every 5 seconds
+       buffer.dataStoreUpdate("kills", "add", 1)
+       
+       buffer.close()
+       
+    """
+    
+    def __init__(self, api, flushInterval=1.0, maxPendingKeys=500, flushOnExit=True):
+        # type: (GameJoltAPI, float, int, bool) -> None
+        
+        self.api = api
+        self.flushInterval = flushInterval
+        self.maxPendingKeys = maxPendingKeys
+        self.flushOnExit = flushOnExit
+        self.foldedWrites = 0
+        self.sentWrites = 0
+        self.failedWrites = 0
+        self.flushErrors = 0
+        self._pending = _OrderedDict() # (key, globalData) -> [[operation, value], ...]
+        self._lock = _threading.Lock()
+        self._flushLock = _threading.Lock()
+        self._wakeUp = _threading.Event()
+        self._closed = False
+        self._thread = _threading.Thread(target=self._run, name="GameJoltDataStoreBuffer", daemon=True)
+        self._thread.start()
+        
+        if flushOnExit:
+            _atexit.register(self.close)
+            
+    def _fold(self, pending, operation, value):
+        # type: (list, str, object) -> bool
+        
+        last = pending[-1] if pending else None
+        lastOperation = last[0] if last is not None else None
+        
+        if operation == "set":
+            pending[:] = [["set", value]]
+            return last is not None
+            
+        if operation in ("add", "subtract"):
+            number = _toNumber(value) if operation == "add" else -_toNumber(value)
+            
+            if lastOperation == "add" or (lastOperation == "set" and _isFoldableNumber(last[1])):
+                last[1] = _toNumber(last[1]) + number
+                return True
+            pending.append(["add", number])
+            
+        elif operation == "multiply":
+            if lastOperation == "multiply" or (lastOperation == "set" and _isFoldableNumber(last[1])):
+                last[1] = _toNumber(last[1]) * _toNumber(value)
+                return True
+            pending.append(["multiply", _toNumber(value)])
+            
+        elif operation == "divide":
+            # Dividing by a then by b is dividing by a * b
+            if lastOperation == "divide":
+                last[1] = last[1] * _toNumber(value)
+                return True
+            pending.append(["divide", _toNumber(value)])
+            
+        elif operation == "append":
+            # A set value which is not a string, such as bytes or a file, is sent before the append
+            if lastOperation == "append" or (lastOperation == "set" and isinstance(last[1], str)):
+                last[1] = str(last[1]) + str(value)
+                return True
+            pending.append(["append", str(value)])
+            
+        elif operation == "prepend":
+            if lastOperation == "prepend" or (lastOperation == "set" and isinstance(last[1], str)):
+                last[1] = str(value) + str(last[1])
+                return True
+            pending.append(["prepend", str(value)])
+            
+        else:
+            pending.append([operation, value])
+            
+        return False
+        
+    def _write(self, key, operation, value, globalData):
+        # type: (str, str, object, bool) -> None
         
-        return self._submit(self.operations["data-store/set"], data)
+        # Raises before the key gets a pending entry
+        if operation in ("add", "subtract", "multiply", "divide"):
+            _toNumber(value)
+            
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot buffer writes on a closed buffer")
+                
+            pending = self._pending.setdefault((key, globalData), [])
+            
+            if self._fold(pending, operation, value):
+                self.foldedWrites += 1
+                
+            if len(self._pending) >= self.maxPendingKeys:
+                self._wakeUp.set()
+                
+    def dataStoreSet(self, key, data, globalData=False):
+        # type: (str, str, bool) -> None
+        
+        """Buffers a :meth:`GameJoltAPI.dataStoreSet` call. Replaces the writes of the key buffered before it."""
+        
+        self._write(key, "set", data, globalData)
         
     def dataStoreUpdate(self, key, operation, value, globalData=False):
-        # type: (str, str, str, bool) -> dict
+        # type: (str, str, str, bool) -> None
         
-        """Updates data in the data store.
+        """Buffers a :meth:`GameJoltAPI.dataStoreUpdate` call.
         
-        :param key: The key of the data item you'd like to update.
-        :type key: str
+        :raises ValueError: If ``value`` is not a number in a mathematic operation."""
+        
+        self._write(key, operation, value, globalData)
+        
+    def _buildRequest(self, key, operation, value, globalData):
+        # type: (str, str, object, bool) -> GameJoltRequest
+        
+        if operation == "set":
+            return self.api.build.dataStoreSet(key, _formatNumber(value) if isinstance(value, (int, float)) else value, globalData)
+            
+        if operation == "add" and value < 0:
+            operation, value = "subtract", -value
+            
+        return self.api.build.dataStoreUpdate(key, operation, _formatNumber(value) if isinstance(value, (int, float)) else value, globalData)
+        
+    def flush(self):
+        # type: () -> None
+        
+        """Submits all buffered writes right away and waits for their responses."""
+        
+        with self._flushLock:
+            with self._lock:
+                pending = self._pending
+                self._pending = _OrderedDict()
+                
+            # One round per write of the same key, so the writes of a key keep their order
+            while pending:
+                keys = [pendingKey for pendingKey, writes in pending.items() if writes]
+                requests = [self._buildRequest(key, pending[(key, globalData)][0][0], pending[(key, globalData)][0][1], globalData) for key, globalData in keys]
+                
+                try:
+                    result = self.api.batchMany(requests)
+                except Exception:
+                    # Not known to be processed, e.g. with the circuit breaker open
+                    self._requeue(pending)
+                    raise
+                    
+                unsent = _OrderedDict()
+                
+                for pendingKey, response in zip(keys, result["responses"]):
+                    if response is None:
+                        unsent[pendingKey] = pending[pendingKey]
+                        continue
+                        
+                    pending[pendingKey].pop(0)
+                    self.sentWrites += 1
+                    
+                    if response.get("success") not in ("true", True):
+                        self.failedWrites += 1
+                        
+                pending = _OrderedDict([(pendingKey, writes) for pendingKey, writes in pending.items() if writes and pendingKey not in unsent])
+                self._requeue(unsent)
+                
+    def _requeue(self, unsent):
+        # type: (_OrderedDict) -> None
+        
+        # Keep the unsent writes ahead of the ones buffered since
+        with self._lock:
+            for pendingKey, writes in unsent.items():
+                if writes:
+                    self._pending[pendingKey] = writes + self._pending.get(pendingKey, [])
+                    
+    def _run(self):
+        # type: () -> None
+        
+        while not self._closed:
+            self._wakeUp.wait(self.flushInterval)
+            self._wakeUp.clear()
+            
+            try:
+                self.flush()
+            except Exception:
+                self.flushErrors += 1
+                
+    def pendingWrites(self):
+        # type: () -> int
+        
+        """Returns the amount of buffered writes after folding.
+        
+        :rtype: int"""
+        
+        with self._lock:
+            return sum([len(writes) for writes in self._pending.values()])
+            
+    def close(self):
+        # type: () -> None
+        
+        """Flushes the buffered writes and stops the background thread. No more writes can be buffered afterwards."""
+        
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            
+        self._wakeUp.set()
+        self._thread.join()
+        self.flush()
+        
+        if self.flushOnExit:
+            _atexit.unregister(self.close)
+
+
+class GameJoltBlobStore:
+    """ Stores big values in the data store compressed and, when needed, split across 
+    several keys. :meth:`dataStoreSet` compresses the value with ``codec`` and frames it 
+    as base64 text. Encoded values longer than ``chunkSize`` are split into chunk keys 
+    plus a manifest stored on the key itself. :meth:`dataStoreFetch` reads the chunks 
+    back through :meth:`GameJoltAPI.batchMany`, reassembles and decompresses them.
+    
+    :param api: The API instance used to generate and submit the requests. Its ``responseFormat`` must be ``"json"``.
+    :type api: GameJoltAPI
+    
+    :param codec: The compression, ``"zlib"``, ``"zstd"`` (requires the ``zstandard`` package) or ``"none"``. Optional, defaults to ``"zlib"``.
+    :type codec: str
+    
+    :param level: The compression level. Optional, defaults to the codec default.
+    :type level: int
+    
+    :param chunkSize: The maximum length of the encoded value stored in one key. Optional, defaults to ``1048576``.
+    :type chunkSize: int
+    
+    :param maxWorkers: The maximum amount of chunks written at the same time. Optional, defaults to ``4``.
+    :type maxWorkers: int
+    
+    .. note::
+    
+       - Values not written by a blob store are returned unchanged by :meth:`dataStoreFetch`, so existing keys keep working.
+       - Chunks are written first, with a new version in their keys, and the manifest last, so readers never see a half written value. The chunks of the previous version are removed afterwards.
+       - The previous version of a key is fetched on its first write only, then the store remembers the manifests it writes and reads. Versions written meanwhile by another process or store instance can leave unused chunks behind.
+       - Batch sub-requests cannot carry a request body, so chunks are written as concurrent POST requests while chunk reads go through batch requests.
+       
+    .. code-block:: python
+       
+       blobs = gamejoltapi.GameJoltBlobStore(api)
+       blobs.dataStoreSet("save", saveGameBytes)
+       saveGameBytes = blobs.dataStoreFetch("save")["data"]
+       
+    """
+    
+    PREFIX = "gjb1:"
+    
+    def __init__(self, api, codec="zlib", level=None, chunkSize=1048576, maxWorkers=4):
+        # type: (GameJoltAPI, str, int, int, int) -> None
+        
+        if codec not in ("zlib", "zstd", "none"):
+            raise ValueError("Unknown codec: " + repr(codec))
+            
+        if codec == "zstd" and _zstandard is None:
+            raise ImportError("The zstd codec requires the zstandard package")
+            
+        self.api = api
+        self.codec = codec
+        self.level = level
+        self.chunkSize = chunkSize
+        self.maxWorkers = maxWorkers
+        self._manifests = {} # (key, globalData) -> (version, count), or None for a value in one key
+        self._lock = _threading.Lock()
+        
+    def _rememberManifest(self, key, globalData, manifest):
+        # type: (str, bool, tuple) -> None
+        
+        with self._lock:
+            self._manifests[(key, globalData)] = manifest
+            
+    def _previousManifest(self, key, globalData):
+        # type: (str, bool) -> tuple
         
-        :param operation: The operation you'd like to perform.
-        :type operation: str
+        with self._lock:
+            if (key, globalData) in self._manifests:
+                return self._manifests[(key, globalData)]
+                
+        return self._parseManifest(self._fetchRaw(key, globalData).get("data"))
         
-        :param value: The value you'd like to apply to the data store item. (See values below.)
-        :type value: str
+    def _compress(self, data, codec):
+        # type: (bytes, str) -> bytes
         
-        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
-        :type globalData: bool
+        if codec == "zlib":
+            return _zlib.compress(data, self.level if self.level is not None else -1)
+        elif codec == "zstd":
+            return _zstandard.ZstdCompressor(level=self.level if self.level is not None else 3).compress(data)
+        return data
         
-        .. note::
+    def _decompress(self, data, codec):
+        # type: (bytes, str) -> bytes
         
-           Valid Values for ``operation``:
-           
-           - ``"add"``: Adds the ``value`` to the current data store item.
-           - ``"subtract"``: Substracts the ``value`` from the current data store item.
-           - ``"multiply"``: Multiplies the ``value`` by the current data store item.
-           - ``"divide"``: Divides the current data store item by the ``value``.
-           - ``"append"``: Appends the ``value`` to the current data store item.
-           - ``"prepend"``: Prepends the ``value`` to the current data store item.
+        if codec == "zlib":
+            return _zlib.decompress(data)
+        elif codec == "zstd":
+            if _zstandard is None:
+                raise ImportError("The zstd codec requires the zstandard package")
+            return _zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        return data
         
-        .. note::
+    def _encode(self, data):
+        # type: (str | bytes) -> str
         
-           You can only perform mathematic operations on numerical data.
+        isText = isinstance(data, str)
+        payload = _base64.b64encode(self._compress(data.encode() if isText else bytes(data), self.codec)).decode()
+        return self.PREFIX + self.codec + ":" + ("s" if isText else "b") + ":" + payload
         
-        .. code-block:: python
-           
-           # Adds "100" to "some_global_value" in the global data store
-           result = api.dataStoreUpdate("some_global_value", "add", "100", globalData=True)
-           
-        """
+    def _decode(self, value):
+        # type: (str) -> str | bytes
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "key" : key,
-            "operation" : operation,
-            "value" : value
-        }
+        codec, dataType, payload = value[len(self.PREFIX):].split(":", 2)
+        data = self._decompress(_base64.b64decode(payload), codec)
+        return data.decode() if dataType == "s" else data
         
-        # Optional data
-        optionalData = {
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+    def _chunkKey(self, key, version, index):
+        # type: (str, str, int) -> str
         
-        # Process global data instead of user data
-        if globalData:
-            optionalData["username"] = None
-            optionalData["user_token"] = None
+        return key + "." + version + "." + str(index)
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
+    def _parseManifest(self, value):
+        # type: (str) -> tuple
         
-        return self._submit(self.operations["data-store/update"], data)
+        if not isinstance(value, str) or not value.startswith(self.PREFIX + "manifest:"):
+            return None
+            
+        version, count = value[len(self.PREFIX + "manifest:"):].split(":")
+        return version, int(count)
         
-    def dataStoreRemove(self, key, globalData=False):
+    def _fetchRaw(self, key, globalData):
         # type: (str, bool) -> dict
         
-        """Removes data from the data store.
+        return self.api.dataStoreFetch(key, globalData)
         
-        :param key: The key of the data item you'd like to remove.
-        :type key: str
+    def dataStoreSet(self, key, data, globalData=False):
+        # type: (str, str | bytes, bool) -> dict
         
-        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
-        :type globalData: bool
+        """Compresses and stores a value, splitting it across several keys if needed.
         
-        .. code-block:: python
-           
-           # Remove "some_global_value" from global data store
-           result = api.dataStoreRemove("some_global_value", globalData=True)
-           
-        """
+        :param key: The key of the data item you'd like to set.
+        :type key: str
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "key" : key
-        }
+        :param data: The data you'd like to set. Text is returned as text by :meth:`dataStoreFetch`, bytes as bytes.
+        :type data: str or bytes
         
-        # Optional data
-        optionalData = {
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+        :param globalData: If set to `True`, processes global data instead of user data.
+        :type globalData: bool
         
-        # Process global data instead of user data
-        if globalData:
-            optionalData["username"] = None
-            optionalData["user_token"] = None
+        :return: The response of the request which stored the value or the manifest.
+        :rtype: dict"""
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
+        encoded = self._encode(data)
+        previous = self._previousManifest(key, globalData)
+        manifest = None
         
-        return self._submit(self.operations["data-store/remove"], data)
+        if len(encoded) <= self.chunkSize:
+            response = self.api.dataStoreSet(key, encoded, globalData)
+        else:
+            version = _uuid4().hex[:8]
+            chunks = [encoded[i:i + self.chunkSize] for i in range(0, len(encoded), self.chunkSize)]
+            
+            with _ThreadPoolExecutor(min(self.maxWorkers, len(chunks))) as executor:
+                responses = list(executor.map(
+                    lambda indexAndChunk: self.api.dataStoreSet(self._chunkKey(key, version, indexAndChunk[0]), indexAndChunk[1], globalData), 
+                    enumerate(chunks)
+                ))
+                
+            failed = [chunkResponse for chunkResponse in responses if chunkResponse.get("success") not in ("true", True)]
+            
+            if failed:
+                return failed[0]
+                
+            manifest = (version, len(chunks))
+            response = self.api.dataStoreSet(key, self.PREFIX + "manifest:" + version + ":" + str(len(chunks)), globalData)
+            
+        if response.get("success") not in ("true", True):
+            return response
+            
+        self._rememberManifest(key, globalData, manifest)
+        
+        if previous is not None:
+            self.api.batchMany([self.api.build.dataStoreRemove(self._chunkKey(key, previous[0], i), globalData) for i in range(previous[1])])
+            
+        return response
         
     def dataStoreFetch(self, key, globalData=False):
         # type: (str, bool) -> dict
         
-        """Returns data from the data store.
+        """Fetches a value stored by :meth:`dataStoreSet`, reassembling and decompressing it.
         
         :param key: The key of the data item you'd like to fetch.
         :type key: str
         
-        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
+        :param globalData: If set to `True`, processes global data instead of user data.
         :type globalData: bool
         
-        .. code-block:: python
-           
-           # Get "some_global_value" from global data store
-           result = api.dataStoreFetch("some_global_value", globalData=True)
-           
-        """
+        :return: The ``data-store/fetch`` response with the decoded value in ``"data"``.
+        :rtype: dict"""
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "key" : key
-        }
+        response = self._fetchRaw(key, globalData)
+        value = response.get("data")
         
-        # Optional data
-        optionalData = {
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+        if response.get("success") not in ("true", True):
+            return response
+            
+        manifest = self._parseManifest(value)
+        self._rememberManifest(key, globalData, manifest)
         
-        # Process global data instead of user data
-        if globalData:
-            optionalData["username"] = None
-            optionalData["user_token"] = None
+        if not isinstance(value, str) or not value.startswith(self.PREFIX):
+            return response
+            
+        if manifest is not None:
+            version, count = manifest
+            result = self.api.batchMany([self.api.build.dataStoreFetch(self._chunkKey(key, version, i), globalData) for i in range(count)])
+            failed = [chunkResponse for chunkResponse in result["responses"] if chunkResponse is None or chunkResponse.get("success") not in ("true", True)]
+            
+            if failed:
+                return failed[0] if failed[0] is not None else {"success" : "false", "message" : "Chunk not fetched", "chunks" : result["chunks"]}
+                
+            value = "".join([chunkResponse["data"] for chunkResponse in result["responses"]])
+            
+        response = dict(response)
+        response["data"] = self._decode(value)
+        return response
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
+    def dataStoreRemove(self, key, globalData=False):
+        # type: (str, bool) -> dict
         
-        return self._submit(self.operations["data-store/fetch"], data)
+        """Removes a value stored by :meth:`dataStoreSet`, including its chunks.
         
-    def dataStoreGetKeys(self, pattern=None, globalData=False):
-        # type: (str, bool) -> dict
+        :return: The ``data-store/remove`` response of the key.
+        :rtype: dict"""
         
-        """Returns either all the keys in the game's global data store, or all the keys in a user's data store.
+        manifest = self._parseManifest(self._fetchRaw(key, globalData).get("data"))
+        requests = [self.api.build.dataStoreRemove(key, globalData)]
         
-        :param pattern: The pattern to apply to the key names in the data store.
-        :type pattern: str
+        if manifest is not None:
+            requests += [self.api.build.dataStoreRemove(self._chunkKey(key, manifest[0], i), globalData) for i in range(manifest[1])]
+            
+        result = self.api.batchMany(requests)
         
-        :param globalData: If set to `True`, ignores ``username`` and ``userToken`` set in constructor and processes global data instead of user data.
-        :type globalData: bool
+        if result["responses"][0] is not None and result["responses"][0].get("success") in ("true", True):
+            self._rememberManifest(key, globalData, None)
+            
+        # The result of the batch request itself if it failed as a whole
+        return result["responses"][0] if result["responses"][0] is not None else result["chunks"][0]
+
+
+class GameJoltOutbox:
+    """ A durable outbox for writes which must not be lost when the network fails, such as 
+    scores and trophies. Each write is appended to a local journal file and acknowledged 
+    right away, then a background thread submits the journaled writes through 
+    :meth:`GameJoltAPI.batchMany` until the server processes them. Writes left in the 
+    journal by a previous run are loaded and submitted again.
+    
+    :param api: The API instance used to generate and submit the requests. Its ``responseFormat`` must be ``"json"``.
+    :type api: GameJoltAPI
+    
+    :param path: The path of the journal file. It is created if it does not exist, only readable by the current user.
+    :type path: str
+    
+    :param flushInterval: Seconds between the submissions of the journaled writes. Optional, defaults to ``1``.
+    :type flushInterval: float
+    
+    :param maxBackoff: Maximum seconds to wait before submitting again while the submissions fail. Optional, defaults to ``60``.
+    :type maxBackoff: float
+    
+    :param maxRequests: Maximum amount of writes submitted per flush. Optional, defaults to ``500``.
+    :type maxRequests: int
+    
+    :param flushOnExit: If the journaled writes are submitted when the interpreter exits. Optional, defaults to ``True``.
+    :type flushOnExit: bool
+    
+    :param userTokens: A callable returning the user token of a username, or ``None`` if unknown. Used to sign the writes journaled by a previous run. Optional.
+    :type userTokens: callable
+    
+    .. note::
+    
+       - The journal is written to the operating system on every write, so writes survive a crash of the process. It is synced to the disk every ``flushInterval`` seconds.
+       - The journal holds the usernames and parameters of the writes, but no user token nor signature: writes are signed again when submitted. Writes of a user whose token is unknown (not the user of ``api``, not submitted since the outbox was opened and not returned by ``userTokens``) stay journaled.
+       - Writes not processed due to a connection or HTTP error are retried with an exponential backoff. Writes rejected by the server are dropped and counted in ``failedWrites``.
+       - Pending ``trophies/add-achieved`` writes of the same user and trophy are only submitted once.
+       - ``scores/add`` and ``data-store/update`` writes are journaled as being sent before their submission, and are never submitted again once the server may have processed them: if their response is lost, or the process stops before it arrives, they are dropped and counted in ``uncertainWrites``. A score can be lost that way, but never added twice.
+       - Writes of other users are queued with :meth:`submit` and the requests built by their handles, see :meth:`GameJoltAPI.forUser`.
+       
+    .. code-block:: python
+       
+       outbox = gamejoltapi.GameJoltOutbox(api, "gamejolt-outbox.log")
+       
+       # Returns in microseconds, even while offline
+       outbox.scoresAdd("500 Points", 500)
+       outbox.trophiesAddAchieved(TROPHY_ID)
+       
+       outbox.close()
+       
+    """
+    
+    DEDUPLICATED_OPERATIONS = ("trophies/add-achieved",)
+    NON_IDEMPOTENT_OPERATIONS = ("scores/add", "data-store/update")
+    COMPACT_AFTER = 10000 # Acknowledged entries in the journal before it is rewritten
+    
+    def __init__(self, api, path, flushInterval=1.0, maxBackoff=60.0, maxRequests=500, flushOnExit=True, userTokens=None):
+        # type: (GameJoltAPI, str, float, float, int, bool, callable) -> None
+        
+        self.api = api
+        self.path = path
+        self.flushInterval = flushInterval
+        self.maxBackoff = maxBackoff
+        self.maxRequests = maxRequests
+        self.flushOnExit = flushOnExit
+        self.userTokens = userTokens
+        self.sentWrites = 0
+        self.failedWrites = 0
+        self.uncertainWrites = 0
+        self.deduplicatedWrites = 0
+        self.flushErrors = 0
+        self._pending = _OrderedDict() # id -> (operation, query without the credentials)
+        self._pendingKeys = {} # (operation, query) -> id, for the deduplicated operations
+        self._tokens = {api.username : api.userToken} if api.username and api.userToken else {} # username -> userToken, never journaled
+        self._acknowledged = 0
+        self._idPrefix = _uuid4().hex[:12]
+        self._idCounter = _itertools.count()
+        self._dirty = False
+        self._lock = _threading.Lock()
+        self._flushLock = _threading.Lock()
+        self._wakeUp = _threading.Event()
+        self._closed = False
+        uncertain = self._load()
+        self._journal = self._openJournal(self.path, "a")
+        
+        if uncertain:
+            self._record("-", uncertain)
+            
+        self._thread = _threading.Thread(target=self._run, name="GameJoltOutbox", daemon=True)
+        self._thread.start()
         
-        .. note::
-           
-           - If you apply a pattern to the request, only keys with applicable key names will be returned. The placeholder character for patterns is ``*``.
-           - This request will return a list of the ``key`` values. The ``key`` return value can appear more than once.
+        if flushOnExit:
+            _atexit.register(self.close)
+            
+    def _openJournal(self, path, mode):
+        # type: (str, str) -> object
         
-        .. code-block:: python
-           
-           # Get keys from global data store starting with "some_global"
-           result = api.dataStoreGetKeys("some_global_*", globalData=True)
-           
-        """
+        # Only readable by the current user, as it holds the usernames and data of the writes
+        flags = _os.O_WRONLY | _os.O_CREAT | (_os.O_APPEND if mode == "a" else _os.O_TRUNC)
+        return _os.fdopen(_os.open(path, flags, 0o600), mode, encoding="utf-8")
         
-        # Required data
-        data = {
-            "game_id" : self.gameId
-        }
+    def _journalQuery(self, url):
+        # type: (str) -> tuple
         
-        # Optional data
-        optionalData = {
-            "username" : self.username,
-            "user_token" : self.userToken,
-            "pattern" : pattern
-        }
+        # The query string of a request without the user token and the signature
+        kept = []
+        username = userToken = None
         
-        # Process global data instead of user data
-        if globalData:
-            optionalData["username"] = None
-            optionalData["user_token"] = None
+        for param in _urlsplit(url).query.split("&"):
+            key, _, value = param.partition("=")
+            
+            if key == "user_token":
+                userToken = _unquotePlus(value)
+            elif key != "signature":
+                kept.append(param)
+                
+                if key == "username":
+                    username = _unquotePlus(value)
+                    
+        return "&".join(kept), username, userToken
+        
+    def _load(self):
+        # type: () -> list
+        
+        # Journal lines are "+ id operation query" for writes, "> id" when a write which is not 
+        # idempotent is being sent, "< id" if it was not processed and "- id" for acknowledged writes
+        if not _os.path.exists(self.path):
+            return []
+            
+        validSize = 0
+        sending = set()
+        
+        with open(self.path, "rb") as journal:
+            for line in journal:
+                # A line without its end was cut by a crash while being written
+                if not line.endswith(b"\n"):
+                    break
+                    
+                validSize += len(line)
+                fields = line.decode("utf-8").rstrip("\n").split("\t")
+                
+                if fields[0] == "+" and len(fields) == 4:
+                    query = fields[3]
+                    
+                    # Journals of older versions hold the signed URLs
+                    if "://" in query:
+                        query, username, userToken = self._journalQuery(query)
+                        
+                        if username is not None and userToken is not None:
+                            self._tokens[username] = userToken
+                            
+                    self._pending[fields[1]] = (fields[2], query)
+                    
+                    if fields[2] in self.DEDUPLICATED_OPERATIONS:
+                        self._pendingKeys[(fields[2], query)] = fields[1]
+                        
+                elif len(fields) != 2 or fields[1] not in self._pending:
+                    continue
+                    
+                elif fields[0] == ">":
+                    sending.add(fields[1])
+                    
+                elif fields[0] == "<":
+                    sending.discard(fields[1])
+                    
+                elif fields[0] == "-":
+                    sending.discard(fields[1])
+                    self._pendingKeys.pop(self._pending.pop(fields[1]), None)
+                    self._acknowledged += 1
+                    
+        # Drop the cut line, so the next write starts on a new line
+        if validSize < _os.path.getsize(self.path):
+            with open(self.path, "r+b") as journal:
+                journal.truncate(validSize)
+                
+        # Being sent when the process stopped, so maybe processed already
+        uncertain = [writeId for writeId in self._pending if writeId in sending]
+        
+        for writeId in uncertain:
+            del self._pending[writeId]
+            
+        self.uncertainWrites += len(uncertain)
+        return uncertain
+        
+    def submit(self, request):
+        # type: (GameJoltRequest) -> str
+        
+        """Journals a write built with :attr:`GameJoltAPI.build`, to be submitted in the background.
+        
+        :param request: The write request.
+        :type request: GameJoltRequest
+        
+        :return: The ID of the journaled write, or the one already pending for a deduplicated write.
+        :rtype: str"""
+        
+        query, username, userToken = self._journalQuery(request.url)
+        key = (request.operation, query)
+        
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot journal writes on a closed outbox")
+                
+            if username is not None and userToken is not None:
+                self._tokens[username] = userToken
+                
+            if request.operation in self.DEDUPLICATED_OPERATIONS:
+                existingId = self._pendingKeys.get(key)
+                
+                if existingId is not None:
+                    self.deduplicatedWrites += 1
+                    return existingId
+                    
+            writeId = self._idPrefix + "%x" % next(self._idCounter)
+            self._journal.write("+\t" + writeId + "\t" + request.operation + "\t" + query + "\n")
+            self._journal.flush()
+            self._dirty = True
+            self._pending[writeId] = key
+            
+            if request.operation in self.DEDUPLICATED_OPERATIONS:
+                self._pendingKeys[key] = writeId
+            return writeId
+            
+    def scoresAdd(self, score, sort, tableId=None, guest=None, extraData=None):
+        # type: (str, int, int, str, str) -> str
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
+        """Journals a :meth:`GameJoltAPI.scoresAdd` call.
         
-        return self._submit(self.operations["data-store/get-keys"], data)
+        :return: The ID of the journaled write.
+        :rtype: str"""
         
-    # Friends
-    def friends(self):
-        # type: () -> dict
+        return self.submit(self.api.build.scoresAdd(score, sort, tableId, guest, extraData))
         
-        """Returns the list of a user's friends."""
+    def trophiesAddAchieved(self, trophyId):
+        # type: (int) -> str
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "username" : self.username,
-            "user_token" : self.userToken
-        }
+        """Journals a :meth:`GameJoltAPI.trophiesAddAchieved` call.
         
-        self._validateRequiredData(data)
+        :return: The ID of the journaled write.
+        :rtype: str"""
         
-        return self._submit(self.operations["friends"], data)
-    
-    # Time
-    def time(self):
-        # type: () -> dict
+        return self.submit(self.api.build.trophiesAddAchieved(trophyId))
         
-        """Returns the time of the Game Jolt server."""
+    def pendingWrites(self):
+        # type: () -> int
         
-        # Required data
-        data = {
-            "game_id" : self.gameId
-        }
+        """Returns the amount of journaled writes not processed by the server yet.
         
-        self._validateRequiredData(data)
-        return self._submit(self.operations["time"], data)
-    
-    # Batch Calls
-    def batch(self, requests=[], parallel=None, breakOnError=None):
-        # type: (list[str], bool, bool) -> dict
+        :rtype: int"""
         
-        """A batch request is a collection of sub-requests that enables developers to send multiple API calls with one HTTP request. 
+        with self._lock:
+            return len(self._pending)
+            
+    def _userToken(self, username):
+        # type: (str) -> str
         
-        :param requests: An list of sub-request URLs. Each request will be executed and the responses of each one will be returned in the payload.
-        :type requests: list of str
+        with self._lock:
+            userToken = self._tokens.get(username)
+            
+        if userToken is None and self.userTokens is not None:
+            userToken = self.userTokens(username)
+            
+            if userToken is not None:
+                with self._lock:
+                    self._tokens[username] = userToken
+                    
+        return userToken
         
-        :param parallel: By default, each sub-request is processed on the servers sequentially. If this is set to ``True``, then all sub-requests are processed at the same time, without waiting for the previous sub-request to finish before the next one is started.
-        :type parallel: bool
+    def _signedRequest(self, operation, query):
+        # type: (str, str) -> GameJoltRequest
         
-        :param breakOnError: If this is set to ``True``, one sub-request failure will cause the entire batch to stop processing subsequent sub-requests and return a value of ``"false"`` for success.
-        :type breakOnError: bool
+        data = dict(_parseQsl(query, keep_blank_values=True))
         
-        .. note::
-           - The maximum amount of sub requests in one batch request is 50.
-           - Dump format is not supported in batch calls.
-           - The ``parallel`` and ``breakOnError`` parameters cannot be used in the same request.
+        if "username" in data:
+            userToken = self._userToken(data["username"])
+            
+            if userToken is None:
+                return None
+                
+            data["user_token"] = userToken
+            
+        return GameJoltRequest(operation, self.api._buildRequestUrl(self.api.operations[operation], data))
         
-        .. code-block:: python
-           
-           # Disable request submitting to get URLs from methods
-           api.submitRequests = False
-           
-           # Generate list of request URLs
-           requests = [
-               api.usersFetch(),
-               api.sessionsCheck(),
-               api.scoresTables(),
-               api.trophiesFetch(),
-               api.dataStoreGetKeys("*", globalData=True),
-               api.friends(),
-               api.time()
-           ]
-           
-           # Enable request submitting again
-           api.submitRequests = True
-           
-           # Submit batch request and get all results
-           result = api.batch(requests=requests)
+    def _record(self, marker, writeIds):
+        # type: (str, list[str]) -> None
         
-        """
+        with self._lock:
+            self._journal.write("".join([marker + "\t" + writeId + "\n" for writeId in writeIds]))
+            self._journal.flush()
+            self._dirty = True
+            
+    def _sync(self):
+        # type: () -> None
         
-        if parallel is not None and breakOnError is not None:
-            raise GameJoltDataCollision(["parallel", "break_on_error"])
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = False
+            
+        if dirty:
+            _os.fsync(self._journal.fileno())
+            
+    def _acknowledge(self, writeIds, unsent, sentWrites, failedWrites, uncertainWrites):
+        # type: (list[str], list[str], int, int, int) -> None
         
-        for i in range(len(requests)):
-            requests[i] = requests[i].replace(self.__API_URL, "")
-            requests[i] = requests[i].split("&signature=")[0]
-            requests[i] += "&signature=" + _md5((requests[i] + self.privateKey).encode()).hexdigest()
-            requests[i] = _quote(requests[i].replace(self.__API_URL, ""), safe="")
+        with self._lock:
+            self.sentWrites += sentWrites
+            self.failedWrites += failedWrites
+            self.uncertainWrites += uncertainWrites
+            
+            for writeId in writeIds:
+                key = self._pending.pop(writeId)
+                
+                if self._pendingKeys.get(key) == writeId:
+                    del self._pendingKeys[key]
+                    
+            self._acknowledged += len(writeIds)
+            
+            if not self._pending:
+                self._journal.seek(0)
+                self._journal.truncate()
+                self._acknowledged = 0
+                
+            elif self._acknowledged >= self.COMPACT_AFTER:
+                self._compact()
+                
+            else:
+                self._journal.write("".join(["-\t" + writeId + "\n" for writeId in writeIds] + ["<\t" + writeId + "\n" for writeId in unsent]))
+                self._journal.flush()
+                
+            self._dirty = True
+            
+    def _compact(self):
+        # type: () -> None
         
-        # Required data
-        data = {
-            "game_id" : self.gameId,
-            "requests" : requests if len(requests) > 0 else None
-        }
+        # Rewrites the journal with the pending writes only, replacing it atomically
+        temporaryPath = self.path + ".tmp"
         
-        # Optional data
-        optionalData = {
-            "parallel" : self._processBoolean(parallel),
-            "break_on_error" : self._processBoolean(breakOnError)
-        }
+        with self._openJournal(temporaryPath, "w") as journal:
+            journal.write("".join(["+\t" + writeId + "\t" + operation + "\t" + query + "\n" for writeId, (operation, query) in self._pending.items()]))
+            journal.flush()
+            _os.fsync(journal.fileno())
+            
+        self._journal.close()
+        _os.replace(temporaryPath, self.path)
+        self._journal = self._openJournal(self.path, "a")
+        self._acknowledged = 0
         
-        self._validateRequiredData(data)
-        data.update(self._getValidData(optionalData))
+    def flush(self):
+        # type: () -> bool
         
-        return self._submit(self.operations["batch"], data)
-
+        """Submits the journaled writes right away and waits for their responses.
+        
+        :return: If all the submitted writes were processed by the server, so no connection or HTTP error happened.
+        :rtype: bool"""
+        
+        with self._flushLock:
+            self._sync()
+            unsigned = set() # Writes of users whose token is unknown
+            
+            while True:
+                with self._lock:
+                    candidates = list(_itertools.islice([(writeId, key) for writeId, key in self._pending.items() if writeId not in unsigned], self.maxRequests))
+                    
+                if not candidates:
+                    return True
+                    
+                pending = []
+                
+                for writeId, (operation, query) in candidates:
+                    request = self._signedRequest(operation, query)
+                    
+                    if request is None:
+                        unsigned.add(writeId)
+                    else:
+                        pending.append((writeId, request))
+                        
+                if not pending:
+                    continue
+                    
+                # Synced before sending, so a crash never sends them twice
+                sending = [writeId for writeId, request in pending if request.operation in self.NON_IDEMPOTENT_OPERATIONS]
+                
+                if sending:
+                    self._record(">", sending)
+                    self._sync()
+                    
+                result = self.api.batchMany([request for writeId, request in pending])
+                processed = []
+                unsent = []
+                sentWrites = failedWrites = uncertainWrites = 0
+                retry = False
+                
+                for index, ((writeId, request), response) in enumerate(zip(pending, result["responses"])):
+                    if response is None:
+                        notProcessed = result["chunks"][index // _BATCH_LIMIT].get("processed") == "false"
+                        
+                        if request.operation not in self.NON_IDEMPOTENT_OPERATIONS:
+                            retry = True
+                        elif notProcessed:
+                            unsent.append(writeId)
+                            retry = True
+                        else:
+                            processed.append(writeId)
+                            uncertainWrites += 1
+                        continue
+                        
+                    processed.append(writeId)
+                    sentWrites += 1
+                    
+                    if response.get("success") not in ("true", True):
+                        failedWrites += 1
+                        
+                self._acknowledge(processed, unsent, sentWrites, failedWrites, uncertainWrites)
+                self._sync()
+                
+                if retry:
+                    return False
+                    
+    def _run(self):
+        # type: () -> None
+        
+        failures = 0
+        
+        while not self._closed:
+            self._wakeUp.wait(min(self.maxBackoff, self.flushInterval * 2 ** failures))
+            
+            try:
+                failures = 0 if self.flush() else min(failures + 1, 30)
+            except Exception:
+                with self._lock:
+                    self.flushErrors += 1
+                failures = min(failures + 1, 30)
+                
+    def close(self):
+        # type: () -> None
+        
+        """Submits the journaled writes once more, stops the background thread and closes 
+        the journal. Writes still pending are submitted by the next outbox opened on the journal."""
+        
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            
+        self._wakeUp.set()
+        self._thread.join()
+        
+        try:
+            self.flush()
+        except Exception:
+            with self._lock:
+                self.flushErrors += 1
+                
+        self._sync()
+        self._journal.close()
+        
+        if self.flushOnExit:
+            _atexit.unregister(self.close)
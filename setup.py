@@ -8,7 +8,7 @@ setup(name="gamejoltapi",
       version="0.0.3",
       author="Joel Gomes da Silva",
       author_email="joelgomes1994@hotmail.com",
-      description="Single threaded Python wrapper for the Game Jolt API running through HTTP requests",
+      description="Thread-safe Python wrapper for the Game Jolt API with persistent HTTP connections",
       license="MIT",
       keywords="game jolt gamedev api wrapper interface gamejolt gamejoltapi",
       url="https://github.com/bgempire/gamejoltapi",
@@ -0,0 +1,182 @@
+""" Batch requests: the batch dispatcher, batchMany and iterDataStore against the stand-in server of the benchmarks.
+
+Run from the repository root:
+
+    python -m unittest discover tests
+"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+from urllib.error import HTTPError
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+import gamejoltapi
+import standin
+
+
+class RejectingBatchHandler(standin.GameHandler):
+    """Rejects as a whole every batch request with a sub-request on a key starting with "rejected"."""
+    
+    def batch(self, game, requests, params):
+        if [request for request in requests if "key=rejected" in request]:
+            raise standin.StandInFailure("Rejected batch.")
+        
+        return super().batch(game, requests, params)
+
+
+class BatchTest(unittest.TestCase):
+    def createApi(self, handler=standin.GameHandler, **kwargs):
+        server, apiUrl = standin.startServer(handler, https=False)
+        pool = gamejoltapi.GameJoltConnectionPool()
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        self.addCleanup(pool.close)
+        self.apiUrl = apiUrl
+        return server, gamejoltapi.GameJoltAPI("1", "key", "player", "token", apiUrl=apiUrl, connectionPool=pool, **kwargs)
+    
+    def createDispatcher(self, api, **kwargs):
+        dispatcher = gamejoltapi.GameJoltBatchDispatcher(api, **kwargs)
+        self.addCleanup(dispatcher.close)
+        return dispatcher
+    
+    def setKeys(self, api, keys):
+        result = api.batchMany([api.build.dataStoreSet(key, "value of " + key, globalData=True) for key in keys])
+        self.assertEqual(result["success"], "true")
+    
+    def test_dispatcher_futures_resolve_with_their_sub_responses(self):
+        server, api = self.createApi()
+        dispatcher = self.createDispatcher(api, maxDelay=0.2)
+        futures = [dispatcher.scoresAdd("%d Points" % i, i) for i in range(20)]
+        futures.append(dispatcher.scoresAdd("Invalid", 1, tableId=99))
+        
+        self.assertEqual([future.result()["success"] for future in futures], ["true"] * 20 + ["false"])
+        self.assertEqual(server.requests, 1)
+        self.assertEqual(sorted([score["sort"] for score in server.game.scores[1]]), list(range(20)))
+    
+    def test_dispatcher_splits_max_size_batches(self):
+        server, api = self.createApi()
+        dispatcher = self.createDispatcher(api, maxDelay=10.0, maxSize=10)
+        futures = [dispatcher.trophiesFetch(trophyId=i % 10 + 1) for i in range(30)]
+        
+        for future in futures:
+            self.assertEqual(future.result(timeout=5)["success"], "true")
+        
+        self.assertEqual(server.requests, 3)
+    
+    def test_dispatcher_close_sends_the_queued_calls(self):
+        server, api = self.createApi()
+        dispatcher = gamejoltapi.GameJoltBatchDispatcher(api, maxDelay=10.0)
+        future = dispatcher.sessionsOpen()
+        dispatcher.close()
+        
+        self.assertEqual(future.result(timeout=0)["success"], "true")
+        
+        with self.assertRaises(RuntimeError):
+            dispatcher.sessionsPing()
+    
+    def test_dispatcher_rejected_batch_fails_every_future(self):
+        server, api = self.createApi(RejectingBatchHandler)
+        dispatcher = self.createDispatcher(api, maxDelay=0.2)
+        futures = [dispatcher.dataStoreFetch(key, globalData=True) for key in ("a", "rejected", "b")]
+        
+        for future in futures:
+            with self.assertRaises(gamejoltapi.GameJoltBatchError) as context:
+                future.result()
+            
+            self.assertEqual(context.exception.response["message"], "Rejected batch.")
+    
+    def test_dispatcher_http_error_fails_every_future(self):
+        server, api = self.createApi(standin.faultInjectingHandler(errorRate=1.0, errorStatus=500))
+        dispatcher = self.createDispatcher(api, maxDelay=0.2)
+        futures = [dispatcher.time() for _ in range(3)]
+        
+        for future in futures:
+            with self.assertRaises(HTTPError) as context:
+                future.result()
+            
+            self.assertEqual(context.exception.code, 500)
+    
+    def test_batch_many_splits_beyond_the_server_limit(self):
+        server, api = self.createApi()
+        result = api.batchMany([api.build.scoresAdd("%d Points" % i, i) for i in range(120)])
+        
+        self.assertEqual(result["success"], "true")
+        self.assertEqual(len(result["responses"]), 120)
+        self.assertEqual(len(result["chunks"]), 3)
+        self.assertTrue(all([response["success"] == "true" for response in result["responses"]]))
+        self.assertEqual(server.requests, 3)
+        self.assertEqual(len(server.game.scores[1]), 120)
+    
+    def test_batch_many_keeps_the_order_of_the_responses(self):
+        server, api = self.createApi()
+        keys = ["key%03d" % i for i in range(75)]
+        self.setKeys(api, keys)
+        result = api.batchMany([api.build.dataStoreFetch(key, globalData=True) for key in keys])
+        
+        self.assertEqual([response["data"] for response in result["responses"]], ["value of " + key for key in keys])
+    
+    def test_batch_many_reports_a_rejected_chunk(self):
+        server, api = self.createApi(RejectingBatchHandler)
+        keys = ["key%03d" % i for i in range(60)] + ["rejected"]
+        self.setKeys(api, keys[:60])
+        result = api.batchMany([api.build.dataStoreFetch(key, globalData=True) for key in keys])
+        
+        self.assertEqual(result["success"], "false")
+        self.assertEqual(result["chunks"][0]["success"], "true")
+        self.assertEqual(result["chunks"][1]["message"], "Rejected batch.")
+        self.assertTrue(all([response is not None for response in result["responses"][:50]]))
+        self.assertEqual(result["responses"][50:], [None] * 11)
+    
+    def test_batch_many_marks_unprocessed_chunks(self):
+        server, api = self.createApi(standin.faultInjectingHandler(errorRate=1.0, errorStatus=429))
+        result = api.batchMany([api.build.time() for _ in range(60)])
+        
+        self.assertEqual(result["success"], "false")
+        self.assertEqual(result["responses"], [None] * 60)
+        self.assertEqual([chunk["processed"] for chunk in result["chunks"]], ["false", "false"])
+    
+    def test_iter_data_store_yields_every_item(self):
+        server, api = self.createApi()
+        keys = ["item%03d" % i for i in range(130)]
+        self.setKeys(api, keys)
+        
+        self.assertEqual(dict(api.iterDataStore("item*", globalData=True)), {key : "value of " + key for key in keys})
+    
+    def test_iter_data_store_raises_when_a_batch_is_rejected(self):
+        server, api = self.createApi(RejectingBatchHandler)
+        keys = ["item%03d" % i for i in range(60)] + ["rejected"]
+        self.setKeys(api, keys[:60])
+        api.dataStoreSet("rejected", "value", globalData=True)
+        items = []
+        
+        with self.assertRaises(gamejoltapi.GameJoltBatchError):
+            for item in api.iterDataStore(globalData=True):
+                items.append(item)
+        
+        self.assertEqual(len(items), 50)
+    
+    def test_async_iter_data_store_raises_when_a_batch_is_rejected(self):
+        server, api = self.createApi(RejectingBatchHandler)
+        self.setKeys(api, ["item%03d" % i for i in range(10)])
+        api.dataStoreSet("rejected", "value", globalData=True)
+        
+        async def run():
+            asyncApi = gamejoltapi.AsyncGameJoltAPI("1", "key", apiUrl=self.apiUrl, connectionPool=gamejoltapi.GameJoltAsyncConnectionPool())
+            
+            try:
+                with self.assertRaises(gamejoltapi.GameJoltBatchError):
+                    async for item in asyncApi.iterDataStore(globalData=True):
+                        pass
+            finally:
+                await asyncApi.close()
+        
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+""" Data store helpers: the write-behind buffer and the blob store against the stand-in server of the benchmarks.
+
+Run from the repository root:
+
+    python -m unittest discover tests
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+import gamejoltapi
+import standin
+
+
+class DataStoreTest(unittest.TestCase):
+    def createApi(self):
+        server, apiUrl = standin.startServer(standin.GameHandler, https=False)
+        pool = gamejoltapi.GameJoltConnectionPool()
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        self.addCleanup(pool.close)
+        return server, gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool)
+    
+    def createBuffer(self, api):
+        buffer = gamejoltapi.GameJoltDataStoreBuffer(api, flushInterval=60.0, flushOnExit=False)
+        self.addCleanup(buffer.close)
+        return buffer
+    
+    def test_buffer_matches_direct_updates(self):
+        server, api = self.createApi()
+        buffer = self.createBuffer(api)
+        generator = random.Random(7)
+        numberKeys = ["number%d" % i for i in range(4)]
+        textKeys = ["text%d" % i for i in range(4)]
+        
+        for key in numberKeys + textKeys:
+            value = str(generator.randint(-10, 10)) if key in numberKeys else "start"
+            api.dataStoreSet("direct." + key, value, globalData=True)
+            buffer.dataStoreSet("buffered." + key, value, globalData=True)
+        
+        for _ in range(200):
+            if generator.random() < 0.5:
+                key = generator.choice(numberKeys)
+                operation = generator.choice(["set", "add", "subtract", "multiply"])
+                value = generator.randint(-10, 10) if operation == "set" else generator.randint(1, 3)
+            else:
+                key = generator.choice(textKeys)
+                operation = generator.choice(["set", "append", "prepend"])
+                value = "".join([generator.choice("abc") for _ in range(generator.randint(1, 3))])
+            
+            if operation == "set":
+                api.dataStoreSet("direct." + key, str(value), globalData=True)
+                buffer.dataStoreSet("buffered." + key, str(value), globalData=True)
+            else:
+                api.dataStoreUpdate("direct." + key, operation, str(value), globalData=True)
+                buffer.dataStoreUpdate("buffered." + key, operation, value, globalData=True)
+        
+        buffer.flush()
+        
+        self.assertGreater(buffer.foldedWrites, 0)
+        self.assertEqual(buffer.pendingWrites(), 0)
+        self.assertEqual(buffer.failedWrites, 0)
+        
+        for key in numberKeys + textKeys:
+            self.assertEqual(server.game.globalData["buffered." + key], server.game.globalData["direct." + key], key)
+    
+    def test_buffer_sends_the_binary_set_before_an_append(self):
+        server, api = self.createApi()
+        buffer = self.createBuffer(api)
+        buffer.dataStoreSet("key", b"bytes", globalData=True)
+        buffer.dataStoreUpdate("key", "append", "text", globalData=True)
+        
+        self.assertEqual(buffer.pendingWrites(), 2)
+        buffer.flush()
+        self.assertEqual(server.game.globalData["key"], "bytestext")
+    
+    def test_buffer_rejects_an_invalid_number(self):
+        server, api = self.createApi()
+        buffer = self.createBuffer(api)
+        
+        with self.assertRaises(ValueError):
+            buffer.dataStoreUpdate("key", "add", "many", globalData=True)
+        
+        self.assertEqual(buffer.pendingWrites(), 0)
+        self.assertEqual(buffer._pending, {})
+    
+    def test_blob_round_trips(self):
+        server, api = self.createApi()
+        values = ["text", "long text " * 500, b"\x00bytes\xff", os.urandom(5000)]
+        
+        for codec in ("zlib", "none"):
+            blobs = gamejoltapi.GameJoltBlobStore(api, codec=codec, chunkSize=1000)
+            
+            for index, value in enumerate(values):
+                key = "%s%d" % (codec, index)
+                self.assertEqual(blobs.dataStoreSet(key, value, globalData=True)["success"], "true")
+                
+                # Fetched by another store, which knows nothing of the key
+                response = gamejoltapi.GameJoltBlobStore(api).dataStoreFetch(key, globalData=True)
+                self.assertEqual(response["success"], "true")
+                self.assertEqual(response["data"], value)
+        
+        # Random bytes do not compress, so they are split across chunk keys
+        self.assertTrue([key for key in server.game.globalData if key.startswith("zlib3.")])
+    
+    def test_blob_overwrite_and_remove_delete_the_chunks(self):
+        server, api = self.createApi()
+        blobs = gamejoltapi.GameJoltBlobStore(api, chunkSize=1000)
+        blobs.dataStoreSet("save", os.urandom(5000), globalData=True)
+        firstChunks = {key for key in server.game.globalData if key.startswith("save.")}
+        
+        self.assertEqual(len(firstChunks), 7)
+        
+        blobs.dataStoreSet("save", os.urandom(3000), globalData=True)
+        secondChunks = {key for key in server.game.globalData if key.startswith("save.")}
+        
+        self.assertEqual(len(secondChunks), 5)
+        self.assertFalse(firstChunks & secondChunks)
+        
+        self.assertEqual(blobs.dataStoreRemove("save", globalData=True)["success"], "true")
+        self.assertEqual(server.game.globalData, {})
+    
+    def test_blob_fetches_the_previous_version_on_the_first_write_only(self):
+        server, api = self.createApi()
+        blobs = gamejoltapi.GameJoltBlobStore(api)
+        blobs.dataStoreSet("key", "first", globalData=True)
+        
+        self.assertEqual(server.requests, 2)
+        
+        for value in ("second", "third"):
+            blobs.dataStoreSet("key", value, globalData=True)
+        
+        self.assertEqual(server.requests, 4)
+        self.assertEqual(blobs.dataStoreFetch("key", globalData=True)["data"], "third")
+
+
+if __name__ == "__main__":
+    unittest.main()
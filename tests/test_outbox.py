@@ -0,0 +1,159 @@
+""" The durable outbox of writes, replayed against the stand-in server of the benchmarks after going offline.
+
+Run from the repository root:
+
+    python -m unittest discover tests
+"""
+
+import os
+import socket
+import stat
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+import gamejoltapi
+import standin
+
+
+def closedPortUrl():
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+    
+    return "http://127.0.0.1:%d%s" % (port, standin.API_PATH)
+
+
+class OutboxTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "outbox.log")
+    
+    def createApi(self, apiUrl):
+        pool = gamejoltapi.GameJoltConnectionPool(connectTimeout=1.0)
+        self.addCleanup(pool.close)
+        return gamejoltapi.GameJoltAPI("1", "key", "player", "player-token", apiUrl=apiUrl, connectionPool=pool)
+    
+    def offlineApi(self):
+        return self.createApi(closedPortUrl())
+    
+    def onlineApi(self):
+        server, apiUrl = standin.startServer(standin.GameHandler, https=False)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        return server, self.createApi(apiUrl)
+    
+    def openOutbox(self, api, **kwargs):
+        outbox = gamejoltapi.GameJoltOutbox(api, self.path, flushInterval=60.0, flushOnExit=False, **kwargs)
+        self.addCleanup(outbox.close)
+        return outbox
+    
+    def test_journal_holds_no_credentials(self):
+        api = self.offlineApi()
+        outbox = self.openOutbox(api)
+        outbox.scoresAdd("10 Points", 10)
+        outbox.submit(api.forUser("other", "other-token").build.trophiesAddAchieved(1))
+        outbox.close()
+        
+        with open(self.path, encoding="utf-8") as journal:
+            content = journal.read()
+        
+        self.assertEqual(outbox.pendingWrites(), 2)
+        self.assertIn("username=other", content)
+        self.assertNotIn("player-token", content)
+        self.assertNotIn("other-token", content)
+        self.assertNotIn("signature=", content)
+        
+        if os.name == "posix":
+            self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+    
+    def test_writes_replayed_after_reopening(self):
+        api = self.offlineApi()
+        outbox = self.openOutbox(api)
+        
+        for sort in range(3):
+            outbox.scoresAdd("%d Points" % sort, sort)
+        
+        outbox.trophiesAddAchieved(4)
+        outbox.submit(api.forUser("other", "other-token").build.scoresAdd("7 Points", 7))
+        outbox.close()
+        
+        self.assertEqual(outbox.pendingWrites(), 5)
+        
+        server, api = self.onlineApi()
+        outbox = self.openOutbox(api, userTokens={"other" : "other-token"}.get)
+        
+        self.assertEqual(outbox.pendingWrites(), 5)
+        self.assertTrue(outbox.flush())
+        outbox.close()
+        
+        self.assertEqual(outbox.pendingWrites(), 0)
+        self.assertEqual((outbox.sentWrites, outbox.failedWrites, outbox.uncertainWrites), (5, 0, 0))
+        self.assertEqual([(score["user"], score["sort"]) for score in server.game.scores[1]], [("other", 7), ("player", 2), ("player", 1), ("player", 0)])
+        self.assertEqual(list(server.game.achieved["player"]), [4])
+        self.assertEqual(os.path.getsize(self.path), 0)
+    
+    def test_writes_of_unknown_users_stay_journaled(self):
+        api = self.offlineApi()
+        outbox = self.openOutbox(api)
+        outbox.submit(api.forUser("other", "other-token").build.scoresAdd("7 Points", 7))
+        outbox.close()
+        
+        server, api = self.onlineApi()
+        outbox = self.openOutbox(api)
+        outbox.close()
+        
+        self.assertEqual(outbox.pendingWrites(), 1)
+        self.assertEqual(server.game.scores[1], [])
+        
+        outbox = self.openOutbox(api, userTokens={"other" : "other-token"}.get)
+        outbox.close()
+        
+        self.assertEqual(outbox.pendingWrites(), 0)
+        self.assertEqual(len(server.game.scores[1]), 1)
+    
+    def test_write_being_sent_is_not_sent_again(self):
+        api = self.offlineApi()
+        outbox = self.openOutbox(api)
+        writeId = outbox.scoresAdd("10 Points", 10)
+        outbox.close()
+        
+        # Stopped after the write was marked as being sent, and maybe processed
+        with open(self.path, "a", encoding="utf-8") as journal:
+            journal.write(">\t" + writeId + "\n")
+        
+        server, api = self.onlineApi()
+        outbox = self.openOutbox(api)
+        
+        self.assertEqual(outbox.uncertainWrites, 1)
+        self.assertEqual(outbox.pendingWrites(), 0)
+        outbox.close()
+        
+        self.assertEqual(server.requests, 0)
+        self.assertEqual(server.game.scores[1], [])
+    
+    def test_trophy_writes_deduplicated(self):
+        api = self.offlineApi()
+        outbox = self.openOutbox(api)
+        writeIds = [outbox.trophiesAddAchieved(2) for _ in range(3)]
+        outbox.close()
+        
+        self.assertEqual(len(set(writeIds)), 1)
+        self.assertEqual(outbox.deduplicatedWrites, 2)
+        
+        server, api = self.onlineApi()
+        outbox = self.openOutbox(api)
+        outbox.trophiesAddAchieved(2)
+        outbox.close()
+        
+        self.assertEqual(outbox.deduplicatedWrites, 1)
+        self.assertEqual((outbox.sentWrites, outbox.failedWrites), (1, 0))
+        self.assertEqual(list(server.game.achieved["player"]), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
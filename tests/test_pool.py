@@ -0,0 +1,193 @@
+""" Persistent connections of the sync and async connection pools against the stand-in server of the benchmarks.
+
+Run from the repository root:
+
+    python -m unittest discover tests
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+import gamejoltapi
+import standin
+
+
+class ConnectionCountingHandler(standin.GameHandler):
+    """Counts the connections accepted by the server."""
+    
+    def setup(self):
+        super().setup()
+        
+        with self.server.lock:
+            self.server.connections = getattr(self.server, "connections", 0) + 1
+
+
+def closedPortUrl():
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+    
+    return "http://127.0.0.1:%d%s" % (port, standin.API_PATH)
+
+
+class PoolTest(unittest.TestCase):
+    def startServer(self, handler=ConnectionCountingHandler):
+        server, apiUrl = standin.startServer(handler, https=False)
+        server.connections = 0
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        return server, apiUrl
+    
+    def createApi(self, pool):
+        server, apiUrl = self.startServer()
+        self.addCleanup(pool.close)
+        return server, gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool)
+    
+    def test_sequential_requests_reuse_one_connection(self):
+        server, api = self.createApi(gamejoltapi.GameJoltConnectionPool())
+        
+        for _ in range(20):
+            self.assertEqual(api.time()["success"], "true")
+        
+        self.assertEqual(server.requests, 20)
+        self.assertEqual(server.connections, 1)
+    
+    def test_concurrent_requests_keep_at_most_max_size_idle(self):
+        pool = gamejoltapi.GameJoltConnectionPool(maxSize=2)
+        server, api = self.createApi(pool)
+        barrier = threading.Barrier(6)
+        
+        def call():
+            barrier.wait()
+            api.time()
+        
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        
+        for thread in threads:
+            thread.start()
+        
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(server.requests, 6)
+        self.assertLessEqual(sum([len(idle) for idle in pool._idle.values()]), 2)
+    
+    def test_idle_connections_evicted(self):
+        pool = gamejoltapi.GameJoltConnectionPool(idleTimeout=0.0)
+        server, api = self.createApi(pool)
+        api.time()
+        
+        self.assertEqual(pool.evictIdle(), 1)
+        api.time()
+        self.assertEqual(server.connections, 2)
+    
+    def test_post_requests_share_the_connection(self):
+        server, api = self.createApi(gamejoltapi.GameJoltConnectionPool())
+        api.postThreshold = 0
+        
+        self.assertEqual(api.dataStoreSet("key", "x" * 100, globalData=True)["success"], "true")
+        self.assertEqual(api.dataStoreFetch("key", globalData=True)["data"], "x" * 100)
+        self.assertEqual(server.connections, 1)
+    
+    def test_unreachable_server_raises_connect_error(self):
+        pool = gamejoltapi.GameJoltConnectionPool(connectTimeout=1.0)
+        self.addCleanup(pool.close)
+        api = gamejoltapi.GameJoltAPI("1", "key", apiUrl=closedPortUrl(), connectionPool=pool)
+        
+        with self.assertRaises(gamejoltapi.GameJoltConnectError):
+            api.time()
+
+
+class AsyncPoolTest(PoolTest):
+    def runAsync(self, function):
+        return asyncio.run(function())
+    
+    def test_sequential_requests_reuse_one_connection(self):
+        server, apiUrl = self.startServer()
+        
+        async def run():
+            api = gamejoltapi.AsyncGameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=gamejoltapi.GameJoltAsyncConnectionPool())
+            
+            for _ in range(20):
+                self.assertEqual((await api.time())["success"], "true")
+            
+            await api.close()
+        
+        self.runAsync(run)
+        self.assertEqual(server.requests, 20)
+        self.assertEqual(server.connections, 1)
+    
+    def test_concurrent_requests_keep_at_most_max_size_idle(self):
+        server, apiUrl = self.startServer()
+        pool = gamejoltapi.GameJoltAsyncConnectionPool(maxSize=2, maxConcurrency=4)
+        
+        async def run():
+            api = gamejoltapi.AsyncGameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool)
+            responses = await asyncio.gather(*[api.time() for _ in range(20)])
+            self.assertTrue(all([response["success"] == "true" for response in responses]))
+            self.assertLessEqual(sum([len(idle) for idle in pool._idle.values()]), 2)
+            await api.close()
+        
+        self.runAsync(run)
+        self.assertEqual(server.requests, 20)
+    
+    def test_max_concurrency_bounds_the_connections(self):
+        server, apiUrl = self.startServer()
+        pool = gamejoltapi.GameJoltAsyncConnectionPool(maxSize=4, maxConcurrency=4)
+        
+        async def run():
+            api = gamejoltapi.AsyncGameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool)
+            await asyncio.gather(*[api.time() for _ in range(40)])
+            await api.close()
+        
+        self.runAsync(run)
+        self.assertEqual(server.requests, 40)
+        self.assertLessEqual(server.connections, 4)
+    
+    def test_idle_connections_evicted(self):
+        server, apiUrl = self.startServer()
+        
+        async def run():
+            api = gamejoltapi.AsyncGameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=gamejoltapi.GameJoltAsyncConnectionPool(idleTimeout=0.0))
+            await api.time()
+            await asyncio.sleep(0.01)
+            await api.time()
+            await api.close()
+        
+        self.runAsync(run)
+        self.assertEqual(server.connections, 2)
+    
+    def test_post_requests_share_the_connection(self):
+        server, apiUrl = self.startServer()
+        
+        async def run():
+            api = gamejoltapi.AsyncGameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=gamejoltapi.GameJoltAsyncConnectionPool())
+            api.postThreshold = 0
+            self.assertEqual((await api.dataStoreSet("key", "x" * 100, globalData=True))["success"], "true")
+            self.assertEqual((await api.dataStoreFetch("key", globalData=True))["data"], "x" * 100)
+            await api.close()
+        
+        self.runAsync(run)
+        self.assertEqual(server.connections, 1)
+    
+    def test_unreachable_server_raises_connect_error(self):
+        async def run():
+            api = gamejoltapi.AsyncGameJoltAPI("1", "key", apiUrl=closedPortUrl(), connectionPool=gamejoltapi.GameJoltAsyncConnectionPool(connectTimeout=1.0))
+            
+            with self.assertRaises(gamejoltapi.GameJoltConnectError):
+                await api.time()
+            
+            await api.close()
+        
+        self.runAsync(run)
+
+
+if __name__ == "__main__":
+    unittest.main()
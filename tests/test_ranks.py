@@ -0,0 +1,95 @@
+""" The local rank index of a score table against the stand-in server of the benchmarks.
+
+Run from the repository root:
+
+    python -m unittest discover tests
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+import gamejoltapi
+import standin
+
+
+class RankIndexTest(unittest.TestCase):
+    def createApi(self):
+        server, apiUrl = standin.startServer(standin.GameHandler, https=False)
+        pool = gamejoltapi.GameJoltConnectionPool()
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        self.addCleanup(pool.close)
+        return server, gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool)
+    
+    def addScores(self, server, sorts):
+        # Straight into the table, as submitting them one by one is slow
+        scores = server.game.scores[1]
+        scores.extend([{
+            "score" : "%d Points" % sort,
+            "sort" : sort,
+            "extra_data" : "",
+            "user" : "",
+            "user_id" : "",
+            "guest" : "guest",
+            "stored" : "Just now",
+            "stored_timestamp" : 0,
+        } for sort in sorts])
+        scores.sort(key=lambda score: -score["sort"])
+    
+    def assertRanksMatch(self, api, index, sorts):
+        for sort in sorts:
+            self.assertEqual(index.scoresGetRank(sort)["rank"], api.scoresGetRank(sort)["rank"], sort)
+    
+    def test_ranks_match_the_server_across_pages(self):
+        server, api = self.createApi()
+        generator = random.Random(3)
+        
+        # Around 3 scores per sort value, so ties span the page boundaries
+        self.addScores(server, [generator.randint(0, 80) for _ in range(250)])
+        index = gamejoltapi.GameJoltRankIndex(api)
+        
+        self.assertEqual(index.seed(), 250)
+        self.assertEqual(index.upstreamRequests, 3)
+        self.assertRanksMatch(api, index, range(-1, 83))
+        self.assertEqual(index.localHits, 84)
+        self.assertEqual(index.remoteHits, 0)
+    
+    def test_scores_added_through_the_index(self):
+        server, api = self.createApi()
+        self.addScores(server, [10, 20, 20, 30])
+        index = gamejoltapi.GameJoltRankIndex(api)
+        index.seed()
+        
+        for sort in (25, 20, 5, 40):
+            self.assertEqual(index.scoresAdd("%d Points" % sort, sort, guest="guest")["success"], "true")
+        
+        self.assertEqual(len(server.game.scores[1]), 8)
+        self.assertRanksMatch(api, index, range(0, 45, 5))
+        self.assertEqual(index.upstreamRequests, 1)
+    
+    def test_cold_and_partial_indexes_ask_the_server(self):
+        server, api = self.createApi()
+        self.addScores(server, range(300))
+        index = gamejoltapi.GameJoltRankIndex(api, maxPages=2)
+        
+        # Not seeded yet
+        self.assertEqual(index.scoresGetRank(150)["rank"], 150)
+        
+        # The second page starts again at the last score of the first one
+        self.assertEqual(index.seed(), 199)
+        
+        # Worse than all the indexed scores of a partial index
+        self.assertEqual(index.scoresGetRank(50)["rank"], 250)
+        self.assertEqual(index.scoresGetRank(250)["rank"], 50)
+        
+        self.assertEqual((index.localHits, index.remoteHits), (1, 2))
+        self.assertEqual(index.upstreamRequests, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+""" Order in which the rate limiter serves the waiting requests of threads and coroutines.
+
+Run from the repository root:
+
+    python -m unittest discover tests
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import gamejoltapi
+
+
+class RateLimiterTest(unittest.TestCase):
+    def createLimiter(self):
+        # One token every 0.2 seconds, the first one taken right away
+        limiter = gamejoltapi.GameJoltRateLimiter(rate=5.0, burst=1)
+        self.assertTrue(limiter.tryAcquire())
+        return limiter
+    
+    def queueThreads(self, limiter, waiters, served):
+        # Started one at a time, so they are queued in the order of waiters
+        threads = []
+        
+        for name, operation, owner in waiters:
+            thread = threading.Thread(target=lambda name=name, operation=operation, owner=owner: served.append((limiter.acquire(operation, owner), name)))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.02)
+        
+        return threads
+    
+    def test_served_by_priority(self):
+        limiter = self.createLimiter()
+        served = []
+        threads = self.queueThreads(limiter, [
+            ("analytics", "data-store/set", object()),
+            ("scores", "scores/add", object()),
+            ("ping", "sessions/ping", object()),
+        ], served)
+        
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual([name for waited, name in served], ["ping", "scores", "analytics"])
+        self.assertEqual(limiter.waits, 3)
+    
+    def test_served_round_robin_across_owners(self):
+        limiter = self.createLimiter()
+        busy, other = object(), object()
+        served = []
+        threads = self.queueThreads(limiter, [
+            ("busy 1", None, busy),
+            ("busy 2", None, busy),
+            ("busy 3", None, busy),
+            ("other", None, other),
+        ], served)
+        
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual([name for waited, name in served], ["busy 1", "other", "busy 2", "busy 3"])
+    
+    def test_threads_and_coroutines_share_the_queue(self):
+        limiter = self.createLimiter()
+        served = []
+        
+        async def run():
+            threads = self.queueThreads(limiter, [
+                ("thread analytics", "data-store/update", object()),
+                ("thread scores", "scores/add", object()),
+            ], served)
+            
+            async def acquire(name, operation):
+                served.append((await limiter.acquireAsync(operation, object()), name))
+            
+            await asyncio.gather(acquire("coroutine ping", "sessions/ping"), acquire("coroutine trophy", "trophies/add-achieved"))
+            await asyncio.get_running_loop().run_in_executor(None, lambda: [thread.join() for thread in threads])
+        
+        asyncio.run(run())
+        
+        self.assertEqual([name for waited, name in served], ["coroutine ping", "thread scores", "coroutine trophy", "thread analytics"])
+    
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            gamejoltapi.GameJoltRateLimiter(rate=0)
+        
+        with self.assertRaises(ValueError):
+            gamejoltapi.GameJoltRateLimiter(rate=-1.0)
+        
+        with self.assertRaises(ValueError):
+            gamejoltapi.GameJoltRateLimiter(burst=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
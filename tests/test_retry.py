@@ -0,0 +1,146 @@
+""" Retries and circuit breaking against the fault-injecting stand-in server of the benchmarks.
+
+Run from the repository root:
+
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import time
+import unittest
+
+from urllib.error import HTTPError
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+import gamejoltapi
+import standin
+
+
+class SlowScoresHandler(standin.GameHandler):
+    """Stores the score, then answers after the read timeout of the client."""
+    
+    def do_GET(self):
+        if "/scores/add/" in self.path:
+            time.sleep(0.6)
+        super().do_GET()
+
+
+class RetryTest(unittest.TestCase):
+    def startServer(self, handler):
+        server, apiUrl = standin.startServer(handler, https=False)
+        pool = gamejoltapi.GameJoltConnectionPool(readTimeout=0.3)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        self.addCleanup(pool.close)
+        return server, apiUrl, pool
+    
+    def createApi(self, handler, **kwargs):
+        server, apiUrl, pool = self.startServer(handler)
+        return server, gamejoltapi.GameJoltAPI("1", "key", apiUrl=apiUrl, connectionPool=pool, **kwargs)
+    
+    def test_server_errors_retried_up_to_max_retries(self):
+        server, api = self.createApi(
+            standin.faultInjectingHandler(errorRate=1.0, errorStatus=503),
+            retryPolicy=gamejoltapi.GameJoltRetryPolicy(maxRetries=2, backoff=0.001),
+        )
+        
+        with self.assertRaises(HTTPError) as context:
+            api.time()
+        
+        self.assertEqual(context.exception.code, 503)
+        self.assertEqual(server.requests, 3)
+    
+    def test_too_many_requests_retried_for_writes(self):
+        server, api = self.createApi(
+            standin.faultInjectingHandler(errorRate=1.0, errorStatus=429),
+            retryPolicy=gamejoltapi.GameJoltRetryPolicy(maxRetries=3, backoff=0.001),
+        )
+        
+        with self.assertRaises(HTTPError) as context:
+            api.scoresAdd("1", 1, guest="guest")
+        
+        self.assertEqual(context.exception.code, 429)
+        self.assertEqual(server.requests, 4)
+    
+    def test_retry_eventually_succeeds(self):
+        server, api = self.createApi(
+            standin.faultInjectingHandler(failFirst=2, errorStatus=502),
+            retryPolicy=gamejoltapi.GameJoltRetryPolicy(maxRetries=3, backoff=0.001),
+        )
+        
+        self.assertEqual(api.time()["success"], "true")
+        self.assertEqual(server.requests, 3)
+    
+    def test_score_not_retried_after_read_error(self):
+        server, api = self.createApi(SlowScoresHandler, retryPolicy=gamejoltapi.GameJoltRetryPolicy(maxRetries=3, backoff=0.001))
+        
+        # Reused connection, which must not be resent either
+        api.time()
+        
+        with self.assertRaises(OSError) as context:
+            api.scoresAdd("1", 1, guest="guest")
+        
+        self.assertNotIsInstance(context.exception, gamejoltapi.GameJoltConnectError)
+        time.sleep(0.5)
+        self.assertEqual(server.requests, 2)
+        self.assertEqual(len(server.game.scores[1]), 1)
+    
+    def test_score_not_resent_without_retry_policy(self):
+        server, api = self.createApi(SlowScoresHandler)
+        api.time()
+        start = time.perf_counter()
+        
+        with self.assertRaises(OSError):
+            api.scoresAdd("1", 1, guest="guest")
+        
+        self.assertLess(time.perf_counter() - start, 0.55)
+        time.sleep(0.5)
+        self.assertEqual(len(server.game.scores[1]), 1)
+    
+    def test_retry_after_honoured(self):
+        server, api = self.createApi(
+            standin.faultInjectingHandler(failFirst=1, errorStatus=429, retryAfter=1),
+            retryPolicy=gamejoltapi.GameJoltRetryPolicy(maxRetries=1, backoff=0.001),
+        )
+        start = time.perf_counter()
+        
+        self.assertEqual(api.time()["success"], "true")
+        self.assertGreaterEqual(time.perf_counter() - start, 1.0)
+        self.assertEqual(server.requests, 2)
+    
+    def test_circuit_breaker_opens_half_opens_and_closes(self):
+        handler = standin.faultInjectingHandler(errorRate=1.0, errorStatus=503)
+        circuitBreaker = gamejoltapi.GameJoltCircuitBreaker(failureThreshold=2, resetTimeout=0.3)
+        server, api = self.createApi(handler, circuitBreaker=circuitBreaker)
+        
+        for _ in range(2):
+            with self.assertRaises(HTTPError):
+                api.time()
+        
+        self.assertEqual(circuitBreaker.state, "open")
+        
+        with self.assertRaises(gamejoltapi.GameJoltCircuitOpen):
+            api.time()
+        
+        self.assertEqual(server.requests, 2)
+        time.sleep(0.3)
+        self.assertEqual(circuitBreaker.state, "half-open")
+        
+        # A failed trial request opens the breaker again
+        with self.assertRaises(HTTPError):
+            api.time()
+        
+        self.assertEqual(circuitBreaker.state, "open")
+        time.sleep(0.3)
+        handler.errorRate = 0.0
+        
+        self.assertEqual(api.time()["success"], "true")
+        self.assertEqual(circuitBreaker.state, "closed")
+        self.assertEqual(server.requests, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
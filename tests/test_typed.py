@@ -0,0 +1,114 @@
+""" Typed results compared to the dict responses of the stand-in server of the benchmarks.
+
+Run from the repository root:
+
+    python -m unittest discover tests
+"""
+
+import array
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+import gamejoltapi
+import standin
+
+
+class TypedTest(unittest.TestCase):
+    def createApi(self, **kwargs):
+        server, apiUrl = standin.startServer(standin.GameHandler, https=False)
+        pool = gamejoltapi.GameJoltConnectionPool()
+        self.addCleanup(server.shutdown)
+        self.addCleanup(server.server_close)
+        self.addCleanup(pool.close)
+        return server, gamejoltapi.GameJoltAPI("1", "key", "player", "token", apiUrl=apiUrl, connectionPool=pool, **kwargs)
+    
+    def test_scores(self):
+        server, api = self.createApi()
+        
+        for sort in (30, 10, 20):
+            api.scoresAdd("%d Points" % sort, sort, extraData="extra %d" % sort)
+        
+        api.scoresAdd("5 Points", 5, guest="guest")
+        response = api.scoresFetch(limit=100)
+        scores = api.scoresFetch(limit=100, typed=True)
+        
+        self.assertIsInstance(scores, gamejoltapi.GameJoltScores)
+        self.assertTrue(scores.success)
+        self.assertEqual(len(scores), 4)
+        self.assertIsInstance(scores.column("sort"), array.array)
+        self.assertEqual(list(scores.column("sort")), [30, 20, 10, 5])
+        
+        for score, item in zip(scores, response["scores"]):
+            self.assertEqual(score.score, item["score"])
+            self.assertEqual(score.sort, int(item["sort"]))
+            self.assertEqual(score.extraData, item["extra_data"])
+            self.assertEqual(score.user, item["user"])
+            self.assertEqual(score.userId, int(item["user_id"]) if item["user_id"] else None)
+            self.assertEqual(score.guest, item["guest"])
+            self.assertEqual(score.storedTimestamp, item["stored_timestamp"])
+        
+        self.assertEqual(scores[-1].asDict()["guest"], "guest")
+        self.assertEqual(scores[0], api.scoresFetch(limit=1, typed=True)[0])
+    
+    def test_users(self):
+        server, api = self.createApi()
+        response = api.usersFetch("player")
+        users = api.usersFetch("player", typed=True)
+        
+        self.assertEqual(len(users), 1)
+        self.assertEqual(users[0].id, int(response["users"][0]["id"]))
+        self.assertEqual(users[0].username, "player")
+        self.assertEqual(users[0].signedUpTimestamp, response["users"][0]["signed_up_timestamp"])
+        self.assertEqual(users[0].developerName, response["users"][0]["developer_name"])
+    
+    def test_trophies(self):
+        server, api = self.createApi()
+        api.trophiesAddAchieved(2)
+        response = api.trophiesFetch()
+        trophies = api.trophiesFetch(typed=True)
+        
+        self.assertEqual(list(trophies.column("id")), [int(item["id"]) for item in response["trophies"]])
+        self.assertEqual(trophies.column("title"), tuple([item["title"] for item in response["trophies"]]))
+        self.assertEqual([trophy.id for trophy in trophies if trophy.achieved], [2])
+    
+    def test_tables(self):
+        server, api = self.createApi()
+        tables = api.scoresTables(typed=True)
+        
+        self.assertEqual([(table.id, table.name, table.primary) for table in tables], [(1, "Table 1", True), (2, "Table 2", False)])
+    
+    def test_failed_request(self):
+        server, api = self.createApi()
+        scores = api.scoresFetch(tableId=99, typed=True)
+        
+        self.assertFalse(scores.success)
+        self.assertEqual(scores.message, "The high score table ID you entered is not valid.")
+        self.assertEqual(len(scores), 0)
+        
+        with self.assertRaises(IndexError):
+            scores[0]
+    
+    def test_numbers_beyond_64_bits_kept_in_a_tuple(self):
+        server, api = self.createApi()
+        api.scoresAdd("Huge", 2 ** 70)
+        api.scoresAdd("Small", 1)
+        scores = api.scoresFetch(typed=True)
+        
+        self.assertEqual(scores.column("sort"), (2 ** 70, 1))
+        self.assertEqual(scores[0].sort, 2 ** 70)
+    
+    def test_other_formats_rejected(self):
+        server, api = self.createApi(responseFormat="xml")
+        
+        with self.assertRaises(ValueError):
+            api.scoresFetch(typed=True)
+        
+        self.assertEqual(server.requests, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()